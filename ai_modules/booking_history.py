@@ -0,0 +1,296 @@
+"""
+Booking History Ingestion for Smart Pricing
+This module streams booking logs (CSV or JSONL) in fixed-size chunks,
+aggregates booking counts per car category x day of week x month in a
+small NumPy array, and fits multiplicative demand curves to the counts with
+least squares. Memory use depends on the number of categories and the chunk
+size, not on the length of the log.
+
+Usage:
+    python -m ai_modules.booking_history bookings.csv -o demand_model.json
+"""
+
+import argparse
+import csv
+import json
+import logging
+
+import numpy as np
+
+from ai_modules.demand import FittedDemandModel
+
+logger = logging.getLogger(__name__)
+
+# 1970-01-01 (day 0 of datetime64[D]) was a Thursday
+EPOCH_WEEKDAY = 3
+
+
+def _json_rows(lines, stats):
+    """Parse JSONL lines, counting malformed ones in stats['skipped'] instead of raising."""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            row = None
+        if isinstance(row, dict):
+            yield row
+        else:
+            stats["skipped"] += 1
+
+
+def read_booking_chunks(path, chunk_size=100_000, date_field="start_date", category_field="category",
+                        stats=None):
+    """
+    Stream (date, category) pairs from a booking log in chunks.
+
+    Files ending in .jsonl or .json are read as one JSON object per line;
+    anything else as CSV with a header row. Malformed lines and rows missing
+    either field are skipped and counted. Only the first 10 characters of the
+    date are used, so both YYYY-MM-DD dates and ISO timestamps work; dates
+    are validated by BookingAggregator.add_chunk.
+
+    Args:
+        path (str): Booking log path
+        chunk_size (int): Rows per chunk
+        date_field (str): Column holding the rental start date
+        category_field (str): Column holding the car category
+        stats (dict, optional): Receives 'skipped', the number of lines skipped
+
+    Yields:
+        tuple: (dates, categories) lists of at most chunk_size entries
+    """
+    if stats is None:
+        stats = {}
+    stats["skipped"] = 0
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.endswith((".jsonl", ".json")):
+            pairs = ((row.get(date_field), row.get(category_field)) for row in _json_rows(f, stats))
+        else:
+            # Plain csv.reader with column positions is much faster than DictReader
+            reader = csv.reader(f)
+            header = next(reader, [])
+            missing = [field for field in (date_field, category_field) if field not in header]
+            if missing:
+                raise ValueError(f"{path} has no {', '.join(missing)} column")
+            date_column, category_column = header.index(date_field), header.index(category_field)
+            width = max(date_column, category_column)
+            pairs = ((row[date_column], row[category_column]) if len(row) > width else (None, None)
+                     for row in reader)
+
+        dates, categories = [], []
+        for date, category in pairs:
+            if not date or not category or not isinstance(category, str):
+                stats["skipped"] += 1
+                continue
+            dates.append(str(date)[:10])
+            categories.append(category)
+            if len(dates) >= chunk_size:
+                yield dates, categories
+                dates, categories = [], []
+        if dates:
+            yield dates, categories
+
+
+def parse_days(dates):
+    """
+    Parse YYYY-MM-DD strings, marking invalid ones instead of raising.
+
+    Args:
+        dates (list): Date strings
+
+    Returns:
+        numpy.ndarray: datetime64[D] days, NaT where a date is invalid
+    """
+    try:
+        days = np.array(dates, dtype="datetime64[D]")
+    except ValueError:
+        # At least one bad date: fall back to parsing row by row
+        days = np.empty(len(dates), dtype="datetime64[D]")
+        for i, date in enumerate(dates):
+            try:
+                days[i] = np.datetime64(date, "D")
+            except ValueError:
+                days[i] = np.datetime64("NaT")
+    # numpy also accepts partial dates such as "2024" or "2024-05"
+    full = np.fromiter((len(date) == 10 for date in dates), dtype=bool, count=len(dates))
+    days[~full] = np.datetime64("NaT")
+    return days
+
+
+class BookingAggregator:
+    """Running booking counts per category x day of week x month."""
+
+    def __init__(self):
+        self.categories = {}                          # category -> row in counts
+        self.counts = np.zeros((0, 7, 12), dtype=np.int64)
+        self.first_day = None                         # datetime64[D] bounds of the log
+        self.last_day = None
+        self.rows = 0
+        self.rejected = 0                             # Malformed or incomplete rows skipped
+
+    def add_chunk(self, dates, categories):
+        """
+        Add a chunk of bookings to the counts.
+
+        Rows with an invalid date are skipped and counted in rejected.
+
+        Args:
+            dates (list): Rental start dates as YYYY-MM-DD strings
+            categories (list): Car category of each booking
+        """
+        if not dates:
+            return
+        days = parse_days(dates)
+        valid = ~np.isnat(days)
+        if not valid.all():
+            self.rejected += int(len(dates) - valid.sum())
+            days = days[valid]
+            categories = [category for category, ok in zip(categories, valid) if ok]
+            if not len(days):
+                return
+        weekdays = (days.astype(np.int64) + EPOCH_WEEKDAY) % 7
+        months = days.astype("datetime64[M]").astype(np.int64) % 12
+
+        codes = np.fromiter((self.categories.setdefault(category, len(self.categories))
+                             for category in categories), dtype=np.int64, count=len(categories))
+        if len(self.categories) > len(self.counts):
+            grown = np.zeros((len(self.categories), 7, 12), dtype=np.int64)
+            grown[:len(self.counts)] = self.counts
+            self.counts = grown
+
+        cells = (codes * 7 + weekdays) * 12 + months
+        self.counts += np.bincount(cells, minlength=self.counts.size).reshape(self.counts.shape)
+
+        first, last = days.min(), days.max()
+        self.first_day = first if self.first_day is None else min(self.first_day, first)
+        self.last_day = last if self.last_day is None else max(self.last_day, last)
+        self.rows += len(days)
+
+    def ingest(self, path, chunk_size=100_000, **fields):
+        """
+        Stream a whole booking log into the counts.
+
+        Args:
+            path (str): Booking log path (CSV or JSONL)
+            chunk_size (int): Rows per chunk
+            **fields: date_field / category_field overrides for read_booking_chunks
+
+        Returns:
+            BookingAggregator: self, for chaining
+        """
+        stats = {}
+        for dates, categories in read_booking_chunks(path, chunk_size, stats=stats, **fields):
+            self.add_chunk(dates, categories)
+        self.rejected += stats["skipped"]
+        logger.info("Ingested %d bookings across %d categories from %s", self.rows, len(self.categories), path)
+        if self.rejected:
+            logger.warning("Skipped %d malformed or incomplete booking rows in %s", self.rejected, path)
+        return self
+
+    def exposure(self):
+        """
+        Count how many calendar days of each (day of week, month) the log spans.
+
+        Returns:
+            numpy.ndarray: (7 x 12) day counts
+        """
+        exposure = np.zeros((7, 12), dtype=np.int64)
+        if self.first_day is None:
+            return exposure
+        days = np.arange(self.first_day, self.last_day + np.timedelta64(1, "D"))
+        weekdays = (days.astype(np.int64) + EPOCH_WEEKDAY) % 7
+        months = days.astype("datetime64[M]").astype(np.int64) % 12
+        np.add.at(exposure, (weekdays, months), 1)
+        return exposure
+
+    def fit(self, smoothing=0.5):
+        """
+        Fit multiplicative demand curves to the aggregated counts.
+
+        Bookings per day are modelled as
+        base * category[c] * weekday[w] * month[m], fitted by least squares on
+        the log of the smoothed daily rate of every observed cell. Each set of
+        multipliers is then scaled to average 1.0, so a demand factor of 1.0
+        means typical demand.
+
+        Args:
+            smoothing (float): Pseudo-count added to every cell so empty cells
+                have a finite log
+
+        Returns:
+            FittedDemandModel: The fitted model
+        """
+        if not self.rows:
+            raise ValueError("No bookings ingested")
+        exposure = self.exposure()
+        n_categories = len(self.categories)
+
+        # One row per observed (category, weekday, month) cell, one column per
+        # parameter: intercept, categories, weekdays, months
+        c, w, m = np.nonzero(np.broadcast_to(exposure > 0, self.counts.shape))
+        rates = (self.counts[c, w, m] + smoothing) / exposure[w, m]
+        design = np.zeros((len(c), 1 + n_categories + 7 + 12))
+        rows = np.arange(len(c))
+        design[:, 0] = 1.0
+        design[rows, 1 + c] = 1.0
+        design[rows, 1 + n_categories + w] = 1.0
+        design[rows, 1 + n_categories + 7 + m] = 1.0
+        coefficients = np.linalg.lstsq(design, np.log(rates), rcond=None)[0]
+
+        category_effects = np.exp(coefficients[1:1 + n_categories])
+        weekday_effects = np.exp(coefficients[1 + n_categories:1 + n_categories + 7])
+        month_effects = np.exp(coefficients[1 + n_categories + 7:])
+
+        # Normalize each group to an exposure-weighted mean of 1.0
+        weekday_effects /= np.average(weekday_effects, weights=exposure.sum(axis=1))
+        month_effects /= np.average(month_effects, weights=exposure.sum(axis=0))
+        category_effects /= category_effects.mean()
+
+        return FittedDemandModel(
+            category_factors={category: float(category_effects[code])
+                              for category, code in self.categories.items()},
+            weekday_factors=[float(value) for value in weekday_effects],
+            month_factors=[float(value) for value in month_effects],
+            metadata={
+                "bookings": self.rows,
+                "first_day": str(self.first_day),
+                "last_day": str(self.last_day)
+            }
+        )
+
+
+def fit_booking_log(path, chunk_size=100_000, **fields):
+    """
+    Ingest a booking log and fit a demand model to it.
+
+    Args:
+        path (str): Booking log path (CSV or JSONL)
+        chunk_size (int): Rows per chunk
+        **fields: date_field / category_field overrides
+
+    Returns:
+        FittedDemandModel: The fitted model
+    """
+    return BookingAggregator().ingest(path, chunk_size, **fields).fit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit SmartPricing demand curves to a booking log")
+    parser.add_argument("log", help="Booking log (CSV with a header row, or JSONL)")
+    parser.add_argument("-o", "--output", default="demand_model.json", help="Fitted model file")
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--date-field", default="start_date")
+    parser.add_argument("--category-field", default="category")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    model = fit_booking_log(args.log, args.chunk_size,
+                            date_field=args.date_field, category_field=args.category_field)
+    model.save(args.output)
+    logger.info("Saved demand model to %s", args.output)
+
+
+if __name__ == "__main__":
+    main()
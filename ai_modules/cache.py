@@ -0,0 +1,115 @@
+"""
+Caching utilities shared by the AI modules.
+
+Provides a small thread-safe LRU cache with optional time-to-live (TTL)
+expiry and hit/miss counters, used to memoize results that are expensive
+to compute but requested repeatedly with the same inputs.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Bounded least-recently-used cache with optional TTL eviction."""
+
+    def __init__(self, maxsize=1024, ttl=None, clock=time.monotonic):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of entries kept
+            ttl (float, optional): Seconds an entry stays valid (None = no expiry)
+            clock (callable): Time source returning seconds, for testing
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        Look up a key, counting the hit or miss.
+
+        Args:
+            key: Hashable cache key
+            default: Value returned on a miss or expired entry
+
+        Returns:
+            The cached value, or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                # Expired
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Hashable cache key
+            value: Value to cache
+        """
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def discard_if(self, predicate):
+        """
+        Drop every entry whose key matches a predicate.
+
+        Args:
+            predicate (callable): Called with each key; True drops the entry
+
+        Returns:
+            int: Number of entries dropped
+        """
+        with self._lock:
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self):
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Get cache counters.
+
+        Returns:
+            dict: hits, misses, evictions, size and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
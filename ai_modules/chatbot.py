@@ -7,7 +7,7 @@ provide rental recommendations, and assist with booking processes.
 import re
 import random
 import datetime
-from difflib import get_close_match
+from difflib import get_close_matches
 
 class RentalChatbot:
     def __init__(self):
@@ -116,29 +116,48 @@ class RentalChatbot:
             "help|assist|support|guidance": "help"
         }
         
+        # Compile keyword patterns once instead of on every message
+        self.compiled_keywords = [(re.compile(pattern), topic)
+                                  for pattern, topic in self.keyword_mapping.items()]
+        self.all_topics = list(self.knowledge_base.keys())
+        
+        # Farewell words end the chat anywhere in a message; softer phrases only on their own
+        self.exit_pattern = re.compile(r"\b(bye|goodbye|exit|quit)\b")
+        self.exit_phrase_pattern = re.compile(r"(that's all|thank you|thanks|end|stop)[\s.!]*")
+        
         # Maintain conversation context
-        self.context = {
+        self.context = self.new_context()
+    
+    @staticmethod
+    def new_context():
+        """Create an empty conversation context"""
+        return {
             "last_query": None,
             "last_topic": None,
             "user_preferences": {}
         }
         
-    def process_message(self, message):
+    def process_message(self, message, context=None):
         """
         Process user message and return appropriate response
         
         Args:
             message (str): User's message
+            context (dict, optional): Conversation context to use instead of
+                self.context, so one chatbot instance can serve many users
             
         Returns:
             str: Chatbot response
         """
+        if context is None:
+            context = self.context
+        
         # Store the message for context
-        self.context["last_query"] = message
+        context["last_query"] = message
         message = message.lower().strip()
         
         # Extract any user preferences from the message
-        self._extract_preferences(message)
+        self._extract_preferences(message, context)
         
         # Check for predefined commands/special cases
         if self._is_exit_command(message):
@@ -148,30 +167,33 @@ class RentalChatbot:
         topic = self._find_matching_topic(message)
         
         # Store topic for context
-        self.context["last_topic"] = topic
+        context["last_topic"] = topic
         
         # If topic found, return a response from that topic
         if topic:
             return random.choice(self.knowledge_base[topic])
         
         # If no topic matched, provide a default response
-        return self._get_default_response()
+        return self._get_default_response(context)
     
-    def _extract_preferences(self, message):
+    def _extract_preferences(self, message, context=None):
         """Extract user preferences from message to personalize future responses"""
+        if context is None:
+            context = self.context
+        
         # Look for car type preferences
         car_types = ["suv", "sedan", "luxury", "compact", "electric"]
         for car_type in car_types:
             if car_type in message:
-                self.context["user_preferences"]["car_type"] = car_type
+                context["user_preferences"]["car_type"] = car_type
         
         # Look for price sensitivity
         price_terms = ["cheap", "affordable", "budget", "expensive", "luxury", "cost"]
         if any(term in message for term in price_terms):
             if any(term in message for term in ["cheap", "affordable", "budget"]):
-                self.context["user_preferences"]["price_sensitivity"] = "budget"
+                context["user_preferences"]["price_sensitivity"] = "budget"
             elif any(term in message for term in ["expensive", "luxury"]):
-                self.context["user_preferences"]["price_sensitivity"] = "premium"
+                context["user_preferences"]["price_sensitivity"] = "premium"
         
         # Look for rental duration
         duration_patterns = [
@@ -183,36 +205,37 @@ class RentalChatbot:
         for pattern, unit in duration_patterns:
             match = re.search(pattern, message)
             if match:
-                self.context["user_preferences"]["duration"] = {
+                context["user_preferences"]["duration"] = {
                     "value": int(match.group(1)),
                     "unit": unit
                 }
                 break
     
     def _is_exit_command(self, message):
-        """Check if message is an exit command"""
-        exit_commands = ["bye", "goodbye", "exit", "quit", "end", "stop", "that's all", "thank you", "thanks bye"]
-        return any(cmd in message for cmd in exit_commands)
+        """Check if message is an exit command (whole words, not substrings)"""
+        return bool(self.exit_pattern.search(message) or self.exit_phrase_pattern.fullmatch(message))
     
     def _find_matching_topic(self, message):
         """Find the most relevant topic based on message keywords"""
-        for keyword_pattern, topic in self.keyword_mapping.items():
-            if re.search(keyword_pattern, message):
+        for keyword_pattern, topic in self.compiled_keywords:
+            if keyword_pattern.search(message):
                 return topic
                 
         # If no direct match, try to find close matches in our knowledge base
-        all_topics = list(self.knowledge_base.keys())
         words = message.split()
         
         for word in words:
-            if len(word) > 3:  #            # Only check longer words for better matches
-            matches = get_close_matches(word, all_topics, n=1, cutoff=0.7)
-            if matches:
-                return matches[0]
+            if len(word) > 3:  # Only check longer words for better matches
+                matches = get_close_matches(word, self.all_topics, n=1, cutoff=0.7)
+                if matches:
+                    return matches[0]
         return None
     
-    def _get_default_response(self):
+    def _get_default_response(self, context=None):
         """Provide a default response when no specific topic is matched"""
+        if context is None:
+            context = self.context
+        
         default_responses = [
             "I'm not sure I understand. Could you please rephrase your question?",
             "I'd be happy to help with that. Could you provide more details?",
@@ -223,8 +246,8 @@ class RentalChatbot:
         ]
         
         # If we have some context, try to use it
-        if self.context["last_topic"]:
-            return (f"I'm not sure about that specific question, but I can tell you more about {self.context['last_topic'].replace('_', ' ')}. "
+        if context["last_topic"]:
+            return (f"I'm not sure about that specific question, but I can tell you more about {context['last_topic'].replace('_', ' ')}. "
                     "Would that be helpful?")
         
         return random.choice(default_responses)
@@ -0,0 +1,182 @@
+"""
+Demand Models for Smart Pricing
+This module defines the interface SmartPricing uses to get demand factors
+per (date, car category), and a deterministic implementation that derives
+market fluctuations from a hash of the date and category instead of a
+random draw, so the same car on the same date always gets the same price.
+Factors are memoized in a bounded cache. Demand curves fitted to booking
+history (see booking_history) are loaded from a JSON table.
+"""
+
+import hashlib
+import json
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from ai_modules.cache import LRUCache
+
+
+class DemandModel(ABC):
+    """Interface for demand factors per (date, car category)."""
+
+    def __init__(self, cache_size=4096):
+        """
+        Initialize the factor cache.
+
+        Args:
+            cache_size (int): Maximum number of memoized (date, category) factors
+        """
+        self.cache = LRUCache(maxsize=cache_size)
+        # Bumped whenever the model's factors change, so price caches can follow
+        self.version = 0
+
+    @abstractmethod
+    def compute_factor(self, date, category):
+        """
+        Compute the demand factor for a date and category (uncached).
+
+        Args:
+            date (date or datetime): The day
+            category (str): Car category (None for a category-neutral factor)
+
+        Returns:
+            float: Demand factor (1.0 = normal demand)
+        """
+
+    def demand_factor(self, date, category):
+        """
+        Get the demand factor for a date and category, memoized.
+
+        Args:
+            date (date or datetime): The day
+            category (str): Car category (None for a category-neutral factor)
+
+        Returns:
+            float: Demand factor (1.0 = normal demand)
+        """
+        key = (date.toordinal(), category)
+        factor = self.cache.get(key)
+        if factor is None:
+            factor = self.compute_factor(date, category)
+            self.cache.set(key, factor)
+        return factor
+
+    def demand_factors(self, dates, categories):
+        """
+        Get demand factors for every (category, date) pair.
+
+        Args:
+            dates (list): Days
+            categories (list): Car categories
+
+        Returns:
+            numpy.ndarray: (categories x dates) demand factors
+        """
+        factors = np.empty((len(categories), len(dates)))
+        for i, category in enumerate(categories):
+            for j, date in enumerate(dates):
+                factors[i, j] = self.demand_factor(date, category)
+        return factors
+
+    def invalidate(self):
+        """Drop memoized factors and bump the version after the model changed."""
+        self.cache.clear()
+        self.version += 1
+
+
+class HashSeededDemandModel(DemandModel):
+    """Day-of-week and category demand with deterministic per-(date, category) fluctuations."""
+
+    def __init__(self, base_demand=None, category_factors=None, seed=0, fluctuation=0.1, cache_size=4096):
+        """
+        Initialize the model.
+
+        Args:
+            base_demand (dict, optional): Day of week (0=Monday) -> base demand
+                (missing days default to 1.0)
+            category_factors (dict, optional): Category -> demand factor
+                (missing categories default to 1.0)
+            seed (int): Seed mixed into the hash; different seeds give
+                different (but still reproducible) fluctuations
+            fluctuation (float): Maximum relative market fluctuation (0.1 = ±10%)
+            cache_size (int): Maximum number of memoized factors
+        """
+        super().__init__(cache_size=cache_size)
+        self.base_demand = dict(base_demand or {})
+        self.category_factors = dict(category_factors or {})
+        self.seed = seed
+        self.fluctuation = fluctuation
+
+    def _unit_hash(self, date, category):
+        """Map (seed, date, category) to a stable number in [0, 1)."""
+        key = f"{self.seed}:{date.toordinal()}:{category}".encode("utf-8")
+        digest = hashlib.blake2b(key, digest_size=8).digest()
+        return int.from_bytes(digest, "big") / 2 ** 64
+
+    def compute_factor(self, date, category):
+        demand = self.base_demand.get(date.weekday(), 1.0)
+        category_factor = self.category_factors.get(category, 1.0)
+        # Market fluctuation, stable for a given day and category
+        fluctuation = 1.0 + self.fluctuation * (2.0 * self._unit_hash(date, category) - 1.0)
+        return demand * category_factor * fluctuation
+
+
+class FittedDemandModel(DemandModel):
+    """Demand curves fitted to booking history: category x day of week x month."""
+
+    def __init__(self, category_factors, weekday_factors, month_factors, metadata=None, cache_size=4096):
+        """
+        Initialize the model.
+
+        Args:
+            category_factors (dict): Category -> demand multiplier (unknown
+                categories get 1.0)
+            weekday_factors (list): Seven multipliers, Monday first
+            month_factors (list): Twelve multipliers, January first
+            metadata (dict, optional): Details of the data the model was fitted on
+            cache_size (int): Maximum number of memoized factors
+        """
+        super().__init__(cache_size=cache_size)
+        self.category_factors = dict(category_factors)
+        self.weekday_factors = list(weekday_factors)
+        self.month_factors = list(month_factors)
+        self.metadata = dict(metadata or {})
+
+    def compute_factor(self, date, category):
+        return (self.category_factors.get(category, 1.0)
+                * self.weekday_factors[date.weekday()]
+                * self.month_factors[date.month - 1])
+
+    def save(self, path):
+        """
+        Write the fitted table to a JSON file.
+
+        Args:
+            path (str): Output file path
+        """
+        data = {
+            "category_factors": self.category_factors,
+            "weekday_factors": self.weekday_factors,
+            "month_factors": self.month_factors,
+            "metadata": self.metadata
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    @classmethod
+    def load(cls, path, cache_size=4096):
+        """
+        Read a fitted table written by save.
+
+        Args:
+            path (str): Input file path
+            cache_size (int): Maximum number of memoized factors
+
+        Returns:
+            FittedDemandModel: The loaded model
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["category_factors"], data["weekday_factors"], data["month_factors"],
+                   metadata=data.get("metadata"), cache_size=cache_size)
@@ -0,0 +1,275 @@
+"""
+Fleet Data Store for Car Rental Website
+This module keeps the rental fleet in an id-keyed repository with secondary
+indexes by category and transmission, and notifies subscribers (engines,
+caches) whenever a car is added, updated or removed.
+"""
+
+import logging
+import threading
+from dataclasses import asdict, dataclass, field, replace
+
+logger = logging.getLogger(__name__)
+
+# Change events passed to subscribers
+CAR_ADDED = "added"
+CAR_UPDATED = "updated"
+CAR_REMOVED = "removed"
+MAINTENANCE_UPDATED = "maintenance"
+
+
+@dataclass(slots=True)
+class Car:
+    """A single vehicle in the fleet."""
+
+    id: int
+    name: str
+    category: str
+    price_per_day: float
+    seats: int
+    transmission: str
+    image: str = ""
+    features: list = field(default_factory=list)
+    rating: float = None
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a Car from a car dictionary.
+
+        Args:
+            data (dict): Car information (unknown keys are ignored)
+
+        Returns:
+            Car: The car record
+        """
+        return cls(
+            id=data['id'],
+            name=data['name'],
+            category=data['category'],
+            price_per_day=data['price_per_day'],
+            seats=data['seats'],
+            transmission=data['transmission'],
+            image=data.get('image', ""),
+            features=list(data.get('features', [])),
+            rating=data.get('rating')
+        )
+
+    def to_dict(self):
+        """
+        Convert to the car dictionary format used by the engines and templates.
+
+        Returns:
+            dict: Car information ('rating' is omitted when unknown)
+        """
+        data = asdict(self)
+        if data['rating'] is None:
+            del data['rating']
+        return data
+
+
+class FleetRepository:
+    """Id-keyed fleet storage with secondary indexes and change notifications."""
+
+    def __init__(self, cars=None):
+        """
+        Initialize the repository.
+
+        Args:
+            cars (list, optional): Initial Car records or car dictionaries
+        """
+        self._cars = {}               # id -> Car, in insertion order
+        self._by_category = {}        # category -> {id: None} (ordered set)
+        self._by_transmission = {}    # transmission -> {id: None}
+        self._maintenance = {}        # id -> maintenance prediction dict
+        self._listeners = []
+        self._snapshot = None
+        self._lock = threading.RLock()
+        self.version = 0
+
+        for car in cars or []:
+            self._insert(self._as_car(car))
+
+    @staticmethod
+    def _as_car(car):
+        return car if isinstance(car, Car) else Car.from_dict(car)
+
+    def __len__(self):
+        return len(self._cars)
+
+    def __contains__(self, car_id):
+        return car_id in self._cars
+
+    def __iter__(self):
+        return iter(list(self._cars.values()))
+
+    def get(self, car_id):
+        """
+        Look up a car by id.
+
+        Args:
+            car_id: Car identifier
+
+        Returns:
+            Car or None: The car record, if present
+        """
+        return self._cars.get(car_id)
+
+    def by_category(self, category):
+        """Get all cars in a category."""
+        return [self._cars[car_id] for car_id in self._by_category.get(category, ())]
+
+    def by_transmission(self, transmission):
+        """Get all cars with a transmission type."""
+        return [self._cars[car_id] for car_id in self._by_transmission.get(transmission, ())]
+
+    def categories(self):
+        """Get the categories present in the fleet."""
+        return list(self._by_category)
+
+    def as_dicts(self):
+        """
+        Get the fleet as a list of car dictionaries, in fleet order.
+
+        The list is built once per fleet version and shared between callers,
+        so it must not be modified.
+
+        Returns:
+            list: Car dictionaries
+        """
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = [car.to_dict() for car in self._cars.values()]
+            return self._snapshot
+
+    def subscribe(self, listener):
+        """
+        Register a change listener.
+
+        Args:
+            listener (callable): Called as listener(event, car) after each
+                change, where event is CAR_ADDED, CAR_UPDATED, CAR_REMOVED or
+                MAINTENANCE_UPDATED (a new maintenance prediction for the car)
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        """Remove a previously registered change listener."""
+        self._listeners.remove(listener)
+
+    def add(self, car):
+        """
+        Add a new car to the fleet.
+
+        Args:
+            car (Car or dict): The car to add
+
+        Returns:
+            Car: The stored record
+        """
+        car = self._as_car(car)
+        with self._lock:
+            if car.id in self._cars:
+                raise ValueError(f"Car {car.id} already exists")
+            self._insert(car)
+            self._changed()
+        self._notify(CAR_ADDED, car)
+        return car
+
+    def update(self, car_id, **changes):
+        """
+        Update fields of an existing car.
+
+        Args:
+            car_id: Car identifier
+            **changes: Field values to replace (e.g. price_per_day=95)
+
+        Returns:
+            Car: The updated record
+        """
+        with self._lock:
+            if car_id not in self._cars:
+                raise KeyError(car_id)
+            if changes.get('id', car_id) != car_id:
+                raise ValueError("Car id cannot be changed")
+            old = self._cars[car_id]
+            car = replace(old, **changes)
+            if car.category != old.category or car.transmission != old.transmission:
+                self._unindex(old)
+            self._insert(car)
+            self._changed()
+        self._notify(CAR_UPDATED, car)
+        return car
+
+    def remove(self, car_id):
+        """
+        Remove a car (and its maintenance prediction) from the fleet.
+
+        Args:
+            car_id: Car identifier
+
+        Returns:
+            Car: The removed record
+        """
+        with self._lock:
+            if car_id not in self._cars:
+                raise KeyError(car_id)
+            car = self._cars.pop(car_id)
+            self._unindex(car)
+            self._maintenance.pop(car_id, None)
+            self._changed()
+        self._notify(CAR_REMOVED, car)
+        return car
+
+    def set_maintenance(self, car_id, prediction):
+        """
+        Store the maintenance prediction for a car.
+
+        Args:
+            car_id: Car identifier
+            prediction (dict): Maintenance prediction
+        """
+        with self._lock:
+            if car_id not in self._cars:
+                raise KeyError(car_id)
+            car = self._cars[car_id]
+            self._maintenance[car_id] = prediction
+        self._notify(MAINTENANCE_UPDATED, car)
+
+    def get_maintenance(self, car_id):
+        """Get the maintenance prediction for a car, if any."""
+        return self._maintenance.get(car_id)
+
+    def maintenance_predictions(self):
+        """
+        Get all maintenance predictions keyed by car id.
+
+        Returns:
+            dict: car_id -> prediction (shared, must not be modified)
+        """
+        return self._maintenance
+
+    def _insert(self, car):
+        # Re-assigning an existing key keeps its position, so updates keep fleet order
+        self._cars[car.id] = car
+        self._by_category.setdefault(car.category, {})[car.id] = None
+        self._by_transmission.setdefault(car.transmission, {})[car.id] = None
+
+    def _unindex(self, car):
+        for index, key in ((self._by_category, car.category), (self._by_transmission, car.transmission)):
+            ids = index.get(key)
+            if ids is not None:
+                ids.pop(car.id, None)
+                if not ids:
+                    del index[key]
+
+    def _changed(self):
+        self.version += 1
+        self._snapshot = None
+
+    def _notify(self, event, car):
+        for listener in list(self._listeners):
+            try:
+                listener(event, car)
+            except Exception as e:
+                logger.error("Fleet listener failed on %s of car %s: %s", event, car.id, str(e))
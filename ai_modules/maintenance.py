@@ -6,10 +6,133 @@ to forecast potential maintenance needs and reliability scores.
 
 import datetime
 import random
+import numpy as np
+from dataclasses import dataclass
 from datetime import timedelta
+from enum import IntEnum
+from statistics import NormalDist
+
+from ai_modules.utils import round_cents
+
+# Health status labels and the lowest reliability score of each
+HEALTH_STATUS_THRESHOLDS = [60, 70, 80, 90]
+HEALTH_STATUS_LABELS = ["Requires Service", "Needs Attention", "Fair", "Good", "Excellent"]
+
+# Wear range of parts reported as "replacement soon" (10-25% life remaining)
+SOON_WEAR_MIN = 75
+SOON_WEAR_MAX = 90
+
+class IssueType(IntEnum):
+    """Kinds of maintenance issue, used as columns of issue count matrices"""
+    OTHER = 0
+    REPLACEMENT = 1
+    REPLACEMENT_SOON = 2
+    CHECK = 3
+    SOFTWARE_UPDATE = 4
+    SANITIZATION = 5
+    DETAILING = 6
+
+# Cost range (min, max) of each issue type; costs are modelled as uniform over the range
+ISSUE_COST_RANGES = {
+    IssueType.OTHER: (50, 150),
+    IssueType.REPLACEMENT: (200, 800),
+    IssueType.REPLACEMENT_SOON: (150, 600),
+    IssueType.CHECK: (50, 200),
+    IssueType.SOFTWARE_UPDATE: (50, 100),
+    IssueType.SANITIZATION: (80, 150),
+    IssueType.DETAILING: (100, 300),
+}
+
+# Display text of issues that are not about a specific part
+GENERAL_ISSUE_TEXTS = {
+    IssueType.OTHER: "General inspection recommended",
+    IssueType.SOFTWARE_UPDATE: "Software update pending",
+    IssueType.SANITIZATION: "Interior sanitization due",
+    IssueType.DETAILING: "Exterior detailing recommended",
+}
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceIssue:
+    """A predicted maintenance issue: its type, and the part and wear it concerns"""
+    type: IssueType
+    part: str = None   # Display name of the part or system, e.g. "Air Filter"
+    wear: int = None   # Wear in percent, for REPLACEMENT_SOON
+    
+    def describe(self):
+        """
+        Render the issue as display text
+        
+        Returns:
+            str: e.g. "Brakes at 80% wear, replacement soon"
+        """
+        if self.type == IssueType.REPLACEMENT:
+            return f"{self.part} replacement needed"
+        if self.type == IssueType.REPLACEMENT_SOON:
+            return f"{self.part} at {self.wear}% wear, replacement soon"
+        if self.type == IssueType.CHECK:
+            return f"{self.part} check recommended"
+        return GENERAL_ISSUE_TEXTS[self.type]
+
+# General (non-wear) issues added at random by the predictors
+GENERAL_ISSUES = [
+    MaintenanceIssue(IssueType.SOFTWARE_UPDATE),
+    MaintenanceIssue(IssueType.CHECK, "Battery health"),
+    MaintenanceIssue(IssueType.CHECK, "Alignment"),
+    MaintenanceIssue(IssueType.SANITIZATION),
+    MaintenanceIssue(IssueType.DETAILING),
+]
+
+# Keywords classifying free-form issue texts (e.g. stored predictions), checked in order
+ISSUE_TEXT_KEYWORDS = (
+    ("replacement", IssueType.REPLACEMENT),
+    ("soon", IssueType.REPLACEMENT_SOON),
+    ("check", IssueType.CHECK),
+    ("update", IssueType.SOFTWARE_UPDATE),
+    ("sanitization", IssueType.SANITIZATION),
+    ("detailing", IssueType.DETAILING),
+)
+
+def issue_type_of(issue):
+    """
+    Get the type of an issue
+    
+    Args:
+        issue (MaintenanceIssue, IssueType or str): The issue, its type, or
+            a free-form issue text
+        
+    Returns:
+        IssueType: The issue type (OTHER when it cannot be told)
+    """
+    if isinstance(issue, MaintenanceIssue):
+        return issue.type
+    if isinstance(issue, str):
+        text = issue.lower()
+        for keyword, issue_type in ISSUE_TEXT_KEYWORDS:
+            if keyword in text:
+                return issue_type
+        return IssueType.OTHER
+    try:
+        return IssueType(issue)
+    except ValueError:
+        return IssueType.OTHER
 
 class PredictiveMaintenance:
-    def __init__(self):
+    def __init__(self, reliability_noise=0.05, random_issue_rate=0.3, service_date_jitter=0.2):
+        """
+        Initialize the maintenance predictor
+        
+        Args:
+            reliability_noise (float): Maximum relative random variation of
+                reliability scores (0.05 = ±5%); 0 disables it
+            random_issue_rate (float): Chance of adding a general (non-wear)
+                issue to a car with fewer than three issues; 0 disables it
+            service_date_jitter (float): Maximum relative random variation of
+                the next service date (0.2 = ±20%); 0 disables it
+        """
+        self.reliability_noise = reliability_noise
+        self.random_issue_rate = random_issue_rate
+        self.service_date_jitter = service_date_jitter
+        
         # Common car parts and their average lifespan (in miles)
         self.parts_lifespan = {
             "oil": 5000,
@@ -23,6 +146,11 @@ class PredictiveMaintenance:
             "suspension": 70000
         }
         
+        # Parts as columns of the fleet x parts wear matrix, with display names
+        self.part_lifespans = np.array(list(self.parts_lifespan.values()), dtype=float)
+        self.part_names = [part.replace('_', ' ').title() for part in self.parts_lifespan]
+        self._issue_table = self._build_issue_table()
+        
         # Category-specific reliability factors
         self.reliability_factors = {
             "Luxury": 0.95,    # Luxury cars often have more complex systems that can fail
@@ -32,6 +160,24 @@ class PredictiveMaintenance:
             "Sedan": 1.0       # Baseline
         }
         
+        # Columnar lookups for batch scoring; the last code is for unknown categories
+        self.category_codes = {category: code for code, category in enumerate(self.reliability_factors)}
+        self.reliability_lookup = np.array(list(self.reliability_factors.values()) + [1.0])
+    
+    def encode_categories(self, categories):
+        """
+        Convert category names to codes for the batch APIs
+        
+        Args:
+            categories (list): Category name of each car
+            
+        Returns:
+            numpy.ndarray: Category codes (unknown categories share the last code)
+        """
+        unknown = len(self.category_codes)
+        return np.fromiter((self.category_codes.get(category, unknown) for category in categories),
+                           dtype=np.int64, count=len(categories))
+        
     def calculate_reliability_score(self, car_data):
         """
         Calculate a reliability score for a car based on its type, age, and maintenance history
@@ -61,29 +207,67 @@ class PredictiveMaintenance:
         score = base_score * category_factor * max(0.5, mileage_factor) * max(0.7, age_factor)
         
         # Add some randomness to simulate real-world variability
-        score *= random.uniform(0.95, 1.05)
+        if self.reliability_noise:
+            score *= random.uniform(1 - self.reliability_noise, 1 + self.reliability_noise)
         
         # Ensure score is within 0-100 range
         return max(0, min(100, round(score)))
         
+    def calculate_reliability_scores(self, category_codes, mileage, age_years, noise=None, seed=None):
+        """
+        Calculate reliability scores and health statuses for a whole fleet
+        
+        Same formula as calculate_reliability_score, over columnar arrays.
+        With noise disabled the results equal the scalar version car by car.
+        
+        Args:
+            category_codes (array-like): Category code of each car (see encode_categories)
+            mileage (array-like): Mileage of each car
+            age_years (array-like): Age of each car in years
+            noise (float, optional): Maximum relative random variation
+                (defaults to reliability_noise; 0 disables it)
+            seed (int, optional): Seed for the noise, for reproducible scores
+            
+        Returns:
+            tuple: (scores, health_statuses) arrays, one entry per car
+        """
+        category_factors = self.reliability_lookup[np.asarray(category_codes, dtype=np.int64)]
+        mileage_factors = np.maximum(0.5, 1.0 - (np.asarray(mileage, dtype=float) / 200000))
+        age_factors = np.maximum(0.7, 1.0 - (np.asarray(age_years, dtype=float) / 20.0))
+        
+        scores = 90 * category_factors * mileage_factors * age_factors
+        
+        if noise is None:
+            noise = self.reliability_noise
+        if noise:
+            rng = np.random.default_rng(seed)
+            scores *= rng.uniform(1 - noise, 1 + noise, size=len(scores))
+        
+        # np.rint rounds halves to even, like round()
+        scores = np.clip(np.rint(scores), 0, 100).astype(np.int64)
+        return scores, self.get_health_statuses(scores)
+        
     def predict_maintenance_issues(self, car_data):
         """
         Predict potential maintenance issues based on car data
         
         Args:
             car_data (dict): Car information including mileage, last service, etc.
+                Optional part_service_miles (part -> mileage) overrides
+                last_service_miles for parts serviced on their own
             
         Returns:
-            list: Predicted maintenance issues
+            list: Predicted MaintenanceIssue records (render with describe())
         """
         mileage = car_data.get('mileage', 10000)
         last_service_miles = car_data.get('last_service_miles', 0)
-        miles_since_service = mileage - last_service_miles
+        part_service_miles = car_data.get('part_service_miles') or {}
         
         predicted_issues = []
         
         # Check each part against its lifespan and mileage since last service
         for part, lifespan in self.parts_lifespan.items():
+            miles_since_service = mileage - part_service_miles.get(part, last_service_miles)
             remaining_life = lifespan - (miles_since_service % lifespan)
             remaining_percent = (remaining_life / lifespan) * 100
             
@@ -92,37 +276,123 @@ class PredictiveMaintenance:
             
             # If part is due for service or close to it, add to issues
             if remaining_percent <= 10:
-                predicted_issues.append(f"{part_name} replacement needed")
+                predicted_issues.append(MaintenanceIssue(IssueType.REPLACEMENT, part_name))
             elif remaining_percent <= 25:
-                predicted_issues.append(f"{part_name} at {round(100-remaining_percent)}% wear, replacement soon")
+                predicted_issues.append(MaintenanceIssue(IssueType.REPLACEMENT_SOON, part_name,
+                                                         round(100 - remaining_percent)))
             elif remaining_percent <= 40:
-                predicted_issues.append(f"{part_name} check recommended")
+                predicted_issues.append(MaintenanceIssue(IssueType.CHECK, part_name))
         
         # Add some randomness for realism
-        if random.random() < 0.3 and len(predicted_issues) < 3:
-            random_issues = [
-                "Software update pending",
-                "Battery health check recommended",
-                "Alignment check recommended",
-                "Interior sanitization due",
-                "Exterior detailing recommended"
-            ]
-            predicted_issues.append(random.choice(random_issues))
+        if random.random() < self.random_issue_rate and len(predicted_issues) < 3:
+            predicted_issues.append(random.choice(GENERAL_ISSUES))
             
         return predicted_issues[:3]  # Return top 3 issues
     
-    def calculate_next_service_date(self, car_data):
+    def compute_parts_wear(self, mileage, last_service_miles):
         """
-        Calculate the next recommended service date
+        Remaining life of every part of every car, as one matrix
         
         Args:
-            car_data (dict): Car information
+            mileage (array-like): Mileage of each car
+            last_service_miles (array-like): Mileage at each car's last service,
+                or a (cars x parts) matrix of per-part service mileages
             
         Returns:
-            str: Next service date in YYYY-MM-DD format
+            numpy.ndarray: (cars x parts) remaining life in percent, columns
+            in parts_lifespan order
         """
-        today = datetime.datetime.now()
+        last_service_miles = np.asarray(last_service_miles, dtype=float)
+        if last_service_miles.ndim == 1:
+            last_service_miles = last_service_miles[:, None]
+        miles_since_service = np.asarray(mileage, dtype=float)[:, None] - last_service_miles
+        remaining_life = self.part_lifespans - (miles_since_service % self.part_lifespans)
+        return (remaining_life / self.part_lifespans) * 100
+    
+    def _build_issue_table(self):
+        """
+        Every wear issue, built once
+        
+        Row per part; column 0 = check recommended, 1 = replacement needed,
+        and 2 + (wear - 75) = replacement soon at <wear>% wear, for the
+        75-90% wear that the "soon" band covers
+        """
+        table = np.empty((len(self.part_names), 2 + SOON_WEAR_MAX - SOON_WEAR_MIN + 1), dtype=object)
+        for part, part_name in enumerate(self.part_names):
+            table[part, 0] = MaintenanceIssue(IssueType.CHECK, part_name)
+            table[part, 1] = MaintenanceIssue(IssueType.REPLACEMENT, part_name)
+            for wear in range(SOON_WEAR_MIN, SOON_WEAR_MAX + 1):
+                table[part, 2 + wear - SOON_WEAR_MIN] = MaintenanceIssue(IssueType.REPLACEMENT_SOON, part_name, wear)
+        return table
+    
+    @staticmethod
+    def classify_parts_wear(remaining_percent):
+        """
+        Classify part wear with the predict_maintenance_issues thresholds
+        
+        Args:
+            remaining_percent (numpy.ndarray): Remaining life in percent
+            
+        Returns:
+            numpy.ndarray: Same-shaped severities: 3 = replacement needed
+            (<= 10%), 2 = replacement soon (<= 25%), 1 = check recommended
+            (<= 40%), 0 = fine
+        """
+        return ((remaining_percent <= 40).astype(np.int8)
+                + (remaining_percent <= 25)
+                + (remaining_percent <= 10))
+    
+    def predict_maintenance_issues_batch(self, mileage, last_service_miles, limit=3):
+        """
+        Predict wear-based maintenance issues for a whole fleet
+        
+        Wear and severity are computed for the full fleet x parts matrix;
+        issue records are looked up only for the first `limit` flagged parts
+        of each car. With random_issue_rate = 0 the result for each car equals
+        predict_maintenance_issues.
+        
+        Args:
+            mileage (array-like): Mileage of each car
+            last_service_miles (array-like): Mileage at each car's last service
+            limit (int): Maximum issues per car
+            
+        Returns:
+            list: MaintenanceIssue records per car
+        """
+        remaining_percent = self.compute_parts_wear(mileage, last_service_miles)
+        severity = self.classify_parts_wear(remaining_percent)
+        
+        flagged = severity > 0
+        shown = flagged & (np.cumsum(flagged, axis=1) <= limit)
+        
+        # Look up the prebuilt record of every shown issue at once
+        cars, parts = np.nonzero(shown)
+        levels = severity[cars, parts]
+        wear = np.clip(np.rint(100 - remaining_percent[cars, parts]), SOON_WEAR_MIN, SOON_WEAR_MAX).astype(np.int64)
+        columns = np.where(levels == 2, 2 + wear - SOON_WEAR_MIN, levels == 3)
+        records = self._issue_table[parts, columns].tolist()
+        
+        # Split the flat, car-ordered list back into one list per car
+        ends = np.cumsum(np.bincount(cars, minlength=len(severity))).tolist()
+        issues = [records[start:end] for start, end in zip([0] + ends[:-1], ends)]
         
+        # Random general issues, as in the scalar version
+        if self.random_issue_rate:
+            for car_issues in issues:
+                if len(car_issues) < limit and random.random() < self.random_issue_rate:
+                    car_issues.append(random.choice(GENERAL_ISSUES))
+        return issues
+    
+    def calculate_days_until_service(self, car_data):
+        """
+        Calculate how many days until the next service is due
+        
+        Args:
+            car_data (dict): Car information
+            
+        Returns:
+            int: Days until the part that needs service soonest is due (at least 1)
+        """
         # Base next service on mileage and usage patterns
         mileage = car_data.get('mileage', 10000)
         daily_usage = car_data.get('daily_miles', 30)  # Average miles per day
@@ -133,37 +403,76 @@ class PredictiveMaintenance:
             remaining_life = lifespan - (mileage % lifespan)
             next_service_miles = min(next_service_miles, remaining_life)
         
+        return max(1, round(next_service_miles / daily_usage))
+    
+    def calculate_days_until_service_batch(self, mileage, daily_miles):
+        """
+        Calculate days until the next service for a whole fleet
+        
+        Args:
+            mileage (array-like): Mileage of each car
+            daily_miles (array-like): Average miles per day of each car
+            
+        Returns:
+            numpy.ndarray: Days until service per car, equal to calculate_days_until_service
+        """
+        mileage = np.asarray(mileage, dtype=float)
+        remaining_life = self.part_lifespans - (mileage[:, None] % self.part_lifespans)
+        next_service_miles = remaining_life.min(axis=1)
+        return np.maximum(1, np.rint(next_service_miles / np.asarray(daily_miles, dtype=float))).astype(np.int64)
+    
+    def calculate_next_service_date(self, car_data):
+        """
+        Calculate the next recommended service date
+        
+        Args:
+            car_data (dict): Car information
+            
+        Returns:
+            str: Next service date in YYYY-MM-DD format
+        """
+        today = datetime.datetime.now()
+        
         # Calculate days until next service
-        days_until_service = max(1, round(next_service_miles / daily_usage))
+        days_until_service = self.calculate_days_until_service(car_data)
         
         # Add some randomness to simulate real-world variability
-        days_until_service = int(days_until_service * random.uniform(0.8, 1.2))
+        if self.service_date_jitter:
+            days_until_service = int(days_until_service * random.uniform(1 - self.service_date_jitter,
+                                                                         1 + self.service_date_jitter))
         
         # Calculate the next service date
         next_service_date = today + timedelta(days=days_until_service)
         
         return next_service_date.strftime('%Y-%m-%d')
     
-    def generate_maintenance_prediction(self, car):
+    def generate_maintenance_prediction(self, car, car_data=None):
         """
         Generate a complete maintenance prediction for a car
         
         Args:
             car (dict): Car information
+            car_data (dict, optional): Measured vehicle data (mileage,
+                age_years, last_service_miles, daily_miles), e.g. from
+                telematics; synthetic data is generated when not given
             
         Returns:
             dict: Complete maintenance prediction
         """
-        # Generate synthetic car data if not provided
-        car_data = {
-            'id': car.get('id', 0),
-            'name': car.get('name', 'Unknown Car'),
-            'category': car.get('category', 'Sedan'),
-            'mileage': random.randint(5000, 80000),
-            'age_years': random.randint(1, 5),
-            'last_service_miles': random.randint(0, 5000),
-            'daily_miles': random.randint(20, 50)
-        }
+        if car_data is None:
+            # Generate synthetic car data if not provided
+            car_data = {
+                'id': car.get('id', 0),
+                'name': car.get('name', 'Unknown Car'),
+                'category': car.get('category', 'Sedan'),
+                'mileage': random.randint(5000, 80000),
+                'age_years': random.randint(1, 5),
+                'last_service_miles': random.randint(0, 5000),
+                'daily_miles': random.randint(20, 50)
+            }
+        else:
+            car_data = {'id': car.get('id', 0), 'name': car.get('name', 'Unknown Car'),
+                        'category': car.get('category', 'Sedan'), **car_data}
         
         # Calculate reliability score
         reliability_score = self.calculate_reliability_score(car_data)
@@ -174,12 +483,13 @@ class PredictiveMaintenance:
         # Calculate next service date
         next_service_date = self.calculate_next_service_date(car_data)
         
-        # Return complete prediction
+        # Return complete prediction; issue text is rendered only here, for display
         return {
             "car_id": car_data['id'],
             "reliability_score": reliability_score,
             "next_service": next_service_date,
-            "predicted_issues": predicted_issues,
+            "predicted_issues": [issue.describe() for issue in predicted_issues],
+            "issue_types": [issue.type.name for issue in predicted_issues],
             "estimated_maintenance_cost": self.estimate_maintenance_cost(predicted_issues),
             "health_status": self.get_health_status(reliability_score)
         }
@@ -189,46 +499,102 @@ class PredictiveMaintenance:
         Estimate maintenance costs based on predicted issues
         
         Args:
-            issues (list): List of predicted maintenance issues
+            issues (list): Predicted MaintenanceIssue records (or IssueType
+                codes or issue texts, see issue_type_of)
             
         Returns:
-            float: Estimated maintenance cost
-        """
-        # Define average costs for different maintenance types
-        costs = {
-            "replacement": (200, 800),
-            "soon": (150, 600),
-            "check": (50, 200),
-            "update": (50, 100),
-            "sanitization": (80, 150),
-            "detailing": (100, 300),
-        }
-        
+            float: Expected maintenance cost
+        """
         total_cost = 0
         for issue in issues:
-            issue_lower = issue.lower()
-            
-            # Determine cost range based on issue type
-            if "replacement" in issue_lower:
-                min_cost, max_cost = costs["replacement"]
-            elif "soon" in issue_lower:
-                min_cost, max_cost = costs["soon"]
-            elif "check" in issue_lower:
-                min_cost, max_cost = costs["check"]
-            elif "update" in issue_lower:
-                min_cost, max_cost = costs["update"]
-            elif "sanitization" in issue_lower:
-                min_cost, max_cost = costs["sanitization"]
-            elif "detailing" in issue_lower:
-                min_cost, max_cost = costs["detailing"]
-            else:
-                min_cost, max_cost = (50, 150)  # Default range
-                
-            # Add random cost within range
-            total_cost += random.uniform(min_cost, max_cost)
+            min_cost, max_cost = ISSUE_COST_RANGES[issue_type_of(issue)]
+            total_cost += (min_cost + max_cost) / 2
             
         return round(total_cost, 2)
     
+    @staticmethod
+    def issue_count_matrix(issues_per_car):
+        """
+        Count issues by type for every car
+        
+        Args:
+            issues_per_car (list): MaintenanceIssue records (or IssueType codes
+                or issue texts) of each car
+            
+        Returns:
+            numpy.ndarray: (cars x issue types) counts, columns in IssueType order
+        """
+        counts = np.zeros((len(issues_per_car), len(IssueType)), dtype=np.int64)
+        for car, issues in enumerate(issues_per_car):
+            for issue in issues:
+                counts[car, issue_type_of(issue)] += 1
+        return counts
+    
+    def wear_issue_counts(self, mileage, last_service_miles, limit=3):
+        """
+        Count wear-based issues by type for a whole fleet, without rendering any text
+        
+        Counts the same issues predict_maintenance_issues_batch reports
+        (first `limit` flagged parts per car, random general issues excluded).
+        
+        Args:
+            mileage (array-like): Mileage of each car
+            last_service_miles (array-like): Mileage at each car's last service
+            limit (int): Maximum issues per car
+            
+        Returns:
+            numpy.ndarray: (cars x issue types) counts, columns in IssueType order
+        """
+        severity = self.classify_parts_wear(self.compute_parts_wear(mileage, last_service_miles))
+        flagged = severity > 0
+        severity = np.where(flagged & (np.cumsum(flagged, axis=1) <= limit), severity, 0)
+        
+        counts = np.zeros((len(severity), len(IssueType)), dtype=np.int64)
+        counts[:, IssueType.REPLACEMENT] = (severity == 3).sum(axis=1)
+        counts[:, IssueType.REPLACEMENT_SOON] = (severity == 2).sum(axis=1)
+        counts[:, IssueType.CHECK] = (severity == 1).sum(axis=1)
+        return counts
+    
+    def estimate_maintenance_costs(self, issue_counts, confidence=0.95):
+        """
+        Expected maintenance cost and confidence interval per car and for the fleet
+        
+        Each issue's cost is uniform over its ISSUE_COST_RANGES range and
+        independent of the others, so means and variances add up; intervals
+        use the normal approximation, clipped to the possible cost range.
+        
+        Args:
+            issue_counts (array-like): (cars x issue types) counts, e.g. from
+                wear_issue_counts or issue_count_matrix
+            confidence (float): Confidence level of the intervals
+            
+        Returns:
+            dict: expected, lower and upper (per-car arrays), and fleet_expected,
+            fleet_lower and fleet_upper (fleet totals)
+        """
+        issue_counts = np.asarray(issue_counts, dtype=float)
+        ranges = np.array([ISSUE_COST_RANGES[issue_type] for issue_type in IssueType], dtype=float)
+        low, high = ranges[:, 0], ranges[:, 1]
+        means = (low + high) / 2
+        variances = (high - low) ** 2 / 12
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        
+        expected = issue_counts @ means
+        spread = z * np.sqrt(issue_counts @ variances)
+        minimum = issue_counts @ low
+        maximum = issue_counts @ high
+        
+        fleet_expected = expected.sum()
+        fleet_spread = z * np.sqrt((issue_counts @ variances).sum())
+        return {
+            "expected": round_cents(expected),
+            "lower": round_cents(np.maximum(minimum, expected - spread)),
+            "upper": round_cents(np.minimum(maximum, expected + spread)),
+            "fleet_expected": round(float(fleet_expected), 2),
+            "fleet_lower": round(float(max(minimum.sum(), fleet_expected - fleet_spread)), 2),
+            "fleet_upper": round(float(min(maximum.sum(), fleet_expected + fleet_spread)), 2)
+        }
+    
     def get_health_status(self, reliability_score):
         """
         Get a health status label based on reliability score
@@ -250,6 +616,19 @@ class PredictiveMaintenance:
         else:
             return "Requires Service"
 
+    def get_health_statuses(self, reliability_scores):
+        """
+        Get health status labels for many reliability scores at once
+        
+        Args:
+            reliability_scores (array-like): Reliability scores (0-100)
+            
+        Returns:
+            numpy.ndarray: Health status label of each score
+        """
+        levels = np.searchsorted(HEALTH_STATUS_THRESHOLDS, reliability_scores, side='right')
+        return np.array(HEALTH_STATUS_LABELS, dtype=object)[levels]
+
 # For testing purposes
 if __name__ == "__main__":
     maintenance = PredictiveMaintenance()
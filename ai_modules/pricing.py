@@ -6,18 +6,235 @@ and special events.
 """
 
 import datetime
-import random
+import json
 import numpy as np
 from datetime import timedelta
 
+from ai_modules.cache import LRUCache
+from ai_modules.demand import HashSeededDemandModel
+from ai_modules.utils import round_cents
+
+# Per-date calendar features: day of week (0=Monday), holiday flag, seasonal
+# factor and the combined deterministic multiplier (season x weekend x holiday)
+CALENDAR_DTYPE = np.dtype([
+    ("weekday", np.int8),
+    ("is_holiday", np.bool_),
+    ("seasonal_factor", np.float64),
+    ("multiplier", np.float64)
+])
+
+def load_holidays(path):
+    """
+    Load a (regional) holiday calendar from a file
+    
+    JSON files hold a list of dates, or an object with a "holidays" list.
+    Any other file is read as plain text with one date per line; blank
+    lines and text after '#' are ignored. Dates are either "MM-DD" for
+    holidays on the same day every year or "YYYY-MM-DD" for single dates
+    (e.g. holidays that move from year to year).
+    
+    Args:
+        path (str): Holiday file path
+        
+    Returns:
+        list: Holiday date strings
+    """
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".json"):
+            data = json.load(f)
+            entries = data.get("holidays", []) if isinstance(data, dict) else data
+        else:
+            entries = [line.split("#", 1)[0].strip() for line in f]
+    
+    holidays = []
+    for entry in entries:
+        entry = str(entry).strip()
+        if not entry:
+            continue
+        # Validate the format (a leap year so "02-29" is accepted)
+        if len(entry) == 5:
+            datetime.datetime.strptime(f"2000-{entry}", '%Y-%m-%d')
+        else:
+            datetime.datetime.strptime(entry, '%Y-%m-%d')
+        holidays.append(entry)
+    return holidays
+
+class PricingCalendar:
+    """Precomputed per-date pricing features over a multi-year range."""
+    
+    def __init__(self, seasonal_factors, holidays, weekend_multiplier, holiday_multiplier,
+                 start_year=None, years=4):
+        """
+        Build the feature table
+        
+        Args:
+            seasonal_factors (dict): Month (1-12) -> seasonal multiplier
+            holidays (list): Holiday dates as "MM-DD" (every year) or "YYYY-MM-DD"
+            weekend_multiplier (float): Multiplier for Saturdays and Sundays
+            holiday_multiplier (float): Multiplier for holidays
+            start_year (int, optional): First year covered (defaults to last year)
+            years (int): Number of years covered
+        """
+        self.seasonal_factors = dict(seasonal_factors)
+        self.recurring_holidays = {h for h in holidays if len(h) == 5}
+        self.dated_holidays = {h for h in holidays if len(h) != 5}
+        self.weekend_multiplier = weekend_multiplier
+        self.holiday_multiplier = holiday_multiplier
+        
+        if start_year is None:
+            start_year = datetime.date.today().year - 1
+        self.start = datetime.date(start_year, 1, 1)
+        self.end = datetime.date(start_year + years, 1, 1)
+        self.start_ordinal = self.start.toordinal()
+        self.table = self._build(self.start, (self.end - self.start).days)
+    
+    def __len__(self):
+        return len(self.table)
+    
+    def _build(self, start, days):
+        """Compute the feature rows for days consecutive dates from start"""
+        dates = [start + timedelta(days=i) for i in range(days)]
+        ordinals = np.arange(start.toordinal(), start.toordinal() + days)
+        months = np.fromiter((d.month for d in dates), dtype=np.int64, count=days)
+        seasonal_lookup = np.array([self.seasonal_factors.get(month, 1.0) for month in range(13)])
+        
+        table = np.empty(days, dtype=CALENDAR_DTYPE)
+        # Ordinal 1 (0001-01-01) was a Monday
+        table["weekday"] = (ordinals - 1) % 7
+        table["is_holiday"] = np.fromiter(
+            (d.strftime('%m-%d') in self.recurring_holidays or d.isoformat() in self.dated_holidays
+             for d in dates), dtype=bool, count=days)
+        table["seasonal_factor"] = seasonal_lookup[months]
+        table["multiplier"] = (table["seasonal_factor"]
+                               * np.where(table["weekday"] >= 5, self.weekend_multiplier, 1.0)
+                               * np.where(table["is_holiday"], self.holiday_multiplier, 1.0))
+        return table
+    
+    def lookup(self, date):
+        """
+        Get the features of a single date
+        
+        Args:
+            date (date or datetime): The date to look up
+            
+        Returns:
+            numpy.void: Row with weekday, is_holiday, seasonal_factor and multiplier
+        """
+        index = date.toordinal() - self.start_ordinal
+        if 0 <= index < len(self.table):
+            return self.table[index]
+        # Outside the precomputed range
+        return self._build(datetime.date.fromordinal(date.toordinal()), 1)[0]
+    
+    def range(self, start_date, days):
+        """
+        Get the features of consecutive dates
+        
+        Args:
+            start_date (date or datetime): First date
+            days (int): Number of dates
+            
+        Returns:
+            numpy.ndarray: CALENDAR_DTYPE rows, one per date (a view into the
+            table when the range is precomputed, so it must not be modified)
+        """
+        index = start_date.toordinal() - self.start_ordinal
+        if 0 <= index and index + days <= len(self.table):
+            return self.table[index:index + days]
+        return self._build(datetime.date.fromordinal(start_date.toordinal()), days)
+
+class RentalQuoteTable:
+    """Cumulative daily prices per car, for O(1) multi-day rental totals."""
+    
+    def __init__(self, car_ids, start_date, daily_prices, price_inputs=None):
+        """
+        Build the prefix sums
+        
+        Args:
+            car_ids (list): Car id of each row of daily_prices
+            start_date (date): Date of the first column
+            daily_prices (numpy.ndarray): (cars x days) prices, rounded to cents
+            price_inputs (dict, optional): car_id -> (base price, category) the
+                rows were priced from
+        """
+        self.car_rows = {car_id: row for row, car_id in enumerate(car_ids)}
+        self.price_inputs = price_inputs or {}
+        self.start_ordinal = start_date.toordinal()
+        self.horizon = daily_prices.shape[1]
+        # Whole cents, so totals are exact sums of the daily prices
+        self.cumulative_cents = np.zeros((len(car_ids), self.horizon + 1), dtype=np.int64)
+        np.cumsum(np.rint(daily_prices * 100).astype(np.int64), axis=1, out=self.cumulative_cents[:, 1:])
+    
+    def covers(self, car_id, start_date, days):
+        """Check whether a rental lies entirely inside the table"""
+        offset = start_date.toordinal() - self.start_ordinal
+        return car_id in self.car_rows and offset >= 0 and offset + days <= self.horizon
+    
+    def total(self, car_id, start_date, days):
+        """
+        Sum of the daily prices of a rental
+        
+        Args:
+            car_id: Car identifier
+            start_date (date): First rental day
+            days (int): Rental length
+            
+        Returns:
+            float: Total price before discounts
+        """
+        row = self.car_rows[car_id]
+        offset = start_date.toordinal() - self.start_ordinal
+        return int(self.cumulative_cents[row, offset + days] - self.cumulative_cents[row, offset]) / 100
+    
+    def totals(self, car_ids, start_dates, days):
+        """
+        Sums of the daily prices of many rentals at once
+        
+        Args:
+            car_ids (list): Car identifier of each rental
+            start_dates (list): First day of each rental
+            days (array-like): Length of each rental
+            
+        Returns:
+            numpy.ndarray: Total price of each rental before discounts
+        """
+        rows = np.fromiter((self.car_rows[car_id] for car_id in car_ids), dtype=np.int64, count=len(car_ids))
+        offsets = np.fromiter((d.toordinal() - self.start_ordinal for d in start_dates),
+                              dtype=np.int64, count=len(start_dates))
+        ends = offsets + np.asarray(days, dtype=np.int64)
+        if len(offsets) and (offsets.min() < 0 or ends.max() > self.horizon):
+            raise ValueError("Rental outside the quote horizon")
+        return (self.cumulative_cents[rows, ends] - self.cumulative_cents[rows, offsets]) / 100
+
 class SmartPricing:
-    def __init__(self):
+    def __init__(self, holidays_file=None, demand_model=None, quote_cache_size=10000, quote_ttl=3600):
+        """
+        Initialize the pricing engine
+        
+        Args:
+            holidays_file (str, optional): Regional holiday calendar to use
+                instead of the default holiday list (see load_holidays)
+            demand_model (DemandModel, optional): Source of demand factors
+                (defaults to a deterministic, hash-seeded model over the
+                day-of-week and category factors below)
+            quote_cache_size (int): Maximum number of cached price quotes
+            quote_ttl (float): Seconds a cached quote stays valid
+        """
         # Base pricing factors
         self.weekend_multiplier = 1.25
         self.holiday_multiplier = 1.4
         self.high_demand_multiplier = 1.2
         self.low_demand_multiplier = 0.85
         
+        # Rental length discounts as (minimum days, discount), longest first
+        self.rental_discount_tiers = [
+            (28, 0.20),  # Monthly
+            (7, 0.10),   # Weekly
+        ]
+        self.max_rental_days = 90
+        # Days ahead that rentals can start and still be quoted from the table
+        self.quote_horizon_days = 180
+        
         # Seasonal factors (month-based multipliers)
         self.seasonal_factors = {
             1: 0.9,   # January (low season)
@@ -44,24 +261,8 @@ class SmartPricing:
             # Add other holidays as needed
         ]
         
-    def is_weekend(self, date):
-        """Check if the given date falls on a weekend (Saturday or Sunday)"""
-        return date.weekday() >= 5  # 5 = Saturday, 6 = Sunday
-        
-    def is_holiday(self, date):
-        """Check if the given date is a holiday"""
-        date_string = date.strftime('%m-%d')
-        return date_string in self.holidays
-        
-    def calculate_demand_factor(self, date, car_category):
-        """
-        Calculate demand factor based on historical data and predictive analytics
-        This is a simplified version - a real implementation would use more sophisticated
-        ML models trained on historical booking data
-        """
         # Base demand by day of week (0=Monday, 6=Sunday)
-        day_of_week = date.weekday()
-        base_demand = {
+        self.base_demand = {
             0: 0.7,  # Monday
             1: 0.7,  # Tuesday
             2: 0.8,  # Wednesday
@@ -72,7 +273,7 @@ class SmartPricing:
         }
         
         # Category-specific demand factors
-        category_factors = {
+        self.category_demand_factors = {
             "Luxury": 1.2,
             "SUV": 1.15,
             "Electric": 1.3,
@@ -80,18 +281,115 @@ class SmartPricing:
             "Sedan": 1.0
         }
         
-        # Get base demand for the day
-        demand = base_demand.get(day_of_week, 1.0)
+        if holidays_file:
+            self.holidays = load_holidays(holidays_file)
+        
+        if demand_model is None:
+            demand_model = HashSeededDemandModel(self.base_demand, self.category_demand_factors)
+        self.demand_model = demand_model
+        
+        # Quote caches. Keys start with the car id and include the car's price
+        # inputs and model_version; invalidate_quotes() drops every entry when
+        # a pricing factor changes, invalidate_car() the entries of one car
+        self.pricing_version = 0
+        self.quote_cache = LRUCache(maxsize=quote_cache_size, ttl=quote_ttl)
+        self.booking_outlook_cache = LRUCache(maxsize=64)
+        self._rental_quote_table = None
+        self._rental_quote_key = None
+        
+        # Per-date features are precomputed; call rebuild_calendar() after
+        # changing the seasonal factors, holidays or multipliers
+        self.calendar = None
+        self.rebuild_calendar()
+    
+    @property
+    def model_version(self):
+        """Version of the pricing inputs; changes whenever quotes may change"""
+        return (self.pricing_version, self.demand_model.version)
+    
+    def invalidate_quotes(self):
+        """Drop every cached quote, e.g. after the fleet or pricing factors changed"""
+        self.pricing_version += 1
+        self.quote_cache.clear()
+        self.booking_outlook_cache.clear()
+        self._rental_quote_table = None
+    
+    def invalidate_car(self, car_id):
+        """
+        Drop the cached quotes of one car, e.g. after its base price or category changed
+        
+        Args:
+            car_id: Car identifier
+        """
+        self.quote_cache.discard_if(lambda key: key[0] == car_id)
+        self._rental_quote_table = None
+    
+    def quote_cache_stats(self):
+        """
+        Get hit/miss counters of the pricing caches
+        
+        Returns:
+            dict: Stats of the quote, booking outlook and demand factor caches
+        """
+        return {
+            "quotes": self.quote_cache.stats(),
+            "booking_outlook": self.booking_outlook_cache.stats(),
+            "demand_factors": self.demand_model.cache.stats()
+        }
+    
+    def rebuild_calendar(self):
+        """Recompute the calendar feature table from the current pricing factors"""
+        self.calendar = PricingCalendar(self.seasonal_factors, self.holidays,
+                                        self.weekend_multiplier, self.holiday_multiplier)
+        self.invalidate_quotes()
+    
+    def set_seasonal_factors(self, seasonal_factors):
+        """
+        Update month-based multipliers and re-price
+        
+        Args:
+            seasonal_factors (dict): Month (1-12) -> multiplier, for the months to change
+        """
+        self.seasonal_factors.update(seasonal_factors)
+        self.rebuild_calendar()
+    
+    def load_holiday_calendar(self, path):
+        """
+        Switch to a regional holiday calendar
         
-        # Adjust for category
-        category_factor = category_factors.get(car_category, 1.0)
+        Args:
+            path (str): Holiday file path (see load_holidays)
+        """
+        self.holidays = load_holidays(path)
+        self.rebuild_calendar()
         
-        # Add some randomness to simulate market fluctuations (±10%)
-        randomness = random.uniform(0.9, 1.1)
+    def set_demand_model(self, demand_model):
+        """
+        Replace the demand model (e.g. after fitting one to booking history)
         
-        return demand * category_factor * randomness
+        Args:
+            demand_model (DemandModel): The new source of demand factors
+        """
+        self.demand_model = demand_model
+        self.invalidate_quotes()
     
-    def get_dynamic_price(self, base_price, date, car_category):
+    def is_weekend(self, date):
+        """Check if the given date falls on a weekend (Saturday or Sunday)"""
+        return date.weekday() >= 5  # 5 = Saturday, 6 = Sunday
+        
+    def is_holiday(self, date):
+        """Check if the given date is a holiday"""
+        return bool(self.calendar.lookup(date)["is_holiday"])
+        
+    def calculate_demand_factor(self, date, car_category):
+        """
+        Calculate demand factor based on historical data and predictive analytics
+        The factor comes from the demand model and is deterministic for a given
+        date and category, so prices for the same car and day are stable
+        """
+        return self.demand_model.demand_factor(date, car_category)
+    
+    def get_dynamic_price(self, base_price, date, car_category, demand_factor=None):
         """
         Calculate the dynamic price based on all factors
         
@@ -99,28 +397,18 @@ class SmartPricing:
             base_price (float): The base price of the car rental
             date (datetime): The date for which to calculate the price
             car_category (str): The category of the car
+            demand_factor (float, optional): Precomputed demand factor for this
+                date and category (calculated when not given)
             
         Returns:
             float: The calculated dynamic price
         """
-        # Start with the base price
-        price = base_price
-        
-        # Apply seasonal factor
-        month = date.month
-        season_factor = self.seasonal_factors.get(month, 1.0)
-        price *= season_factor
-        
-        # Apply weekend factor if applicable
-        if self.is_weekend(date):
-            price *= self.weekend_multiplier
-        
-        # Apply holiday factor if applicable
-        if self.is_holiday(date):
-            price *= self.holiday_multiplier
+        # Apply the seasonal, weekend and holiday factors in one step
+        price = base_price * float(self.calendar.lookup(date)["multiplier"])
         
         # Apply demand factor
-        demand_factor = self.calculate_demand_factor(date, car_category)
+        if demand_factor is None:
+            demand_factor = self.calculate_demand_factor(date, car_category)
         if demand_factor > 1.1:
             price *= self.high_demand_multiplier
         elif demand_factor < 0.9:
@@ -129,6 +417,146 @@ class SmartPricing:
         # Round to 2 decimal places
         return round(price, 2)
     
+    def get_car_price(self, car, date):
+        """
+        Get the dynamic price of a car on a date, from the quote cache when possible
+        
+        Args:
+            car (dict): The car object containing id, base price and category
+            date (datetime): The date for which to calculate the price
+            
+        Returns:
+            float: The calculated dynamic price
+        """
+        car_id = car.get('id')
+        if car_id is None:
+            return self.get_dynamic_price(car['price_per_day'], date, car['category'])
+        
+        # Price inputs are part of the key, so a changed car dict is never served a stale price
+        key = (car_id, car['price_per_day'], car['category'], date.toordinal(), self.model_version)
+        price = self.quote_cache.get(key)
+        if price is None:
+            price = self.get_dynamic_price(car['price_per_day'], date, car['category'])
+            self.quote_cache.set(key, price)
+        return price
+    
+    def rental_quote_table(self, cars, start_date=None, fleet_version=None):
+        """
+        Get the prefix-sum table of daily prices, rebuilt once per day, pricing or fleet change
+        
+        Args:
+            cars (list): The current fleet (car objects with id, base price and category)
+            start_date (date, optional): First day covered (defaults to today)
+            fleet_version (optional): Version of `cars` (e.g. FleetRepository.version);
+                when not given, the table is keyed on every car's id, base
+                price and category instead
+            
+        Returns:
+            RentalQuoteTable: Cumulative prices over quote_horizon_days + max_rental_days
+        """
+        if start_date is None:
+            start_date = datetime.date.today()
+        start_date = datetime.date.fromordinal(start_date.toordinal())
+        if fleet_version is None:
+            fleet_version = tuple((car.get('id'), car['price_per_day'], car['category']) for car in cars)
+        key = (start_date.toordinal(), self.model_version, fleet_version)
+        if self._rental_quote_table is None or self._rental_quote_key != key:
+            forecast = self.generate_fleet_price_forecast(
+                cars, start_date, self.quote_horizon_days + self.max_rental_days)
+            price_inputs = {car.get('id'): (car['price_per_day'], car['category']) for car in cars}
+            self._rental_quote_table = RentalQuoteTable(forecast["car_ids"], start_date, forecast["prices"],
+                                                        price_inputs)
+            self._rental_quote_key = key
+        return self._rental_quote_table
+    
+    def get_rental_discount(self, days):
+        """
+        Get the length-of-rental discount rate
+        
+        Args:
+            days (int): Rental length
+            
+        Returns:
+            float: Discount rate (0.1 = 10%)
+        """
+        for min_days, discount in self.rental_discount_tiers:
+            if days >= min_days:
+                return discount
+        return 0.0
+    
+    def quote_rental(self, car, start_date, days, cars=None, fleet_version=None):
+        """
+        Quote a multi-day rental
+        
+        The total is the sum of the car's dynamic daily prices over
+        [start_date, start_date + days), read from the prefix-sum table in
+        O(1) when the rental lies in the quote horizon, with the weekly or
+        monthly discount applied on top.
+        
+        Args:
+            car (dict): The car object containing id, base price and category
+            start_date (date): First rental day
+            days (int): Rental length (1 to max_rental_days)
+            cars (list, optional): The current fleet, used to build the shared
+                table (without it, the daily prices are summed from the quote cache)
+            fleet_version (optional): Version of `cars`, see rental_quote_table
+            
+        Returns:
+            dict: Rental dates, subtotal, discount and total price
+        """
+        if not 1 <= days <= self.max_rental_days:
+            raise ValueError(f"Rental length must be between 1 and {self.max_rental_days} days")
+        
+        table = self.rental_quote_table(cars, fleet_version=fleet_version) if cars is not None else None
+        car_id = car.get('id')
+        # The table row must have been priced from this car's current inputs
+        if (table is not None and table.covers(car_id, start_date, days)
+                and table.price_inputs.get(car_id) == (car['price_per_day'], car['category'])):
+            subtotal = table.total(car['id'], start_date, days)
+        else:
+            subtotal = round(sum(self.get_car_price(car, start_date + timedelta(days=i)) for i in range(days)), 2)
+        
+        discount_rate = self.get_rental_discount(days)
+        discount = round(subtotal * discount_rate, 2)
+        total = round(subtotal - discount, 2)
+        return {
+            "car_id": car.get('id'),
+            "start_date": start_date.strftime('%Y-%m-%d'),
+            "end_date": (start_date + timedelta(days=days)).strftime('%Y-%m-%d'),
+            "days": days,
+            "subtotal": subtotal,
+            "discount_percent": round(discount_rate * 100, 1),
+            "discount": discount,
+            "total": total,
+            "average_daily_price": round(total / days, 2)
+        }
+    
+    def quote_rentals(self, cars, rentals, fleet_version=None):
+        """
+        Quote many rentals (e.g. cars x date ranges on the search page) at once
+        
+        Args:
+            cars (list): The current fleet
+            rentals (list): (car_id, start_date, days) tuples, all inside the quote horizon
+            fleet_version (optional): Version of `cars`, see rental_quote_table
+            
+        Returns:
+            numpy.ndarray: Discounted total of each rental
+        """
+        if not rentals:
+            return np.zeros(0)
+        car_ids, start_dates, days = zip(*rentals)
+        days = np.asarray(days, dtype=np.int64)
+        if days.min() < 1 or days.max() > self.max_rental_days:
+            raise ValueError(f"Rental length must be between 1 and {self.max_rental_days} days")
+        
+        subtotals = self.rental_quote_table(cars, fleet_version=fleet_version).totals(car_ids, start_dates, days)
+        discount_rates = np.zeros(len(days))
+        # Tiers are longest first, so apply them from the shortest up
+        for min_days, discount in reversed(self.rental_discount_tiers):
+            discount_rates[days >= min_days] = discount
+        return round_cents(subtotals - round_cents(subtotals * discount_rates))
+    
     def generate_price_forecast(self, car, days=14):
         """
         Generate a price forecast for a car for the specified number of days
@@ -140,21 +568,94 @@ class SmartPricing:
         Returns:
             list: A list of price predictions for each day
         """
-        base_price = car['price_per_day']
         category = car['category']
         today = datetime.datetime.now()
         
         forecast = []
         for i in range(days):
             future_date = today + timedelta(days=i)
-            price = self.get_dynamic_price(base_price, future_date, category)
+            demand_factor = self.calculate_demand_factor(future_date, category)
+            price = self.get_car_price(car, future_date)
             
             forecast.append({
                 "date": future_date.strftime('%Y-%m-%d'),
                 "price": price,
                 "is_weekend": self.is_weekend(future_date),
                 "is_holiday": self.is_holiday(future_date),
-                "demand_factor": round(self.calculate_demand_factor(future_date, category), 2)
+                "demand_factor": round(demand_factor, 2)
+            })
+            
+        return forecast
+    
+    def generate_fleet_price_forecast(self, cars, start_date=None, days=14):
+        """
+        Generate a (cars x days) price forecast for a whole fleet with NumPy
+        
+        Applies the same factors, in the same order, as get_dynamic_price,
+        but from arrays: calendar features by day, and demand factors per
+        (category, day) fetched once per category and broadcast to its cars.
+        
+        Args:
+            cars (list): Car objects containing base price and category
+            start_date (datetime, optional): First forecast day (defaults to today)
+            days (int): Number of days to forecast
+            
+        Returns:
+            dict: dates (list of YYYY-MM-DD), car_ids (list), prices and
+            demand_factors (cars x days arrays), is_weekend and is_holiday
+            (per-day boolean arrays)
+        """
+        if start_date is None:
+            start_date = datetime.datetime.now()
+        dates = [start_date + timedelta(days=i) for i in range(days)]
+        
+        # Per-day features (a slice of the calendar table)
+        features = self.calendar.range(start_date, days)
+        is_weekend = features["weekday"] >= 5
+        is_holiday = features["is_holiday"].copy()
+        
+        # Demand per (category, day), expanded to one row per car
+        categories = {}
+        category_codes = np.fromiter((categories.setdefault(car['category'], len(categories)) for car in cars),
+                                     dtype=np.int64, count=len(cars))
+        category_demand = self.demand_model.demand_factors(dates, list(categories))
+        demand_factors = category_demand[category_codes]
+        demand_multiplier = np.where(demand_factors > 1.1, self.high_demand_multiplier,
+                                     np.where(demand_factors < 0.9, self.low_demand_multiplier, 1.0))
+        
+        base_prices = np.fromiter((car['price_per_day'] for car in cars), dtype=float, count=len(cars))
+        prices = base_prices[:, None] * features["multiplier"][None, :]
+        prices *= demand_multiplier
+        
+        return {
+            "dates": [d.strftime('%Y-%m-%d') for d in dates],
+            "car_ids": [car.get('id') for car in cars],
+            "prices": round_cents(prices),
+            "demand_factors": demand_factors,
+            "is_weekend": is_weekend,
+            "is_holiday": is_holiday
+        }
+    
+    def generate_date_forecast(self, days=14):
+        """
+        Generate a fleet-wide calendar outlook for the specified number of days
+        
+        Args:
+            days (int): Number of days to forecast
+            
+        Returns:
+            list: Date, weekend/holiday flags and category-neutral demand factor per day
+        """
+        today = datetime.datetime.now()
+        
+        forecast = []
+        for i in range(days):
+            future_date = today + timedelta(days=i)
+            forecast.append({
+                "date": future_date.strftime('%Y-%m-%d'),
+                "is_weekend": self.is_weekend(future_date),
+                "is_holiday": self.is_holiday(future_date),
+                "demand_factor": round(self.calculate_demand_factor(future_date, None), 2)
             })
             
         return forecast
@@ -167,43 +668,131 @@ class SmartPricing:
             car (dict): The car object containing price and category
             
         Returns:
-            dict: Price adjustments for different scenarios
+            dict: Price adjustments for different scenarios (cached per car
+            and shared between callers, so it must not be modified)
         """
         base_price = car['price_per_day']
+        car_id = car.get('id')
+        key = (car_id, "adjustments", base_price, self.model_version)
+        if car_id is not None:
+            adjustments = self.quote_cache.get(key)
+            if adjustments is not None:
+                return adjustments
         
-        return {
+        adjustments = {
             "base_price": base_price,
             "weekend_price": round(base_price * self.weekend_multiplier, 2),
             "holiday_price": round(base_price * self.holiday_multiplier, 2),
             "low_demand_price": round(base_price * self.low_demand_multiplier, 2),
             "high_demand_price": round(base_price * self.high_demand_multiplier, 2)
         }
+        if car_id is not None:
+            self.quote_cache.set(key, adjustments)
+        return adjustments
 
-    def get_optimal_booking_time(self, car_category, target_date, days_range=30):
+    # Savings are relative, so best-day searches price a reference car per category
+    REFERENCE_BASE_PRICE = 100.0
+    
+    def _category_price_curves(self, categories, start_date, days):
+        """Forecast daily prices of a reference car per category: (categories x days) array"""
+        reference_cars = [{"id": None, "category": category, "price_per_day": self.REFERENCE_BASE_PRICE}
+                          for category in categories]
+        return self.generate_fleet_price_forecast(reference_cars, start_date, days)["prices"]
+    
+    def _booking_summary(self, target_date, prices, days_range):
+        """
+        Cheapest day on a forecast price curve, with savings against the target date
+        
+        Args:
+            target_date (date): The target rental date
+            prices (numpy.ndarray): Forecast prices from the first day of the
+                look-back window up to and including the target date
+            days_range (int): Length of the full look-back window
+        """
+        # Scan from the target date backwards so ties keep the later day
+        days_earlier = int(np.argmin(prices[::-1]))
+        target_price = prices[-1]
+        best_price = prices[-1 - days_earlier]
+        start_date = target_date - timedelta(days=days_earlier)
+        return {
+            "recommended_start_date": start_date.strftime('%Y-%m-%d'),
+            "days_earlier": days_earlier,
+            "expected_savings_percent": round(float((target_price - best_price) / target_price * 100), 1),
+            # Forecasts further ahead are less certain
+            "confidence_score": int(round(95 - 25 * days_earlier / days_range)) if days_range else 95
+        }
+    
+    def get_optimal_booking_time(self, car_category, target_date, days_range=30, today=None):
         """
         Predicts the best time to book a car for the best price
         
+        Evaluates the forecast price curve (the prices get_car_price and
+        quote_rental charge) for every day of the look-back window in one
+        vectorized forecast, and picks the cheapest day to start the rental.
+        Days before today are not considered.
+        
         Args:
             car_category (str): The category of car
             target_date (datetime): The target rental date
             days_range (int): How many days to look back from target date
+            today (date, optional): First possible rental day (defaults to today)
             
         Returns:
-            dict: Best booking time and expected savings
+            dict: Best day to start the rental (recommended_start_date, and
+            days_earlier than the target date), expected savings against the
+            target date and confidence score
         """
-        # In a real implementation, this would use ML models trained on historical price data
-        # This is a simplified version that returns random but plausible results
+        if today is None:
+            today = datetime.date.today()
+        target_date = datetime.date.fromordinal(target_date.toordinal())
+        window = min(days_range, max(0, target_date.toordinal() - today.toordinal()))
         
-        days_before = random.randint(7, days_range)
-        booking_date = target_date - timedelta(days=days_before)
-        expected_savings = random.uniform(5, 15)
+        prices = self._category_price_curves([car_category], target_date - timedelta(days=window), window + 1)
+        return self._booking_summary(target_date, prices[0], days_range)
+    
+    def get_booking_outlook(self, categories, days=7, days_range=30, start_date=None):
+        """
+        Best booking times for every category and each of the next rental dates
         
-        return {
-            "recommended_booking_date": booking_date.strftime('%Y-%m-%d'),
-            "days_before_rental": days_before,
-            "expected_savings_percent": round(expected_savings, 1),
-            "confidence_score": random.randint(70, 95)
-        }
+        Forecasts one price curve per category over the next `days` days and
+        reads each target date's look-back window from it; the result is
+        cached per start date, parameters and model version.
+        
+        Args:
+            categories (list): Car categories
+            days (int): Number of target rental dates, starting at start_date
+            days_range (int): How many days to look back from each target date
+            start_date (date, optional): First target date, and first possible
+                rental day (defaults to today)
+            
+        Returns:
+            dict: category -> list of get_optimal_booking_time results (with
+            an added target_date) for each target date
+        """
+        if start_date is None:
+            start_date = datetime.date.today()
+        start_date = datetime.date.fromordinal(start_date.toordinal())
+        key = (start_date.toordinal(), days, days_range, tuple(categories),
+               self.model_version)
+        outlook = self.booking_outlook_cache.get(key)
+        if outlook is not None:
+            return outlook
+        
+        # Rental days before start_date are in the past, so one curve from start_date covers every window
+        prices = self._category_price_curves(categories, start_date, days)
+        
+        outlook = {}
+        for c, category in enumerate(categories):
+            rows = []
+            for j in range(days):
+                target_date = start_date + timedelta(days=j)
+                window = min(days_range, j)
+                summary = self._booking_summary(target_date, prices[c, j - window:j + 1], days_range)
+                rows.append({"target_date": target_date.strftime('%Y-%m-%d'), **summary})
+            outlook[category] = rows
+        
+        self.booking_outlook_cache.set(key, outlook)
+        return outlook
 
 # For testing purposes
 if __name__ == "__main__":
@@ -6,26 +6,181 @@ It analyzes user input, historical user data (when available), and car character
 to provide personalized vehicle recommendations.
 """
 
+import bisect
 import numpy as np
 from datetime import datetime
 import json
 import logging
 
+from ai_modules.cache import LRUCache
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+
+def top_k_indices(scores, k):
+    """
+    Return the indices of the k highest scores, best first.
+    
+    Uses argpartition so only the k candidates are sorted, rather than the
+    whole array. Ties are broken by position (lower index first), which gives
+    the same order as a stable descending sort followed by [:k].
+    
+    Args:
+        scores (numpy.ndarray): 1-D array of scores
+        k (int): Number of indices to return
+        
+    Returns:
+        numpy.ndarray: Indices into scores, ordered by descending score
+    """
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= n:
+        return np.argsort(-scores, kind='stable')
+    
+    # Value of the k-th best score; everything above it is in, ties are
+    # filled in by position so the result is deterministic
+    threshold = scores[np.argpartition(-scores, k - 1)[k - 1]]
+    above = np.flatnonzero(scores > threshold)
+    ties = np.flatnonzero(scores == threshold)[:k - len(above)]
+    candidates = np.concatenate((above, ties))
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+class UserHistoryProfile:
+    """
+    Aggregates of a user's rental history used for the history bonus.
+    
+    Keeps per-category rental counts and rating sums, and per-car rating
+    sums, so the bonus for a car is a couple of dict lookups instead of a
+    scan over the whole history. Build it once per request, or keep one per
+    user and call add_rental() as new rentals are recorded.
+    """
+    
+    def __init__(self, user_history=None):
+        """
+        Initialize the profile from an existing rental history.
+        
+        Args:
+            user_history (list, optional): User's rental history (list of rental dicts)
+        """
+        self.rental_count = 0
+        self.category_counts = {}
+        self.category_ratings = {}  # category -> [rating sum, rating count]
+        self.car_ratings = {}       # car_id -> [rating sum, rating count]
+        
+        for rental in user_history or []:
+            self.add_rental(rental)
+    
+    def __len__(self):
+        return self.rental_count
+    
+    def add_rental(self, rental):
+        """
+        Add one rental to the aggregates.
+        
+        Args:
+            rental (dict): Rental record (category, car_id, optional rating)
+        """
+        self.rental_count += 1
+        category = rental.get('category')
+        self.category_counts[category] = self.category_counts.get(category, 0) + 1
+        
+        if 'rating' in rental:
+            rating = rental.get('rating', 0)
+            totals = self.category_ratings.setdefault(category, [0, 0])
+            totals[0] += rating
+            totals[1] += 1
+            totals = self.car_ratings.setdefault(rental.get('car_id'), [0, 0])
+            totals[0] += rating
+            totals[1] += 1
+    
+    def category_bonus(self, category):
+        """
+        Bonus for a category the user has rented before (and liked).
+        
+        Args:
+            category (str): Car category
+            
+        Returns:
+            float: Category part of the history bonus
+        """
+        bonus = 0
+        if self.category_counts.get(category):
+            # User has rented this category before
+            bonus += 0.05
+            
+            # Check ratings they gave for this category
+            totals = self.category_ratings.get(category)
+            if totals:
+                avg_rating = totals[0] / totals[1]
+                if avg_rating >= 4:  # They liked this category
+                    bonus += 0.05
+        return bonus
+    
+    def car_bonus(self, car_id):
+        """
+        Bonus (or penalty) for a specific car the user has rated before.
+        
+        Args:
+            car_id: Car identifier
+            
+        Returns:
+            float: Car part of the history bonus
+        """
+        totals = self.car_ratings.get(car_id)
+        if totals:
+            avg_car_rating = totals[0] / totals[1]
+            if avg_car_rating >= 4:  # They liked this car
+                return 0.10
+            elif avg_car_rating < 3:  # They didn't like this car
+                return -0.15
+        return 0
+    
+    def bonus(self, car):
+        """
+        Total history bonus for a car.
+        
+        Args:
+            car (dict): Car information
+            
+        Returns:
+            float: History bonus score
+        """
+        bonus = self.category_bonus(car['category'])
+        car_bonus = self.car_bonus(car['id'])
+        if car_bonus:
+            bonus += car_bonus
+        return bonus
+
 class CarRecommendationEngine:
     """AI engine for generating personalized car recommendations."""
     
-    def __init__(self, car_data):
+    # Largest bonus _calculate_history_bonus can give (0.05 + 0.05 + 0.10)
+    MAX_HISTORY_BONUS = 0.20
+    
+    # Upper bound on (profiles x cars) cells scored at once by get_recommendations_batch
+    BATCH_MAX_CELLS = 2_000_000
+    
+    # Preference fields that affect the ranking and explanation
+    PREFERENCE_KEYS = ('category', 'max_price', 'seats', 'transmission')
+    
+    # Value types accepted for preference fields (form values are strings, JSON adds numbers)
+    PREFERENCE_VALUE_TYPES = (str, int, float, bool, type(None))
+    
+    def __init__(self, car_data, cache_size=1024, cache_ttl=300):
         """
         Initialize the recommendation engine with available car data.
         
         Args:
             car_data (list): List of car dictionaries containing vehicle information
+            cache_size (int): Maximum number of cached results (0 disables the cache)
+            cache_ttl (float): Seconds a cached result stays valid
         """
         self.car_data = car_data
+        self.fleet_version = 0
+        self.cache = LRUCache(maxsize=cache_size, ttl=cache_ttl) if cache_size > 0 else None
         self.feature_weights = {
             'category_match': 0.35,
             'price_match': 0.25,
@@ -33,42 +188,486 @@ class CarRecommendationEngine:
             'transmission_match': 0.10,
             'rating': 0.10
         }
+        self._build_fleet_arrays()
+        self._build_indexes()
         logger.info("Recommendation engine initialized with %d vehicles", len(car_data))
     
+    def refresh(self, car_data=None):
+        """
+        Rebuild fleet arrays and indexes after the fleet data changed.
+        
+        Bumps fleet_version and clears the result cache so no ranking
+        computed for the old fleet is served again.
+        
+        Args:
+            car_data (list, optional): New car list (defaults to the current one,
+                e.g. after it was modified in place)
+        """
+        if car_data is not None:
+            self.car_data = car_data
+        self._build_fleet_arrays()
+        self._build_indexes()
+        self.fleet_version += 1
+        if self.cache is not None:
+            self.cache.clear()
+        logger.info("Recommendation engine refreshed with %d vehicles", len(self.car_data))
+    
+    def upsert_car(self, car):
+        """
+        Apply a single added or updated car.
+        
+        Price and rating changes (the common case) are patched into the
+        arrays and the price index; anything else triggers a refresh. The
+        caller's car list is never modified.
+        
+        Args:
+            car (dict): Car information
+        """
+        positions = self.id_positions.get(car['id'], [])
+        if len(positions) != 1:
+            # New (or duplicated) id: rebuild with the car appended/replaced
+            car_data = [c for c in self.car_data if c['id'] != car['id']] + [car]
+            self.refresh(car_data)
+            return
+        
+        i = positions[0]
+        old = self.car_data[i]
+        if (old['category'] != car['category'] or old['transmission'] != car['transmission']
+                or old['seats'] != car['seats']):
+            car_data = list(self.car_data)
+            car_data[i] = car
+            self.refresh(car_data)
+            return
+        
+        self.car_data = list(self.car_data)
+        self.car_data[i] = car
+        
+        # Move the car within the price index
+        old_price, new_price = self.prices[i], float(car['price_per_day'])
+        lo = np.searchsorted(self.sorted_prices, old_price, side='left')
+        hi = np.searchsorted(self.sorted_prices, old_price, side='right')
+        k = lo + int(np.flatnonzero(self.price_order[lo:hi] == i)[0])
+        price_order = np.delete(self.price_order, k)
+        sorted_prices = np.delete(self.sorted_prices, k)
+        k = np.searchsorted(sorted_prices, new_price, side='right')
+        self.price_order = np.insert(price_order, k, i)
+        self.sorted_prices = np.insert(sorted_prices, k, new_price)
+        
+        # Copy-on-write so requests already scoring keep a consistent view
+        prices, ratings, has_rating = self.prices.copy(), self.ratings.copy(), self.has_rating.copy()
+        prices[i] = new_price
+        ratings[i] = car.get('rating', 0.0)
+        has_rating[i] = 'rating' in car
+        self.prices, self.ratings, self.has_rating = prices, ratings, has_rating
+        
+        rated = self.ratings[self.has_rating]
+        self.max_rating = max(0.0, float(rated.max()) / 5.0) if len(rated) else 0.0
+        
+        self.fleet_version += 1
+        if self.cache is not None:
+            self.cache.clear()
+    
+    def remove_car(self, car_id):
+        """
+        Remove a car from the engine.
+        
+        Args:
+            car_id: Car identifier
+        """
+        self.refresh([c for c in self.car_data if c['id'] != car_id])
+    
+    def _cache_key(self, preferences, limit):
+        """
+        Build a normalized cache key for a preference set.
+        
+        Only fields used for scoring or the explanation are kept, so form
+        field order and unrelated fields do not fragment the cache. Empty
+        category, seats and transmission values behave like missing ones and
+        share a key; max_price is kept as-is since a missing budget defaults
+        to 1000 while an empty one is ignored.
+        
+        Args:
+            preferences (dict): User preferences
+            limit (int): Maximum number of recommendations
+            
+        Returns:
+            tuple: Hashable cache key
+        """
+        values = []
+        for key in self.PREFERENCE_KEYS:
+            value = preferences.get(key)
+            if key != 'max_price' and not value:
+                value = None
+            values.append(value if value is None else str(value))
+        return (self.fleet_version, limit, tuple(values))
+    
+    def _build_fleet_arrays(self):
+        """
+        Build a columnar (NumPy) view of the fleet for vectorized scoring.
+        
+        Categories and transmissions are stored as integer codes so that a
+        preference match becomes a single array comparison. Cars without a
+        rating get no rating contribution, exactly like the scalar scorer.
+        """
+        cars = self.car_data
+        n = len(cars)
+        
+        self.prices = np.fromiter((car['price_per_day'] for car in cars), dtype=float, count=n)
+        self.seats = np.fromiter((car['seats'] for car in cars), dtype=np.int64, count=n)
+        self.ratings = np.fromiter((car.get('rating', 0.0) for car in cars), dtype=float, count=n)
+        self.has_rating = np.fromiter(('rating' in car for car in cars), dtype=bool, count=n)
+        
+        self.id_positions = {}
+        for i, car in enumerate(cars):
+            self.id_positions.setdefault(car['id'], []).append(i)
+        
+        self.category_codes, self.category_lookup = self._encode_column(cars, 'category')
+        self.transmission_codes, self.transmission_lookup = self._encode_column(cars, 'transmission')
+    
+    @staticmethod
+    def _encode_column(cars, key):
+        """
+        Encode a string column as integer codes.
+        
+        Args:
+            cars (list): List of car dictionaries
+            key (str): Column to encode
+            
+        Returns:
+            tuple: (codes array, dict mapping value -> code)
+        """
+        lookup = {}
+        codes = np.empty(len(cars), dtype=np.int64)
+        for i, car in enumerate(cars):
+            codes[i] = lookup.setdefault(car.get(key), len(lookup))
+        return codes, lookup
+    
+    def _parse_preferences(self, preferences):
+        """
+        Parse raw (usually string) preferences once per request.
+        
+        Invalid numeric values are returned as None so the matching criterion
+        is skipped, mirroring the try/except blocks in _calculate_match_score.
+        
+        Args:
+            preferences (dict): User preferences
+            
+        Returns:
+            dict: Parsed category, max_price, seats and transmission
+        """
+        try:
+            max_price = float(preferences.get('max_price', 1000))
+        except (ValueError, TypeError):
+            max_price = None
+        
+        try:
+            seats_needed = int(preferences.get('seats', 0))
+        except (ValueError, TypeError):
+            seats_needed = None
+        
+        return {
+            'category': preferences.get('category'),
+            'max_price': max_price,
+            'seats': seats_needed,
+            'transmission': preferences.get('transmission')
+        }
+    
+    def _build_indexes(self):
+        """
+        Build in-memory indexes used to pre-filter candidates before scoring.
+        
+        - category -> positions of cars in that category
+        - positions sorted by price, with the sorted prices for binary search
+        - seat buckets: seat count -> positions, plus the sorted seat counts
+        """
+        self.category_index = {category: np.flatnonzero(self.category_codes == code)
+                               for category, code in self.category_lookup.items()}
+        
+        self.price_order = np.argsort(self.prices, kind='stable')
+        self.sorted_prices = self.prices[self.price_order]
+        
+        self.seat_buckets = {int(seats): np.flatnonzero(self.seats == seats)
+                             for seats in np.unique(self.seats)}
+        self.seat_values = sorted(self.seat_buckets)
+        
+        # Highest possible normalized rating, used to bound scores of skipped cars
+        rated = self.ratings[self.has_rating]
+        self.max_rating = max(0.0, float(rated.max()) / 5.0) if len(rated) else 0.0
+    
+    def _select_candidates(self, parsed):
+        """
+        Intersect the category, price and seat indexes for parsed preferences.
+        
+        Args:
+            parsed (dict): Preferences returned by _parse_preferences
+            
+        Returns:
+            numpy.ndarray or None: Sorted car positions matching every active
+            filter, or None when no filter applies (full scan needed)
+        """
+        if not len(self.car_data):
+            return None
+        
+        index_sets = []
+        
+        if parsed['category'] and parsed['category'] in self.category_index:
+            index_sets.append(self.category_index[parsed['category']])
+        
+        max_price = parsed['max_price']
+        if max_price is not None:
+            if not max_price > 0:
+                # Zero, negative or NaN budgets are left to the full scan
+                return None
+            cutoff = np.searchsorted(self.sorted_prices, max_price, side='right')
+            index_sets.append(self.price_order[:cutoff])
+        
+        seats_needed = parsed['seats']
+        if seats_needed is not None and seats_needed > 0:
+            buckets = [self.seat_buckets[seats]
+                       for seats in self.seat_values[bisect.bisect_left(self.seat_values, seats_needed):]]
+            index_sets.append(np.concatenate(buckets) if buckets else np.empty(0, dtype=np.intp))
+        
+        if not index_sets:
+            return None
+        
+        # Start from the smallest set and check the other filters directly
+        candidates = min(index_sets, key=len)
+        if parsed['category'] in self.category_index:
+            candidates = candidates[self.category_codes[candidates] == self.category_lookup[parsed['category']]]
+        if max_price is not None:
+            candidates = candidates[self.prices[candidates] <= max_price]
+        if seats_needed is not None and seats_needed > 0:
+            candidates = candidates[self.seats[candidates] >= seats_needed]
+        
+        return np.sort(candidates)
+    
+    def _skipped_score_bound(self, parsed, user_history=None):
+        """
+        Upper bound on the score of any car left out by _select_candidates.
+        
+        A skipped car is either over budget, short on seats, or outside the
+        preferred category, so it loses at least one of those terms.
+        
+        Args:
+            parsed (dict): Preferences returned by _parse_preferences
+            user_history (list or UserHistoryProfile, optional): User's rental history
+            
+        Returns:
+            float: Maximum possible score (0-1+) of a non-candidate car
+        """
+        weights = self.feature_weights
+        category_filter = parsed['category'] in self.category_index
+        price_filter = parsed['max_price'] is not None
+        seats_filter = parsed['seats'] is not None and parsed['seats'] > 0
+        
+        category_max = weights['category_match'] if category_filter else 0.0
+        price_max = 0.0
+        if price_filter:
+            value_bonus = (1 - (self.sorted_prices[0] / parsed['max_price'])) * 0.5
+            price_max = weights['price_match'] * (1 + value_bonus)
+        seats_max = weights['seats_match'] if seats_filter else 0.0
+        
+        # Best case for each way of missing the candidate set
+        missed = []
+        if price_filter:
+            missed.append(category_max - weights['price_match'] + seats_max)
+        if seats_filter:
+            missed.append(category_max + price_max - weights['seats_match'])
+        if category_filter:
+            missed.append(price_max + seats_max)
+        
+        bound = max(missed)
+        if parsed['transmission'] in self.transmission_lookup:
+            bound += weights['transmission_match']
+        bound += weights['rating'] * self.max_rating
+        if user_history:
+            bound += self.MAX_HISTORY_BONUS
+        return bound
+    
+    def _score_fleet(self, preferences, user_history=None, positions=None):
+        """
+        Calculate match scores for the fleet in a single vectorized pass.
+        
+        Uses the same weights and rules as _calculate_match_score, so
+        scores[i] equals _calculate_match_score(car_data[i], ...).
+        
+        Args:
+            preferences (dict): User preferences
+            user_history (list or UserHistoryProfile, optional): User's rental history
+            positions (numpy.ndarray, optional): Only score the cars at these positions
+            
+        Returns:
+            numpy.ndarray: Match scores (0-1+) aligned with self.car_data,
+            or with positions when given
+        """
+        if user_history and not isinstance(user_history, UserHistoryProfile):
+            user_history = UserHistoryProfile(user_history)
+        return self._score_columns(self._parse_preferences(preferences), user_history, positions)
+    
+    def _score_columns(self, parsed, user_history=None, positions=None):
+        """Vectorized scorer behind _score_fleet, taking parsed preferences and a UserHistoryProfile."""
+        weights = self.feature_weights
+        
+        if positions is None:
+            prices, seats, ratings, has_rating = self.prices, self.seats, self.ratings, self.has_rating
+            category_codes, transmission_codes = self.category_codes, self.transmission_codes
+        else:
+            prices, seats, ratings, has_rating = (self.prices[positions], self.seats[positions],
+                                                  self.ratings[positions], self.has_rating[positions])
+            category_codes, transmission_codes = self.category_codes[positions], self.transmission_codes[positions]
+        
+        scores = np.zeros(len(prices))
+        
+        # Category match
+        if parsed['category']:
+            code = self.category_lookup.get(parsed['category'])
+            if code is not None:
+                scores += np.where(category_codes == code, weights['category_match'], 0.0)
+        
+        # Price match (within budget), with a value bonus for cheaper cars
+        max_price = parsed['max_price']
+        if max_price is not None:
+            within_budget = prices <= max_price
+            with np.errstate(divide='ignore', invalid='ignore'):
+                value_bonus = (1 - (prices / max_price)) * 0.5
+            scores += np.where(within_budget,
+                               weights['price_match'] * (1 + value_bonus),
+                               -weights['price_match'])
+        
+        # Seats match
+        seats_needed = parsed['seats']
+        if seats_needed is not None and seats_needed > 0:
+            seat_score = np.where(seats <= seats_needed + 2,
+                                  weights['seats_match'],
+                                  weights['seats_match'] * 0.8)
+            scores += np.where(seats >= seats_needed, seat_score, -weights['seats_match'])
+        
+        # Transmission preference
+        if parsed['transmission']:
+            code = self.transmission_lookup.get(parsed['transmission'])
+            if code is not None:
+                scores += np.where(transmission_codes == code, weights['transmission_match'], 0.0)
+        
+        # Rating factor
+        scores += np.where(has_rating, weights['rating'] * (ratings / 5.0), 0.0)
+        
+        # History bonus
+        if user_history:
+            scores += self._history_bonus_column(user_history, category_codes, positions)
+        
+        return np.maximum(scores, 0)
+    
+    def _history_bonus_column(self, profile, category_codes, positions=None):
+        """
+        History bonus for each scored car, from a UserHistoryProfile.
+        
+        The category part is one lookup per category code; the per-car part
+        only touches cars the user has rated.
+        
+        Args:
+            profile (UserHistoryProfile): Aggregated rental history
+            category_codes (numpy.ndarray): Category codes of the scored cars
+            positions (numpy.ndarray, optional): Sorted positions of the scored cars
+            
+        Returns:
+            numpy.ndarray: History bonus per scored car
+        """
+        category_bonus = np.zeros(len(self.category_lookup))
+        for category, code in self.category_lookup.items():
+            category_bonus[code] = profile.category_bonus(category)
+        bonus = category_bonus[category_codes]
+        
+        for car_id in profile.car_ratings:
+            car_bonus = profile.car_bonus(car_id)
+            if not car_bonus:
+                continue
+            for i in self.id_positions.get(car_id, ()):
+                if positions is not None:
+                    j = np.searchsorted(positions, i)
+                    if j == len(positions) or positions[j] != i:
+                        continue
+                    i = j
+                bonus[i] += car_bonus
+        return bonus
+    
+    def _rank(self, preferences, user_history=None, limit=3):
+        """
+        Find the best `limit` cars, scoring only pre-filtered candidates when possible.
+        
+        Candidates come from _select_candidates. Their ranking is used only if
+        the last one kept still beats every skipped car (_skipped_score_bound);
+        otherwise, or when too few candidates remain, the whole fleet is scored.
+        Either way the result matches a full scan.
+        
+        Args:
+            preferences (dict): User preferences
+            user_history (list or UserHistoryProfile, optional): User's rental history
+            limit (int): Maximum number of cars to return
+            
+        Returns:
+            tuple: (car positions, match percentages), best first
+        """
+        if limit <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        
+        if user_history and not isinstance(user_history, UserHistoryProfile):
+            user_history = UserHistoryProfile(user_history)
+        
+        parsed = self._parse_preferences(preferences)
+        candidates = self._select_candidates(parsed)
+        
+        if candidates is not None and len(candidates) >= limit:
+            match_scores = np.minimum(self._score_columns(parsed, user_history, candidates) * 100, 100)
+            top = top_k_indices(match_scores, limit)
+            bound = min(self._skipped_score_bound(parsed, user_history) * 100, 100)
+            if match_scores[top[-1]] > bound + 1e-9:
+                return candidates[top], match_scores[top]
+        
+        match_scores = np.minimum(self._score_columns(parsed, user_history) * 100, 100)
+        top = top_k_indices(match_scores, limit)
+        return top, match_scores[top]
+    
     def get_recommendations(self, preferences, user_history=None, limit=3):
         """
         Generate personalized car recommendations based on user preferences.
         
         Args:
             preferences (dict): User preferences (category, price range, seats, etc.)
-            user_history (list, optional): User's rental history for improved recommendations
+            user_history (list or UserHistoryProfile, optional): User's rental history for improved recommendations
             limit (int): Maximum number of recommendations to return
             
         Returns:
-            dict: Recommendations with explanation
+            dict: Recommendations with explanation. Results served from the
+            cache are shared between callers and must not be modified.
         """
+        # Results without user history only depend on the preferences
+        use_cache = self.cache is not None and not user_history
+        if use_cache:
+            cache_key = self._cache_key(preferences, limit)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             logger.info("Generating recommendations for preferences: %s", preferences)
             
-            # Calculate match scores for each car
-            scored_cars = []
-            for car in self.car_data:
-                score = self._calculate_match_score(car, preferences, user_history)
-                scored_cars.append({
-                    "car": car,
-                    "match_score": min(score * 100, 100)  # Convert to percentage with max of 100
-                })
-            
-            # Sort by match score (descending)
-            scored_cars.sort(key=lambda x: x['match_score'], reverse=True)
+            # Best `limit` cars as match percentages (descending, ties keep fleet order)
+            positions, match_scores = self._rank(preferences, user_history, limit)
+            scored_cars = [{
+                "car": self.car_data[i],
+                "match_score": float(score)
+            } for i, score in zip(positions, match_scores)]
             
             # Create personalized explanation
-            explanation = self._generate_explanation(preferences, scored_cars[:limit])
+            explanation = self._generate_explanation(preferences, scored_cars)
             
-            return {
-                "recommendations": scored_cars[:limit],
+            result = {
+                "recommendations": scored_cars,
                 "explanation": explanation
             }
+            if use_cache:
+                self.cache.set(cache_key, result)
+            return result
             
         except Exception as e:
             logger.error("Error generating recommendations: %s", str(e))
@@ -77,6 +676,137 @@ class CarRecommendationEngine:
                 "explanation": "We couldn't process your preferences. Please try again."
             }
     
+    def get_recommendations_batch(self, preferences_list, limit=3):
+        """
+        Generate recommendations for many preference sets at once.
+        
+        Scores a (profiles x cars) matrix with the same rules as
+        get_recommendations. Profiles are processed in chunks of at most
+        BATCH_MAX_CELLS matrix cells to keep memory bounded. A malformed
+        profile (not a dict of scalar values) gets the error result without
+        affecting the others.
+        
+        Args:
+            preferences_list (list): List of preference dicts
+            limit (int): Maximum number of recommendations per profile
+            
+        Returns:
+            list: One result dict (recommendations and explanation) per
+            profile, in input order
+        """
+        logger.info("Generating batch recommendations for %d preference sets", len(preferences_list))
+        
+        n_cars = len(self.car_data)
+        chunk_size = max(1, self.BATCH_MAX_CELLS // max(1, n_cars))
+        results = []
+        
+        for start in range(0, len(preferences_list), chunk_size):
+            chunk = preferences_list[start:start + chunk_size]
+            parsed = [self._parse_batch_preferences(p) for p in chunk]
+            valid = [p for p in parsed if p is not None]
+            rows = iter(np.minimum(self._score_matrix(valid) * 100, 100) if valid else ())
+            
+            for preferences, parsed_preferences in zip(chunk, parsed):
+                try:
+                    if parsed_preferences is None:
+                        raise ValueError(f"invalid preference set {preferences!r}")
+                    row = next(rows)
+                    scored_cars = [{
+                        "car": self.car_data[i],
+                        "match_score": float(row[i])
+                    } for i in top_k_indices(row, limit)]
+                    results.append({
+                        "recommendations": scored_cars,
+                        "explanation": self._generate_explanation(preferences, scored_cars, parsed_preferences)
+                    })
+                except Exception as e:
+                    logger.error("Error generating recommendations: %s", str(e))
+                    results.append({
+                        "recommendations": [],
+                        "explanation": "We couldn't process your preferences. Please try again."
+                    })
+        
+        return results
+    
+    def _parse_batch_preferences(self, preferences):
+        """
+        Parse one preference set of a batch, rejecting malformed ones.
+        
+        Args:
+            preferences: Candidate preference set
+            
+        Returns:
+            dict or None: Parsed preferences, or None unless preferences is a
+            dict of scalar values
+        """
+        if not isinstance(preferences, dict) or not all(
+                isinstance(value, self.PREFERENCE_VALUE_TYPES) for value in preferences.values()):
+            return None
+        try:
+            return self._parse_preferences(preferences)
+        except Exception as e:
+            logger.error("Error parsing preferences %r: %s", preferences, str(e))
+            return None
+    
+    def _score_matrix(self, parsed_list):
+        """
+        Score every car against several parsed preference sets at once.
+        
+        Row p equals _score_columns(parsed_list[p]); inactive criteria add
+        nothing, as in the single-profile scorer.
+        
+        Args:
+            parsed_list (list): Preferences returned by _parse_preferences
+            
+        Returns:
+            numpy.ndarray: (len(parsed_list), len(car_data)) match scores (0-1+)
+        """
+        weights = self.feature_weights
+        n_profiles = len(parsed_list)
+        
+        category_wanted = np.fromiter((self.category_lookup.get(p['category'], -1) if p['category'] else -1
+                                       for p in parsed_list), dtype=np.int64, count=n_profiles)
+        transmission_wanted = np.fromiter((self.transmission_lookup.get(p['transmission'], -1) if p['transmission'] else -1
+                                           for p in parsed_list), dtype=np.int64, count=n_profiles)
+        price_active = np.fromiter((p['max_price'] is not None for p in parsed_list), dtype=bool, count=n_profiles)
+        max_prices = np.fromiter((p['max_price'] if p['max_price'] is not None else 1.0
+                                  for p in parsed_list), dtype=float, count=n_profiles)
+        seats_active = np.fromiter((p['seats'] is not None and p['seats'] > 0 for p in parsed_list),
+                                   dtype=bool, count=n_profiles)
+        seats_needed = np.fromiter((p['seats'] if p['seats'] is not None else 0 for p in parsed_list),
+                                   dtype=np.int64, count=n_profiles)
+        
+        # Profiles along axis 0, cars along axis 1
+        scores = np.zeros((n_profiles, len(self.car_data)))
+        
+        # Category match (code -1 never matches)
+        scores += np.where(self.category_codes[None, :] == category_wanted[:, None], weights['category_match'], 0.0)
+        
+        # Price match (within budget), with a value bonus for cheaper cars
+        max_prices = max_prices[:, None]
+        within_budget = self.prices[None, :] <= max_prices
+        with np.errstate(divide='ignore', invalid='ignore'):
+            value_bonus = (1 - (self.prices[None, :] / max_prices)) * 0.5
+        price_score = np.where(within_budget, weights['price_match'] * (1 + value_bonus), -weights['price_match'])
+        scores += np.where(price_active[:, None], price_score, 0.0)
+        
+        # Seats match
+        seats_needed = seats_needed[:, None]
+        seat_score = np.where(self.seats[None, :] <= seats_needed + 2,
+                              weights['seats_match'],
+                              weights['seats_match'] * 0.8)
+        seat_score = np.where(self.seats[None, :] >= seats_needed, seat_score, -weights['seats_match'])
+        scores += np.where(seats_active[:, None], seat_score, 0.0)
+        
+        # Transmission preference
+        scores += np.where(self.transmission_codes[None, :] == transmission_wanted[:, None],
+                           weights['transmission_match'], 0.0)
+        
+        # Rating factor (same for every profile)
+        scores += np.where(self.has_rating, weights['rating'] * (self.ratings / 5.0), 0.0)
+        
+        return np.maximum(scores, 0)
+    
     def _calculate_match_score(self, car, preferences, user_history=None):
         """
         Calculate match score between a car and user preferences.
@@ -84,7 +814,7 @@ class CarRecommendationEngine:
         Args:
             car (dict): Car information
             preferences (dict): User preferences
-            user_history (list, optional): User's rental history
+            user_history (list or UserHistoryProfile, optional): User's rental history
             
         Returns:
             float: Match score (0-1)
@@ -149,57 +879,35 @@ class CarRecommendationEngine:
         
         Args:
             car (dict): Car information
-            user_history (list): User's rental history
+            user_history (list or UserHistoryProfile): User's rental history
             
         Returns:
             float: History bonus score
         """
-        bonus = 0
-        
-        # Check if user has rented similar category before
-        category_rentals = [rental for rental in user_history 
-                          if rental.get('category') == car['category']]
-        if category_rentals:
-            # User has rented this category before
-            bonus += 0.05
-            
-            # Check ratings they gave for this category
-            category_ratings = [rental.get('rating', 0) for rental in category_rentals 
-                              if 'rating' in rental]
-            if category_ratings:
-                avg_rating = sum(category_ratings) / len(category_ratings)
-                if avg_rating >= 4:  # They liked this category
-                    bonus += 0.05
-        
-        # Check if user has rented this specific car before
-        car_rentals = [rental for rental in user_history 
-                     if rental.get('car_id') == car['id']]
-        if car_rentals:
-            # User has rented this specific car before
-            car_ratings = [rental.get('rating', 0) for rental in car_rentals 
-                         if 'rating' in rental]
-            if car_ratings:
-                avg_car_rating = sum(car_ratings) / len(car_ratings)
-                if avg_car_rating >= 4:  # They liked this car
-                    bonus += 0.10
-                elif avg_car_rating < 3:  # They didn't like this car
-                    bonus -= 0.15
-        
-        return bonus
+        if not isinstance(user_history, UserHistoryProfile):
+            user_history = UserHistoryProfile(user_history)
+        return user_history.bonus(car)
     
-    def _generate_explanation(self, preferences, recommendations):
+    def _generate_explanation(self, preferences, recommendations, parsed=None):
         """
         Generate a personalized explanation for the recommendations.
         
+        Invalid budget or seat values are left out of the explanation, just
+        as the scorer ignores them.
+        
         Args:
             preferences (dict): User preferences
             recommendations (list): List of recommended cars with scores
+            parsed (dict, optional): The preferences as returned by
+                _parse_preferences (parsed here when not given)
             
         Returns:
             str: Personalized explanation
         """
         if not recommendations:
             return "No matches found for your preferences."
+        if parsed is None:
+            parsed = self._parse_preferences(preferences)
         
         # Build explanation based on key matching factors
         factors = []
@@ -210,15 +918,15 @@ class CarRecommendationEngine:
             if category_matches:
                 factors.append(f"category ({preferences['category']})")
         
-        if preferences.get('max_price'):
+        if preferences.get('max_price') and parsed['max_price'] is not None:
             budget_matches = [r for r in recommendations 
-                           if r['car']['price_per_day'] <= float(preferences.get('max_price', 0))]
+                           if r['car']['price_per_day'] <= parsed['max_price']]
             if budget_matches:
                 factors.append(f"budget (under ${preferences['max_price']}/day)")
         
-        if preferences.get('seats'):
+        if preferences.get('seats') and parsed['seats'] is not None:
             seat_matches = [r for r in recommendations 
-                         if r['car']['seats'] >= int(preferences.get('seats', 0))]
+                         if r['car']['seats'] >= parsed['seats']]
             if seat_matches:
                 factors.append(f"seating capacity ({preferences['seats']}+ seats)")
         
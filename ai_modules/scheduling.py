@@ -0,0 +1,292 @@
+"""
+Fleet Service Scheduling for Car Rental Website
+This module turns per-car service windows into a fleet-wide service
+calendar that respects daily shop capacity and never takes a car out of
+service while it is booked. The initial plan is an earliest-deadline-first
+sweep over the days with a priority queue; booking and window changes are
+then repaired locally for the affected car instead of re-planning the fleet.
+"""
+
+import bisect
+import datetime
+import heapq
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def service_windows(car_ids, days_until_service, start_date=None, lead_days=7):
+    """
+    Build service windows from predicted days until service.
+
+    Args:
+        car_ids (list): Car identifiers
+        days_until_service (array-like): Days until each car is due, e.g. from
+            PredictiveMaintenance.calculate_days_until_service_batch
+        start_date (date, optional): Day the prediction was made (defaults to today)
+        lead_days (int): How many days before the due date a car may be serviced
+
+    Returns:
+        dict: car_id -> (earliest date, due date)
+    """
+    if start_date is None:
+        start_date = datetime.date.today()
+    windows = {}
+    for car_id, days in zip(car_ids, days_until_service):
+        due = start_date + datetime.timedelta(days=int(days))
+        windows[car_id] = (max(start_date, due - datetime.timedelta(days=lead_days)), due)
+    return windows
+
+
+class ServiceScheduler:
+    """Capacity- and booking-aware service calendar for the whole fleet."""
+
+    def __init__(self, daily_capacity, capacity_overrides=None, horizon_days=365):
+        """
+        Initialize the scheduler.
+
+        Args:
+            daily_capacity (int): Cars the shop can service per day
+            capacity_overrides (dict, optional): date -> capacity for specific
+                days (e.g. 0 on public holidays)
+            horizon_days (int): How far past its window a car may be pushed
+                before it is reported as unscheduled
+        """
+        self.daily_capacity = daily_capacity
+        self.capacity_overrides = {day.toordinal(): capacity
+                                   for day, capacity in (capacity_overrides or {}).items()}
+        self.horizon_days = horizon_days
+        self.start = None          # Ordinal of the first schedulable day
+        self.windows = {}          # car_id -> (earliest ordinal, due ordinal)
+        self.bookings = {}         # car_id -> (sorted starts, ends) of booked intervals
+        self.assignments = {}      # car_id -> service day ordinal
+        self.load = {}             # day ordinal -> cars serviced that day
+        self.unscheduled = set()   # Cars with no feasible day within the horizon
+
+    # Capacity and bookings
+
+    def capacity(self, day):
+        """Service capacity of a day (ordinal)."""
+        return self.capacity_overrides.get(day, self.daily_capacity)
+
+    def _has_room(self, day):
+        return self.load.get(day, 0) < self.capacity(day)
+
+    @staticmethod
+    def _intervals(intervals):
+        """Booked (start, end) dates (end exclusive) as sorted, merged ordinal arrays."""
+        starts, ends = [], []
+        for start, end in sorted((start.toordinal(), end.toordinal()) for start, end in intervals):
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        return starts, ends
+
+    def _booked_until(self, car_id, day):
+        """The day a car's booking covering `day` ends, or None if it is free that day."""
+        booking = self.bookings.get(car_id)
+        if not booking:
+            return None
+        starts, ends = booking
+        i = bisect.bisect_right(starts, day) - 1
+        if i >= 0 and day < ends[i]:
+            return ends[i]
+        return None
+
+    # Assignment bookkeeping
+
+    def _assign(self, car_id, day):
+        self.assignments[car_id] = day
+        self.load[day] = self.load.get(day, 0) + 1
+        self.unscheduled.discard(car_id)
+
+    def _unassign(self, car_id):
+        day = self.assignments.pop(car_id, None)
+        if day is not None:
+            self.load[day] -= 1
+            if not self.load[day]:
+                del self.load[day]
+
+    def _place(self, car_id):
+        """Put one car on its first feasible day, starting at the beginning of its window."""
+        earliest, due = self.windows[car_id]
+        day = max(earliest, self.start)
+        last_day = max(day, due) + self.horizon_days
+        while day <= last_day:
+            booked_until = self._booked_until(car_id, day)
+            if booked_until is not None:
+                day = booked_until
+            elif self._has_room(day):
+                self._assign(car_id, day)
+                return day
+            else:
+                day += 1
+        self.unscheduled.add(car_id)
+        return None
+
+    # Planning
+
+    def schedule(self, windows, bookings=None, start_date=None):
+        """
+        Plan services for the whole fleet.
+
+        Days are swept in order. Cars enter a priority queue keyed by due
+        date when their window opens, and each day the most urgent cars
+        that are not booked fill the shop's capacity. A booked car is set
+        aside until its booking ends. Cars past their due date keep their
+        priority and are serviced as soon as possible.
+
+        Args:
+            windows (dict): car_id -> (earliest date, due date)
+            bookings (dict, optional): car_id -> list of booked (start, end)
+                date intervals, end exclusive
+            start_date (date, optional): First day services can happen (defaults to today)
+
+        Returns:
+            dict: car_id -> service date
+        """
+        if start_date is None:
+            start_date = datetime.date.today()
+        self.start = start_date.toordinal()
+        self.windows = {car_id: (max(earliest.toordinal(), self.start), due.toordinal())
+                        for car_id, (earliest, due) in windows.items()}
+        self.bookings = {car_id: self._intervals(intervals)
+                         for car_id, intervals in (bookings or {}).items() if intervals}
+        self.assignments = {}
+        self.load = {}
+        self.unscheduled = set()
+
+        releases = sorted(((earliest, due, car_id) for car_id, (earliest, due) in self.windows.items()),
+                          key=lambda release: release[:2])
+        last_day = max((due for _, due, _ in releases), default=self.start) + self.horizon_days
+        queue = []     # (due, release order, car_id); the order breaks ties without comparing ids
+        waiting = {}   # day -> queue entries set aside until a booking ends that day
+        next_release = 0
+        day = self.start
+
+        while day <= last_day and (queue or waiting or next_release < len(releases)):
+            while next_release < len(releases) and releases[next_release][0] <= day:
+                _, due, car_id = releases[next_release]
+                heapq.heappush(queue, (due, next_release, car_id))
+                next_release += 1
+            for entry in waiting.pop(day, ()):
+                heapq.heappush(queue, entry)
+
+            room = self.capacity(day) - self.load.get(day, 0)
+            while room > 0 and queue:
+                entry = heapq.heappop(queue)
+                car_id = entry[2]
+                booked_until = self._booked_until(car_id, day)
+                if booked_until is not None:
+                    waiting.setdefault(booked_until, []).append(entry)
+                    continue
+                self._assign(car_id, day)
+                room -= 1
+
+            if queue:
+                day += 1
+            else:
+                # Nothing pending: jump to the next window opening or booking end
+                upcoming = list(waiting)
+                if next_release < len(releases):
+                    upcoming.append(releases[next_release][0])
+                if not upcoming:
+                    break
+                day = max(day + 1, min(upcoming))
+
+        self.unscheduled = set(self.windows) - set(self.assignments)
+        if self.unscheduled:
+            logger.warning("%d cars could not be scheduled within the horizon", len(self.unscheduled))
+        return self.service_dates()
+
+    # Incremental updates
+
+    def update_bookings(self, car_id, intervals):
+        """
+        Replace a car's bookings and repair its service slot if needed.
+
+        Only this car moves: if its service day now falls inside a booking,
+        it is re-placed on the first day in its window (or after) with spare
+        capacity; other cars keep their days.
+
+        Args:
+            car_id: Car identifier
+            intervals (list): Booked (start, end) date intervals, end exclusive
+
+        Returns:
+            date or None: The car's service date after the change
+        """
+        if intervals:
+            self.bookings[car_id] = self._intervals(intervals)
+        else:
+            self.bookings.pop(car_id, None)
+
+        day = self.assignments.get(car_id)
+        if car_id in self.windows and (day is None or self._booked_until(car_id, day) is not None):
+            self._unassign(car_id)
+            self._place(car_id)
+        return self.service_date(car_id)
+
+    def update_window(self, car_id, earliest, due):
+        """
+        Add a car or change its service window (e.g. after new mileage data).
+
+        Args:
+            car_id: Car identifier
+            earliest (date): First day the car may be serviced
+            due (date): Day the service is due
+
+        Returns:
+            date or None: The car's service date after the change
+        """
+        if self.start is None:
+            self.start = datetime.date.today().toordinal()
+        self.windows[car_id] = (max(earliest.toordinal(), self.start), due.toordinal())
+        day = self.assignments.get(car_id)
+        earliest_day, due_day = self.windows[car_id]
+        if day is None or not earliest_day <= day <= due_day:
+            self._unassign(car_id)
+            self._place(car_id)
+        return self.service_date(car_id)
+
+    def remove_car(self, car_id):
+        """Drop a car from the schedule, freeing its slot."""
+        self._unassign(car_id)
+        self.windows.pop(car_id, None)
+        self.bookings.pop(car_id, None)
+        self.unscheduled.discard(car_id)
+
+    # Queries
+
+    def service_date(self, car_id):
+        """Get a car's scheduled service date, or None."""
+        day = self.assignments.get(car_id)
+        return datetime.date.fromordinal(day) if day is not None else None
+
+    def service_dates(self):
+        """
+        Get every scheduled service date.
+
+        Returns:
+            dict: car_id -> service date
+        """
+        return {car_id: datetime.date.fromordinal(day) for car_id, day in self.assignments.items()}
+
+    def is_late(self, car_id):
+        """Check whether a car is scheduled after its due date."""
+        day = self.assignments.get(car_id)
+        return day is not None and day > self.windows[car_id][1]
+
+    def calendar(self):
+        """
+        Get the service calendar.
+
+        Returns:
+            dict: service date -> list of car ids, in date order
+        """
+        days = {}
+        for car_id, day in self.assignments.items():
+            days.setdefault(day, []).append(car_id)
+        return {datetime.date.fromordinal(day): days[day] for day in sorted(days)}
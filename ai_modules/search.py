@@ -0,0 +1,295 @@
+"""
+Fleet Search Module for Car Rental Website
+This module implements an inverted index over car names, categories and
+features. Terms are tokenized once when a car is indexed, a sorted
+vocabulary serves prefix lookups, a character-trigram index over the
+vocabulary serves typo-tolerant lookups, and queries resolve by
+intersecting posting lists and ranking the matches.
+"""
+
+import bisect
+import heapq
+import re
+import threading
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """
+    Split text into lowercase alphanumeric tokens.
+
+    Args:
+        text (str): Text to tokenize
+
+    Returns:
+        list: Tokens in order of appearance
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def trigrams(term):
+    """
+    Character trigrams of a term, padded so word starts and ends count.
+
+    Args:
+        term (str): A single token
+
+    Returns:
+        set: Trigrams of "$$" + term + "$"
+    """
+    padded = f"$${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_edit_distance(a, b, max_distance):
+    """
+    Levenshtein distance between two strings, giving up early past a bound.
+
+    Args:
+        a (str): First string
+        b (str): Second string
+        max_distance (int): Largest distance of interest
+
+    Returns:
+        int: The edit distance, or max_distance + 1 if it is larger
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1,
+                               current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return min(previous[-1], max_distance + 1)
+
+
+class FleetSearchIndex:
+    """Inverted index with prefix and typo-tolerant matching over the fleet."""
+
+    # Relevance of a term depending on the field it appears in
+    FIELD_WEIGHTS = {
+        "name": 3.0,
+        "category": 2.0,
+        "features": 1.0
+    }
+
+    # Relative score of a prefix match compared to an exact term match
+    PREFIX_MATCH_FACTOR = 0.5
+
+    # Relative score of a fuzzy match, further scaled by its similarity
+    FUZZY_MATCH_FACTOR = 0.4
+
+    def __init__(self, car_data=None, fuzzy_threshold=0.75, max_edit_distance=2):
+        """
+        Build the index.
+
+        Args:
+            car_data (list, optional): Car dictionaries to index
+            fuzzy_threshold (float): Minimum similarity (1 - edits / length)
+                for a misspelled term to match; None disables fuzzy matching
+            max_edit_distance (int): Maximum edits for a fuzzy match
+        """
+        self.fuzzy_threshold = fuzzy_threshold
+        self.max_edit_distance = max_edit_distance
+        self._postings = {}     # term -> {car_id: weight}
+        self._vocabulary = []   # sorted terms, for prefix lookups
+        self._trigrams = {}     # trigram -> set of terms, for fuzzy lookups
+        self._doc_terms = {}    # car_id -> terms, to unindex on change
+        self._cars = {}         # car_id -> car dict
+        self._order = {}        # car_id -> insertion sequence, for stable ranking
+        self._next_order = 0
+        self._lock = threading.RLock()
+
+        for car in car_data or []:
+            self.add_car(car)
+
+    def __len__(self):
+        return len(self._cars)
+
+    def _car_terms(self, car):
+        """Weighted terms of a car: term -> summed field weight."""
+        terms = {}
+        fields = (
+            ("name", [car.get('name', "")]),
+            ("category", [car.get('category', "")]),
+            ("features", car.get('features', [])),
+        )
+        for field_name, values in fields:
+            weight = self.FIELD_WEIGHTS[field_name]
+            field_terms = {term for value in values for term in tokenize(value)}
+            for term in field_terms:
+                terms[term] = terms.get(term, 0.0) + weight
+        return terms
+
+    def add_car(self, car):
+        """
+        Index a car (re-indexes it if already present).
+
+        Args:
+            car (dict): Car information
+        """
+        with self._lock:
+            car_id = car['id']
+            if car_id in self._cars:
+                self._unindex(car_id)
+            else:
+                self._order[car_id] = self._next_order
+                self._next_order += 1
+
+            terms = self._car_terms(car)
+            for term, weight in terms.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    bisect.insort(self._vocabulary, term)
+                    for gram in trigrams(term):
+                        self._trigrams.setdefault(gram, set()).add(term)
+                postings[car_id] = weight
+            self._doc_terms[car_id] = list(terms)
+            self._cars[car_id] = car
+
+    update_car = add_car
+
+    def remove_car(self, car_id):
+        """
+        Remove a car from the index.
+
+        Args:
+            car_id: Car identifier
+        """
+        with self._lock:
+            if car_id in self._cars:
+                self._unindex(car_id)
+                del self._cars[car_id]
+                del self._order[car_id]
+
+    def _unindex(self, car_id):
+        for term in self._doc_terms.pop(car_id, ()):
+            postings = self._postings[term]
+            postings.pop(car_id, None)
+            if not postings:
+                del self._postings[term]
+                del self._vocabulary[bisect.bisect_left(self._vocabulary, term)]
+                for gram in trigrams(term):
+                    terms = self._trigrams[gram]
+                    terms.discard(term)
+                    if not terms:
+                        del self._trigrams[gram]
+
+    def _prefix_terms(self, prefix):
+        """All vocabulary terms starting with prefix (binary search on the sorted vocabulary)."""
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = start
+        while end < len(self._vocabulary) and self._vocabulary[end].startswith(prefix):
+            end += 1
+        return self._vocabulary[start:end]
+
+    def fuzzy_terms(self, query_term):
+        """
+        Find vocabulary terms within the edit bound of a (misspelled) term.
+
+        Candidates come from the trigram index: a term within k edits shares
+        at least len(trigrams) - 3k trigrams with the query, so only terms
+        sharing that many are checked with the bounded edit distance.
+
+        Args:
+            query_term (str): A single query token
+
+        Returns:
+            dict: term -> similarity (0-1) for terms passing fuzzy_threshold
+        """
+        if self.fuzzy_threshold is None:
+            return {}
+        query_grams = trigrams(query_term)
+        needed = max(1, len(query_grams) - 3 * self.max_edit_distance)
+
+        shared = {}
+        for gram in query_grams:
+            for term in self._trigrams.get(gram, ()):
+                shared[term] = shared.get(term, 0) + 1
+
+        matches = {}
+        for term, count in shared.items():
+            if count < needed:
+                continue
+            distance = bounded_edit_distance(query_term, term, self.max_edit_distance)
+            if distance > self.max_edit_distance:
+                continue
+            similarity = 1 - distance / max(len(query_term), len(term))
+            if similarity >= self.fuzzy_threshold:
+                matches[term] = similarity
+        return matches
+
+    def _match_term(self, query_term):
+        """
+        Score every car matching one query term.
+
+        Exact and prefix matches are used when there are any; otherwise the
+        term is treated as a possible misspelling and matched fuzzily.
+        """
+        term_factors = {term: 1.0 if term == query_term else self.PREFIX_MATCH_FACTOR
+                        for term in self._prefix_terms(query_term)}
+        if not term_factors:
+            term_factors = {term: self.FUZZY_MATCH_FACTOR * similarity
+                            for term, similarity in self.fuzzy_terms(query_term).items()}
+
+        scores = {}
+        for term, factor in term_factors.items():
+            for car_id, weight in self._postings[term].items():
+                score = weight * factor
+                if score > scores.get(car_id, 0.0):
+                    scores[car_id] = score
+        return scores
+
+    def search(self, query, page=1, per_page=10):
+        """
+        Search the fleet.
+
+        Every query term must match a term of the car: exactly, as a
+        prefix, or (failing both) within the fuzzy edit bound. Results are
+        ranked by summed field relevance, then by fleet order.
+
+        Args:
+            query (str): Free-text query
+            page (int): 1-based page number
+            per_page (int): Results per page
+
+        Returns:
+            dict: results (car dicts for the page), total, page, per_page and pages
+        """
+        page = max(1, page)
+        per_page = max(1, per_page)
+        query_terms = list(dict.fromkeys(tokenize(query)))
+
+        with self._lock:
+            matches = None
+            # Start from the most selective term so intersections stay small
+            for term_scores in sorted((self._match_term(term) for term in query_terms), key=len):
+                if matches is None:
+                    matches = dict(term_scores)
+                else:
+                    matches = {car_id: score + term_scores[car_id]
+                               for car_id, score in matches.items() if car_id in term_scores}
+                if not matches:
+                    break
+            matches = matches or {}
+
+            # Only rank as many results as the requested page needs
+            ranked = heapq.nsmallest(page * per_page, matches.items(),
+                                     key=lambda item: (-item[1], self._order[item[0]]))
+            results = [self._cars[car_id] for car_id, _ in ranked[(page - 1) * per_page:]]
+
+        total = len(matches)
+        return {
+            "results": results,
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "pages": (total + per_page - 1) // per_page
+        }
@@ -0,0 +1,149 @@
+"""
+Service Priority Index for Predictive Maintenance
+This module keeps every vehicle's maintenance prediction in a sorted index
+keyed by next service date and reliability score, so "which cars need
+service in the next N days, worst first" and "the k most urgent cars" are
+answered with a binary search and a slice instead of a fleet scan. Entries
+are updated one car at a time as new predictions arrive.
+"""
+
+import bisect
+import datetime
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class ServicePriorityIndex:
+    """Maintenance predictions ordered by urgency: due date, then reliability."""
+
+    def __init__(self, predictions=None):
+        """
+        Build the index.
+
+        Args:
+            predictions (dict, optional): car_id -> prediction dict with
+                next_service (YYYY-MM-DD) and reliability_score
+        """
+        self._keys = []          # sorted (due ordinal, reliability score, seq)
+        self._entries = {}       # car_id -> (key, prediction)
+        self._car_ids = {}       # seq -> car_id
+        self._seqs = {}          # car_id -> seq, stable tie-break across updates
+        self._next_seq = 0
+        self._lock = threading.RLock()
+
+        for car_id, prediction in (predictions or {}).items():
+            self.update(car_id, prediction)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, car_id):
+        return car_id in self._entries
+
+    def get(self, car_id):
+        """Get the indexed prediction of a car, if any."""
+        entry = self._entries.get(car_id)
+        return entry[1] if entry is not None else None
+
+    def update(self, car_id, prediction):
+        """
+        Add or replace a car's prediction.
+
+        A prediction without a valid next_service date cannot be ordered, so
+        the car is left out of the index (and any older entry is dropped).
+
+        Args:
+            car_id: Car identifier
+            prediction (dict): Prediction with next_service (YYYY-MM-DD) and reliability_score
+
+        Returns:
+            bool: Whether the car is indexed
+        """
+        try:
+            due = datetime.date.fromisoformat(prediction['next_service']).toordinal()
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Not indexing car %s: invalid next_service in %r", car_id, prediction)
+            self.remove(car_id)
+            return False
+        with self._lock:
+            seq = self._seqs.get(car_id)
+            if seq is None:
+                seq = self._seqs[car_id] = self._next_seq
+                self._car_ids[seq] = car_id
+                self._next_seq += 1
+            else:
+                self._discard_key(car_id)
+            reliability = prediction.get('reliability_score')
+            key = (due, 100 if reliability is None else reliability, seq)
+            bisect.insort(self._keys, key)
+            self._entries[car_id] = (key, prediction)
+        return True
+
+    def remove(self, car_id):
+        """
+        Drop a car from the index.
+
+        Args:
+            car_id: Car identifier
+        """
+        with self._lock:
+            if car_id in self._entries:
+                self._discard_key(car_id)
+                del self._entries[car_id]
+                del self._car_ids[self._seqs.pop(car_id)]
+
+    def _discard_key(self, car_id):
+        key = self._entries[car_id][0]
+        del self._keys[bisect.bisect_left(self._keys, key)]
+
+    def _results(self, keys):
+        return [(self._car_ids[key[2]], self._entries[self._car_ids[key[2]]][1]) for key in keys]
+
+    def due_between(self, start_date, end_date):
+        """
+        Cars due for service in a date range, most urgent first.
+
+        Args:
+            start_date (date, optional): First due date included (None = no lower bound,
+                so overdue cars are included)
+            end_date (date): Last due date included
+
+        Returns:
+            list: (car_id, prediction) pairs ordered by due date, then reliability
+        """
+        with self._lock:
+            start = 0
+            if start_date is not None:
+                start = bisect.bisect_left(self._keys, (start_date.toordinal(),))
+            end = bisect.bisect_left(self._keys, (end_date.toordinal() + 1,))
+            return self._results(self._keys[start:end])
+
+    def due_within(self, days, today=None):
+        """
+        Cars needing service in the next N days (including overdue ones), most urgent first.
+
+        Args:
+            days (int): Number of days ahead
+            today (date, optional): Reference day (defaults to today)
+
+        Returns:
+            list: (car_id, prediction) pairs ordered by due date, then reliability
+        """
+        if today is None:
+            today = datetime.date.today()
+        return self.due_between(None, today + datetime.timedelta(days=days))
+
+    def top(self, k=None):
+        """
+        The k most urgent cars.
+
+        Args:
+            k (int, optional): Number of cars (None = all, in urgency order)
+
+        Returns:
+            list: (car_id, prediction) pairs ordered by due date, then reliability
+        """
+        with self._lock:
+            return self._results(self._keys[:k])
@@ -0,0 +1,138 @@
+"""
+Application Service Registry for Car Rental Website
+This module builds each AI engine once at startup and hands the same warm,
+shared instances to every request handler, so no route constructs engine
+state or rebuilds lookup tables per request.
+"""
+
+import datetime
+import hashlib
+import logging
+import threading
+
+from ai_modules.chatbot import RentalChatbot
+from ai_modules.demand import FittedDemandModel
+from ai_modules.fleet import CAR_REMOVED, MAINTENANCE_UPDATED
+from ai_modules.maintenance import PredictiveMaintenance
+from ai_modules.pricing import SmartPricing
+from ai_modules.recommendation import CarRecommendationEngine
+from ai_modules.search import FleetSearchIndex
+from ai_modules.service_index import ServicePriorityIndex
+from ai_modules.telematics import TelematicsIngestor
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceRegistry:
+    """Holds the shared AI engine instances used by the web application."""
+
+    def __init__(self, fleet, holidays_file=None, demand_model_file=None):
+        """
+        Build every engine for the given fleet.
+
+        Args:
+            fleet (FleetRepository): Fleet data store; engines follow its
+                change notifications
+            holidays_file (str, optional): Regional holiday calendar for pricing
+            demand_model_file (str, optional): Demand curves fitted to booking
+                history (see booking_history); the default model is used otherwise
+        """
+        self.fleet = fleet
+
+        # Fleet arrays, search index, pricing calendar and compiled keyword patterns are built here
+        self.recommendation = CarRecommendationEngine(fleet.as_dicts())
+        self.search = FleetSearchIndex(fleet.as_dicts())
+        demand_model = FittedDemandModel.load(demand_model_file) if demand_model_file else None
+        self.pricing = SmartPricing(holidays_file=holidays_file, demand_model=demand_model)
+        # No random noise, so refreshing an unchanged vehicle keeps its place in the priority index
+        self.maintenance = PredictiveMaintenance(reliability_noise=0, random_issue_rate=0, service_date_jitter=0)
+        # Predictions ordered by urgency; fleet maintenance updates keep it current car by car
+        self.maintenance_index = ServicePriorityIndex(fleet.maintenance_predictions())
+        self.telematics = TelematicsIngestor(self.maintenance, fleet)
+        self.chatbot = RentalChatbot()
+
+        self.booking_outlook_days = 7
+        # car_id -> (price_per_day, category), to tell price changes from other edits
+        self._price_inputs = {car.id: (car.price_per_day, car.category) for car in fleet}
+        self._pricing_snapshot = None
+        self._snapshot_lock = threading.Lock()
+
+        fleet.subscribe(self._on_fleet_change)
+        logger.info("Service registry initialized with %d vehicles", len(fleet))
+
+    def _on_fleet_change(self, event, car):
+        """Apply a single fleet change to the engines incrementally."""
+        if event == MAINTENANCE_UPDATED:
+            # Only the car's place in the priority index depends on its prediction
+            self.maintenance_index.update(car.id, self.fleet.get_maintenance(car.id))
+            return
+        if event == CAR_REMOVED:
+            self.recommendation.remove_car(car.id)
+            self.search.remove_car(car.id)
+            self.maintenance_index.remove(car.id)
+        else:
+            car_dict = car.to_dict()
+            self.recommendation.upsert_car(car_dict)
+            self.search.update_car(car_dict)
+        # Only this car's quotes depend on its base price and category
+        price_inputs = None if event == CAR_REMOVED else (car.price_per_day, car.category)
+        if self._price_inputs.get(car.id) != price_inputs:
+            if price_inputs is None:
+                del self._price_inputs[car.id]
+            else:
+                self._price_inputs[car.id] = price_inputs
+            self.pricing.invalidate_car(car.id)
+
+    def pricing_snapshot(self, today=None):
+        """
+        Get the precomputed smart pricing page data.
+
+        The snapshot is built once per day, and again whenever the fleet or
+        the pricing model changes. Callers may attach derived data (such as
+        the rendered page) under new keys; the existing values are shared
+        and must not be modified.
+
+        Args:
+            today (date, optional): Day of the snapshot (defaults to today)
+
+        Returns:
+            dict: cars, price_adjustments, future_dates, booking_outlook, plus
+            etag (str) and last_modified (UTC datetime) for HTTP revalidation
+        """
+        if today is None:
+            today = datetime.date.today()
+        key = (today.toordinal(), self.fleet.version, self.pricing.model_version)
+        with self._snapshot_lock:
+            snapshot = self._pricing_snapshot
+            if snapshot is None or snapshot["key"] != key:
+                cars = self.fleet.as_dicts()
+                data = {
+                    "cars": cars,
+                    "price_adjustments": {car['id']: self.pricing.get_price_adjustments(car) for car in cars},
+                    "future_dates": self.pricing.generate_date_forecast(14),
+                    "booking_outlook": self.pricing.get_booking_outlook(self.fleet.categories(),
+                                                                        days=self.booking_outlook_days)
+                }
+                snapshot = {
+                    "key": key,
+                    # Content-based, so the tag stays valid across restarts
+                    "etag": hashlib.sha1(repr(data).encode("utf-8")).hexdigest(),
+                    "last_modified": datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0),
+                    **data
+                }
+                self._pricing_snapshot = snapshot
+                logger.info("Built pricing snapshot for %s", today.isoformat())
+            return snapshot
+
+    def cache_stats(self):
+        """
+        Get hit/miss counters of the shared caches.
+
+        Returns:
+            dict: Recommendation result cache and pricing cache stats
+        """
+        recommendation_cache = self.recommendation.cache
+        return {
+            "recommendation": recommendation_cache.stats() if recommendation_cache is not None else None,
+            "pricing": self.pricing.quote_cache_stats()
+        }
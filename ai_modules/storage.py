@@ -0,0 +1,360 @@
+"""
+SQLite Fleet Persistence for Car Rental Website
+This module stores cars, rentals and maintenance records in SQLite using only
+the standard library. Connections come from a small bounded pool shared by
+all threads, the database runs in WAL mode so readers do not block each
+other, and bulk import/export helpers move whole fleets in single
+transactions.
+"""
+
+import json
+import logging
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from ai_modules.fleet import CAR_REMOVED, MAINTENANCE_UPDATED, FleetRepository
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cars (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    price_per_day REAL NOT NULL,
+    seats INTEGER NOT NULL,
+    transmission TEXT NOT NULL,
+    image TEXT NOT NULL DEFAULT '',
+    features TEXT NOT NULL DEFAULT '[]',
+    rating REAL
+);
+CREATE INDEX IF NOT EXISTS idx_cars_category ON cars (category);
+CREATE INDEX IF NOT EXISTS idx_cars_price_per_day ON cars (price_per_day);
+CREATE INDEX IF NOT EXISTS idx_cars_seats ON cars (seats);
+
+CREATE TABLE IF NOT EXISTS rentals (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    car_id INTEGER NOT NULL REFERENCES cars (id) ON DELETE CASCADE,
+    category TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    rating REAL
+);
+CREATE INDEX IF NOT EXISTS idx_rentals_user_id ON rentals (user_id);
+CREATE INDEX IF NOT EXISTS idx_rentals_car_id ON rentals (car_id);
+
+CREATE TABLE IF NOT EXISTS maintenance (
+    car_id INTEGER PRIMARY KEY REFERENCES cars (id) ON DELETE CASCADE,
+    next_service TEXT,
+    reliability_score INTEGER,
+    predicted_issues TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS idx_maintenance_next_service ON maintenance (next_service);
+"""
+
+CAR_COLUMNS = ("id", "name", "category", "price_per_day", "seats", "transmission", "image", "features", "rating")
+RENTAL_COLUMNS = ("user_id", "car_id", "category", "start_date", "end_date", "rating")
+
+
+class SQLiteFleetStore:
+    """SQLite-backed storage for cars, rentals and maintenance records."""
+
+    def __init__(self, path, pool_size=8):
+        """
+        Open (and if needed create) the database.
+
+        Args:
+            path (str): Database file path. Each pooled connection opens the
+                file separately, so an in-memory database (':memory:') would
+                not be shared between them.
+            pool_size (int): Maximum number of open connections; callers
+                wait for a free one beyond that
+        """
+        self.path = path
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._lock = threading.Lock()   # Orders returns to the pool against close()
+        self._closed = False
+        with self.connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _open(self):
+        # Connections move between threads through the pool but are only
+        # used by one thread at a time
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a pooled connection for the duration of a with block.
+
+        Yields:
+            sqlite3.Connection: Connection reserved for the calling thread
+                until the block exits
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed store")
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._open()
+            try:
+                yield conn
+            finally:
+                with self._lock:
+                    if self._closed:
+                        conn.close()
+                    else:
+                        self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Close every pooled connection (connections in use close when returned)."""
+        with self._lock:
+            self._closed = True
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
+
+    # Cars
+
+    @staticmethod
+    def _car_row(car):
+        return (car['id'], car['name'], car['category'], car['price_per_day'], car['seats'],
+                car['transmission'], car.get('image', ""), json.dumps(car.get('features', [])),
+                car.get('rating'))
+
+    @staticmethod
+    def _car_dict(row):
+        car = dict(row)
+        car['features'] = json.loads(car['features'])
+        if car['rating'] is None:
+            del car['rating']
+        return car
+
+    def import_cars(self, cars):
+        """
+        Insert or update many cars in one transaction.
+
+        Args:
+            cars (iterable): Car dictionaries
+
+        Returns:
+            int: Number of rows written
+        """
+        # An upsert rather than INSERT OR REPLACE, which would delete the old
+        # row and cascade to its rentals and maintenance record
+        updates = ", ".join(f"{column} = excluded.{column}" for column in CAR_COLUMNS[1:])
+        with self.connection() as conn, conn:
+            cursor = conn.executemany(
+                f"INSERT INTO cars ({', '.join(CAR_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(CAR_COLUMNS))}) "
+                f"ON CONFLICT (id) DO UPDATE SET {updates}",
+                (self._car_row(car) for car in cars))
+        return cursor.rowcount
+
+    def upsert_car(self, car):
+        """Insert or update a single car."""
+        self.import_cars([car])
+
+    def delete_car(self, car_id):
+        """Delete a car (its rentals and maintenance record are cascaded)."""
+        with self.connection() as conn, conn:
+            conn.execute("DELETE FROM cars WHERE id = ?", (car_id,))
+
+    def load_cars(self, category=None, max_price=None, min_seats=None):
+        """
+        Load cars as dictionaries, optionally filtered via the column indexes.
+
+        The result has the same format as the in-memory fleet, so it can be
+        passed directly to CarRecommendationEngine(car_data).
+
+        Args:
+            category (str, optional): Only cars in this category
+            max_price (float, optional): Only cars at or below this daily price
+            min_seats (int, optional): Only cars with at least this many seats
+
+        Returns:
+            list: Car dictionaries ordered by id
+        """
+        clauses, params = [], []
+        if category is not None:
+            clauses.append("category = ?")
+            params.append(category)
+        if max_price is not None:
+            clauses.append("price_per_day <= ?")
+            params.append(max_price)
+        if min_seats is not None:
+            clauses.append("seats >= ?")
+            params.append(min_seats)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self.connection() as conn:
+            rows = conn.execute(f"SELECT {', '.join(CAR_COLUMNS)} FROM cars{where} ORDER BY id", params)
+            return [self._car_dict(row) for row in rows]
+
+    def count_cars(self):
+        """Get the number of stored cars."""
+        with self.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM cars").fetchone()[0]
+
+    # Rentals
+
+    def import_rentals(self, rentals):
+        """
+        Insert many rentals in one transaction.
+
+        Args:
+            rentals (iterable): Rental dictionaries (user_id, car_id and
+                optional category, start_date, end_date, rating)
+
+        Returns:
+            int: Number of rows written
+        """
+        with self.connection() as conn, conn:
+            cursor = conn.executemany(
+                f"INSERT INTO rentals ({', '.join(RENTAL_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(RENTAL_COLUMNS))})",
+                (tuple(rental.get(column) for column in RENTAL_COLUMNS) for rental in rentals))
+        return cursor.rowcount
+
+    def add_rental(self, rental):
+        """Record a single rental."""
+        self.import_rentals([rental])
+
+    def load_rentals(self, user_id=None):
+        """
+        Load rentals, e.g. as user_history for recommendations.
+
+        Args:
+            user_id (str, optional): Only this user's rentals
+
+        Returns:
+            list: Rental dictionaries ('rating' omitted when not given)
+        """
+        query = f"SELECT id, {', '.join(RENTAL_COLUMNS)} FROM rentals"
+        params = ()
+        if user_id is not None:
+            query += " WHERE user_id = ?"
+            params = (user_id,)
+        rentals = []
+        with self.connection() as conn:
+            for row in conn.execute(query + " ORDER BY id", params):
+                rental = dict(row)
+                if rental['rating'] is None:
+                    del rental['rating']
+                rentals.append(rental)
+        return rentals
+
+    # Maintenance
+
+    def save_maintenance(self, predictions):
+        """
+        Insert or replace maintenance records in one transaction.
+
+        Args:
+            predictions (dict): car_id -> prediction dict (next_service,
+                reliability_score, predicted_issues)
+        """
+        with self.connection() as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO maintenance (car_id, next_service, reliability_score, predicted_issues) "
+                "VALUES (?, ?, ?, ?)",
+                ((car_id, prediction.get('next_service'), prediction.get('reliability_score'),
+                  json.dumps(prediction.get('predicted_issues', [])))
+                 for car_id, prediction in predictions.items()))
+
+    def load_maintenance(self):
+        """
+        Load all maintenance records.
+
+        Returns:
+            dict: car_id -> prediction dict
+        """
+        with self.connection() as conn:
+            rows = conn.execute(
+                "SELECT car_id, next_service, reliability_score, predicted_issues FROM maintenance")
+            return {row['car_id']: {
+                "next_service": row['next_service'],
+                "predicted_issues": json.loads(row['predicted_issues']),
+                "reliability_score": row['reliability_score']
+            } for row in rows}
+
+    # Bulk import/export
+
+    def export_json(self, path):
+        """
+        Export cars, rentals and maintenance records to a JSON file.
+
+        Args:
+            path (str): Output file path
+        """
+        data = {
+            "cars": self.load_cars(),
+            "rentals": self.load_rentals(),
+            "maintenance": {str(car_id): prediction for car_id, prediction in self.load_maintenance().items()}
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    def import_json(self, path):
+        """
+        Import cars, rentals and maintenance records from a JSON file
+        written by export_json.
+
+        Args:
+            path (str): Input file path
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.import_cars(data.get("cars", []))
+        self.import_rentals({key: value for key, value in rental.items() if key != "id"}
+                            for rental in data.get("rentals", []))
+        self.save_maintenance({int(car_id): prediction
+                               for car_id, prediction in data.get("maintenance", {}).items()})
+
+    # Fleet repository integration
+
+    def load_fleet(self):
+        """
+        Build a FleetRepository from the stored cars and maintenance records.
+
+        Returns:
+            FleetRepository: The loaded fleet
+        """
+        fleet = FleetRepository(self.load_cars())
+        for car_id, prediction in self.load_maintenance().items():
+            if car_id in fleet:
+                fleet.set_maintenance(car_id, prediction)
+        logger.info("Loaded %d vehicles from %s", len(fleet), self.path)
+        return fleet
+
+    def persist_changes(self, fleet):
+        """
+        Write every subsequent change of a FleetRepository (cars and
+        maintenance predictions) through to the database.
+
+        Args:
+            fleet (FleetRepository): Fleet to follow
+        """
+        def on_change(event, car):
+            if event == CAR_REMOVED:
+                self.delete_car(car.id)
+            elif event == MAINTENANCE_UPDATED:
+                self.save_maintenance({car.id: fleet.get_maintenance(car.id)})
+            else:
+                self.upsert_car(car.to_dict())
+
+        fleet.subscribe(on_change)
@@ -0,0 +1,266 @@
+"""
+Telematics Ingestion for Predictive Maintenance
+This module consumes vehicle telematics events (odometer readings and
+service records) from JSONL files or any iterator, keeps a compact state
+per vehicle, and refreshes the maintenance prediction of only the vehicles
+whose state changed.
+
+Event format (one JSON object per line):
+    {"car_id": 1, "timestamp": "2024-05-01T08:30:00", "odometer": 41230.5}
+    {"car_id": 1, "timestamp": "2024-05-02T17:00:00", "service": "oil"}
+
+Timestamps are ISO 8601 strings or Unix epoch seconds. A service naming a
+part (as in PredictiveMaintenance.parts_lifespan) resets that part only;
+any other service (e.g. "full" or null) resets every part. Service events
+may carry an odometer reading; otherwise the last known reading is used. An
+optional "model_year" on any event sets the vehicle's age. Malformed lines
+and events are counted and skipped.
+"""
+
+import datetime
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400.0
+
+
+def parse_timestamp(value):
+    """
+    Convert an event timestamp to Unix epoch seconds.
+
+    Args:
+        value (str or float): ISO 8601 timestamp (a trailing 'Z' means UTC)
+            or epoch seconds
+
+    Returns:
+        float: Epoch seconds (naive timestamps are taken as UTC)
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    # fromisoformat only accepts the 'Z' suffix from Python 3.11
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    moment = datetime.datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+    return moment.astimezone(datetime.timezone.utc).timestamp()
+
+
+def read_telematics_events(path, stats=None):
+    """
+    Stream events from a JSONL file, skipping lines that are not valid JSON.
+
+    Args:
+        path (str): JSONL file path
+        stats (dict, optional): Receives 'skipped', the number of lines skipped
+
+    Yields:
+        One decoded value per valid, non-empty line
+    """
+    if stats is None:
+        stats = {}
+    stats["skipped"] = 0
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                stats["skipped"] += 1
+                logger.warning("Skipping malformed telematics line %d of %s: %s", number, path, str(e))
+
+
+class VehicleState:
+    """Latest telematics-derived facts about one vehicle."""
+
+    __slots__ = ("odometer", "last_reading_at", "daily_miles", "last_service_miles",
+                 "last_service_at", "part_services", "model_year", "events")
+
+    def __init__(self):
+        self.odometer = None          # Latest odometer reading (miles)
+        self.last_reading_at = None   # Epoch seconds of that reading
+        self.daily_miles = None       # Smoothed miles per day
+        self.last_service_miles = 0.0  # Odometer at the last full service
+        self.last_service_at = None
+        self.part_services = {}       # part -> (epoch seconds, odometer) of later single-part services
+        self.model_year = None
+        self.events = 0
+
+    def car_data(self, default_daily_miles=30):
+        """
+        Vehicle data in the format PredictiveMaintenance expects.
+
+        Args:
+            default_daily_miles (float): Usage assumed until two readings are known
+
+        Returns:
+            dict: mileage, age_years, last_service_miles, part_service_miles
+            and daily_miles
+        """
+        age_years = 1
+        if self.model_year is not None:
+            age_years = max(0, datetime.date.today().year - self.model_year)
+        mileage = self.odometer or 0
+        return {
+            'mileage': mileage,
+            'age_years': age_years,
+            'last_service_miles': min(self.last_service_miles, mileage),
+            'part_service_miles': {part: min(miles, mileage) for part, (_, miles) in self.part_services.items()},
+            'daily_miles': max(1, self.daily_miles if self.daily_miles is not None else default_daily_miles)
+        }
+
+
+class TelematicsIngestor:
+    """Applies telematics events to per-vehicle state and keeps predictions current."""
+
+    def __init__(self, maintenance, fleet=None, usage_smoothing=0.3, on_prediction=None):
+        """
+        Initialize the ingestor.
+
+        Args:
+            maintenance (PredictiveMaintenance): Prediction engine
+            fleet (FleetRepository, optional): Fleet to look cars up in and to
+                store refreshed predictions on
+            usage_smoothing (float): Weight of the newest reading in the
+                exponentially smoothed daily mileage (0-1)
+            on_prediction (callable, optional): Called as on_prediction(car_id,
+                prediction) after each refreshed prediction
+        """
+        self.maintenance = maintenance
+        self.fleet = fleet
+        self.usage_smoothing = usage_smoothing
+        self.on_prediction = on_prediction
+        self.vehicles = {}      # car_id -> VehicleState
+        self.predictions = {}   # car_id -> latest prediction
+        self.rejected = 0       # Malformed or out-of-order events
+
+    def _apply(self, event):
+        """Update one vehicle's state; returns its car id if the state changed."""
+        # Validate every field before touching the state, so a bad event changes nothing
+        car_id = event['car_id']
+        hash(car_id)
+        timestamp = parse_timestamp(event['timestamp'])
+        model_year = event.get('model_year')
+        if model_year is not None:
+            model_year = int(model_year)
+        odometer = event.get('odometer')
+        if odometer is not None:
+            odometer = float(odometer)
+        is_service = 'service' in event
+        service = event.get('service')
+        if service is not None and not isinstance(service, str):
+            raise TypeError(f"service must be a part name, got {service!r}")
+
+        state = self.vehicles.get(car_id)
+        if state is None:
+            state = self.vehicles[car_id] = VehicleState()
+        state.events += 1
+        changed = False
+
+        if model_year is not None and model_year != state.model_year:
+            state.model_year = model_year
+            changed = True
+
+        if odometer is not None:
+            if state.odometer is None:
+                state.odometer, state.last_reading_at = odometer, timestamp
+                changed = True
+            elif timestamp > state.last_reading_at and odometer >= state.odometer:
+                days = (timestamp - state.last_reading_at) / SECONDS_PER_DAY
+                rate = (odometer - state.odometer) / days
+                if state.daily_miles is None:
+                    state.daily_miles = rate
+                else:
+                    state.daily_miles += self.usage_smoothing * (rate - state.daily_miles)
+                state.odometer, state.last_reading_at = odometer, timestamp
+                changed = True
+            elif not is_service:
+                # Late or rolled-back reading
+                self.rejected += 1
+
+        if is_service and (state.last_service_at is None or timestamp >= state.last_service_at):
+            service_miles = odometer if odometer is not None else (state.odometer or 0.0)
+            if service in self.maintenance.parts_lifespan:
+                previous = state.part_services.get(service)
+                if previous is None or timestamp >= previous[0]:
+                    state.part_services[service] = (timestamp, service_miles)
+                    changed = True
+            else:
+                # Full service: every part starts over
+                state.last_service_at = timestamp
+                state.last_service_miles = service_miles
+                state.part_services = {part: record for part, record in state.part_services.items()
+                                       if record[0] > timestamp}
+                changed = True
+
+        return car_id if changed else None
+
+    def _refresh(self, car_id):
+        """Recompute the prediction of one vehicle."""
+        car = None
+        if self.fleet is not None:
+            record = self.fleet.get(car_id)
+            car = record.to_dict() if record is not None else None
+        if car is None:
+            car = {'id': car_id}
+        prediction = self.maintenance.generate_maintenance_prediction(
+            car, car_data=self.vehicles[car_id].car_data())
+        self.predictions[car_id] = prediction
+        if self.fleet is not None and car_id in self.fleet:
+            self.fleet.set_maintenance(car_id, prediction)
+        if self.on_prediction is not None:
+            self.on_prediction(car_id, prediction)
+        return prediction
+
+    def ingest(self, events):
+        """
+        Apply a batch of events, then refresh each affected vehicle once.
+
+        Args:
+            events (iterable): Telematics event dictionaries
+
+        Returns:
+            set: Ids of the vehicles whose prediction was refreshed
+        """
+        dirty = set()
+        for event in events:
+            try:
+                car_id = self._apply(event)
+            except (KeyError, TypeError, ValueError) as e:
+                self.rejected += 1
+                logger.warning("Skipping malformed telematics event %r: %s", event, str(e))
+                continue
+            if car_id is not None:
+                dirty.add(car_id)
+
+        for car_id in dirty:
+            self._refresh(car_id)
+        return dirty
+
+    def ingest_file(self, path, batch_size=10000):
+        """
+        Stream a JSONL event file, refreshing predictions after each batch.
+
+        Args:
+            path (str): JSONL file path
+            batch_size (int): Events applied before affected vehicles are refreshed
+
+        Returns:
+            set: Ids of every vehicle whose prediction was refreshed
+        """
+        refreshed = set()
+        batch = []
+        stats = {}
+        for event in read_telematics_events(path, stats):
+            batch.append(event)
+            if len(batch) >= batch_size:
+                refreshed |= self.ingest(batch)
+                batch = []
+        refreshed |= self.ingest(batch)
+        self.rejected += stats["skipped"]
+        logger.info("Ingested telematics from %s: %d vehicles refreshed, %d events rejected",
+                    path, len(refreshed), self.rejected)
+        return refreshed
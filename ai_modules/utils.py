@@ -0,0 +1,39 @@
+"""
+Numeric helpers shared by the AI modules.
+
+Provides exact rounding of money amounts for NumPy arrays, so vectorized
+price and cost computations give the same cents as Python's round().
+"""
+
+import numpy as np
+
+
+def round_cents(values):
+    """
+    Round an array of prices to 2 decimal places exactly like Python's round()
+
+    np.round(x, 2) scales by 100 first, and that rounding error can flip
+    halfway cases (e.g. 348.075, stored just below .075, becomes 348.08).
+    Here the product 100 * x is split into its rounded value and exact error
+    (Dekker's two-product), so each price is compared with the true
+    midpoint before rounding, with ties to even as round() does.
+
+    Args:
+        values (numpy.ndarray): Prices
+
+    Returns:
+        numpy.ndarray: Prices rounded to cents
+    """
+    values = np.asarray(values, dtype=float)
+    scaled = values * 100
+
+    # Exact error of the product: values * 100 == scaled + error
+    split = values * 134217729.0  # 2**27 + 1, Veltkamp split
+    high = split - (split - values)
+    low = values - high
+    error = (high * 100 - scaled) + low * 100
+
+    floor = np.floor(scaled)
+    above_midpoint = (scaled - (floor + 0.5)) + error
+    round_up = (above_midpoint > 0) | ((above_midpoint == 0) & (floor % 2 == 1))
+    return (floor + round_up) / 100
@@ -1,6 +1,11 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, make_response, render_template, request, jsonify
+import datetime
+import os
 import random
-from datetime import datetime, timedelta
+
+from ai_modules.fleet import FleetRepository
+from ai_modules.services import ServiceRegistry
+from ai_modules.storage import SQLiteFleetStore
 
 app = Flask(__name__)
 
@@ -84,9 +89,45 @@ maintenance_predictions = {
     6: {"next_service": "2023-12-15", "predicted_issues": ["System diagnostics recommended", "Interior sanitization due"], "reliability_score": 93}
 }
 
+# Fleet repository: id-keyed cars and their maintenance predictions.
+# Change the fleet through it (add/update/remove) so engines and caches follow along.
+# Set FLEET_DB to a SQLite file path to load the fleet from (and persist changes to) the database;
+# an empty database is seeded with the mock data above.
+fleet_db_path = os.environ.get('FLEET_DB')
+if fleet_db_path:
+    fleet_store = SQLiteFleetStore(fleet_db_path)
+    if not fleet_store.count_cars():
+        fleet_store.import_cars(cars)
+        fleet_store.save_maintenance(maintenance_predictions)
+    fleet = fleet_store.load_fleet()
+    fleet_store.persist_changes(fleet)
+else:
+    fleet_store = None
+    fleet = FleetRepository(cars)
+    for car_id, prediction in maintenance_predictions.items():
+        fleet.set_maintenance(car_id, prediction)
+
+# Shared AI engines, built once at startup and reused by every request.
+# Set HOLIDAY_CALENDAR to a holiday file (JSON list or one MM-DD / YYYY-MM-DD per line)
+# to price with a regional holiday calendar, and DEMAND_MODEL to a table fitted with
+# `python -m ai_modules.booking_history bookings.csv -o demand_model.json` to price with
+# demand learned from booking history.
+services = ServiceRegistry(fleet, holidays_file=os.environ.get('HOLIDAY_CALENDAR'),
+                           demand_model_file=os.environ.get('DEMAND_MODEL'))
+
+# Set TELEMATICS_LOG to a JSONL file of odometer/service events to replace the mock
+# maintenance predictions of the vehicles it covers with telematics-based ones.
+# Further events can be fed through services.telematics.ingest(events).
+if os.environ.get('TELEMATICS_LOG'):
+    services.telematics.ingest_file(os.environ['TELEMATICS_LOG'])
+
+SEARCH_RESULTS_PER_PAGE = 12
+MAX_BATCH_PREFERENCES = 1000   # Preference sets per /get_recommendations_batch request
+MAX_BATCH_LIMIT = 20           # Recommendations per preference set in a batch
+
 @app.route('/')
 def home():
-    featured_cars = random.sample(cars, min(3, len(cars)))
+    featured_cars = random.sample(fleet.as_dicts(), min(3, len(fleet)))
     return render_template('index.html', featured_cars=featured_cars)
 
 @app.route('/about')
@@ -99,53 +140,38 @@ def contact():
 
 @app.route('/ai_recommendation')
 def ai_recommendation():
-    return render_template('ai_recommendation.html', cars=cars)
+    return render_template('ai_recommendation.html', cars=fleet.as_dicts())
 
 @app.route('/get_recommendation', methods=['POST'])
 def get_recommendation():
     # Get user preferences from form
     preferences = request.form.to_dict()
     
-    # Simple AI recommendation algorithm (in a real scenario this would be more sophisticated)
-    recommended_cars = []
-    for car in cars:
-        score = 0
-        # Match category preference
-        if preferences.get('category') == car['category']:
-            score += 3
-        
-        # Match price range
-        try:
-            max_price = int(preferences.get('max_price', 1000))
-            if car['price_per_day'] <= max_price:
-                score += 2
-            else:
-                score -= 3  # Penalize for being over budget
-        except ValueError:
-            pass
-            
-        # Match seats preference
-        try:
-            seats_needed = int(preferences.get('seats', 0))
-            if car['seats'] >= seats_needed:
-                score += 1
-        except ValueError:
-            pass
-            
-        # Additional feature matching could be added here
-        
-        if score > 0:
-            recommended_cars.append({
-                "car": car,
-                "match_score": min(score * 20, 100)  # Convert to percentage with max of 100%
-            })
+    # Identical preference sets are served from the engine's result cache
+    return jsonify(services.recommendation.get_recommendations(preferences, limit=3))
+
+@app.route('/get_recommendations_batch', methods=['POST'])
+def get_recommendations_batch():
+    # Bulk scoring for offline jobs: {"preferences": [{...}, ...], "limit": 3}
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({"error": "Request body must be a JSON object."}), 400
+    
+    preferences_list = payload.get('preferences')
+    if not isinstance(preferences_list, list) or not all(
+            isinstance(p, dict) and all(isinstance(v, services.recommendation.PREFERENCE_VALUE_TYPES) for v in p.values())
+            for p in preferences_list):
+        return jsonify({"error": "'preferences' must be a list of preference objects with scalar values."}), 400
+    if len(preferences_list) > MAX_BATCH_PREFERENCES:
+        return jsonify({"error": f"At most {MAX_BATCH_PREFERENCES} preference sets per request."}), 400
     
-    # Sort by match score
-    recommended_cars.sort(key=lambda x: x['match_score'], reverse=True)
+    limit = payload.get('limit', 3)
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        return jsonify({"error": "'limit' must be a positive integer."}), 400
+    limit = min(limit, MAX_BATCH_LIMIT)
     
     return jsonify({
-        "recommendations": recommended_cars[:3],  # Return top 3 matches
-        "explanation": "These cars were matched based on your preferences for category, budget, and seating capacity."
+        "results": services.recommendation.get_recommendations_batch(preferences_list, limit)
     })
 
 @app.route('/virtual_tour')
@@ -155,89 +181,81 @@ def virtual_tour():
 @app.route('/smart_pricing')
 def smart_pricing():
     # Dynamic pricing based on day of week, demand, etc.
-    price_adjustments = {}
-    for car in cars:
-        base_price = car['price_per_day']
-        weekend_price = round(base_price * 1.25, 2)  # 25% more expensive on weekends
-        holiday_price = round(base_price * 1.4, 2)  # 40% more expensive on holidays
-        low_demand_price = round(base_price * 0.85, 2)  # 15% discount during low demand
-        
-        price_adjustments[car['id']] = {
-            "base_price": base_price,
-            "weekend_price": weekend_price,
-            "holiday_price": holiday_price,
-            "low_demand_price": low_demand_price
-        }
+    # Served from a daily snapshot, rebuilt when the fleet or pricing model changes
+    snapshot = services.pricing_snapshot()
+    if 'html' not in snapshot:
+        snapshot['html'] = render_template('smart_pricing.html', cars=snapshot['cars'],
+                                           price_adjustments=snapshot['price_adjustments'],
+                                           future_dates=snapshot['future_dates'],
+                                           booking_outlook=snapshot['booking_outlook'])
+    
+    # ETag/Last-Modified let browsers and proxies revalidate with a 304
+    response = make_response(snapshot['html'])
+    response.set_etag(snapshot['etag'])
+    response.last_modified = snapshot['last_modified']
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+@app.route('/rental_quote')
+def rental_quote():
+    # Multi-day rental quote: /rental_quote?car_id=1&start=2024-07-01&days=7
+    try:
+        car_id = int(request.args['car_id'])
+        start_date = datetime.datetime.strptime(request.args['start'], '%Y-%m-%d').date()
+        days = int(request.args.get('days', 1))
+    except (KeyError, ValueError):
+        return jsonify({"error": "car_id, start (YYYY-MM-DD) and days are required."}), 400
     
-    # Generate some future dates for price prediction demo
-    today = datetime.now()
-    future_dates = []
-    for i in range(14):
-        future_date = today + timedelta(days=i)
-        is_weekend = future_date.weekday() >= 5  # 5 = Saturday, 6 = Sunday
-        
-        # Simulate some holiday dates
-        is_holiday = future_date.strftime('%m-%d') in ['07-04', '12-25', '12-31', '01-01']
-        
-        # Simulate demand based on day of week
-        demand_factor = random.uniform(0.8, 1.2)
-        if is_weekend:
-            demand_factor *= 1.1
-        if is_holiday:
-            demand_factor *= 1.3
-            
-        future_dates.append({
-            "date": future_date.strftime('%Y-%m-%d'),
-            "is_weekend": is_weekend,
-            "is_holiday": is_holiday,
-            "demand_factor": round(demand_factor, 2)
-        })
+    car = fleet.get(car_id)
+    if car is None:
+        return jsonify({"error": f"Car {car_id} not found."}), 404
     
-    return render_template('smart_pricing.html', cars=cars, price_adjustments=price_adjustments, future_dates=future_dates)
+    try:
+        quote = services.pricing.quote_rental(car.to_dict(), start_date, days, cars=fleet.as_dicts(),
+                                              fleet_version=fleet.version)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(quote)
+
+@app.route('/cache_stats')
+def cache_stats():
+    # Hit rates of the recommendation and pricing caches, for monitoring
+    return jsonify(services.cache_stats())
 
 @app.route('/predictive_maintenance')
 def predictive_maintenance():
-    return render_template('predictive_maintenance.html', cars=cars, predictions=maintenance_predictions)
+    # Cars most in need of service first (soonest due, then least reliable), from the
+    # priority index; ?days=N shows only cars due within N days, ?limit=K the K most urgent
+    index = services.maintenance_index
+    days = request.args.get('days', type=int)
+    limit = request.args.get('limit', type=int)
+    for name, value in (('days', days), ('limit', limit)):
+        # type=int yields None for unparsable values
+        if (value is None and request.args.get(name) is not None) or (value is not None and value < 0):
+            return jsonify({"error": f"'{name}' must be a non-negative integer."}), 400
+    entries = index.due_within(days)[:limit] if days is not None else index.top(limit)
+    
+    cars = [fleet.get(car_id).to_dict() for car_id, _ in entries if car_id in fleet]
+    return render_template('predictive_maintenance.html', cars=cars, predictions=dict(entries))
 
 @app.route('/search')
 def search():
-    query = request.args.get('q', '').lower()
-    results = []
+    query = request.args.get('q', '')
+    page = request.args.get('page', 1, type=int)
     
-    if query:
-        for car in cars:
-            if (query in car['name'].lower() or 
-                query in car['category'].lower() or 
-                any(query in feature.lower() for feature in car['features'])):
-                results.append(car)
+    # Resolved against the prebuilt inverted index, one page at a time
+    results = services.search.search(query, page=page, per_page=SEARCH_RESULTS_PER_PAGE)
     
-    return render_template('search_results.html', results=results, query=query)
+    return render_template('search_results.html', results=results['results'], query=query,
+                           page=results['page'], pages=results['pages'], total=results['total'])
 
 @app.route('/chatbot', methods=['POST'])
 def chatbot():
-    user_message = request.json.get('message', '').lower()
-    
-    # Simple AI chatbot responses
-    responses = {
-        "hello": "Hello! How can I help you with your car rental today?",
-        "hi": "Hi there! Looking to rent a car? I'm here to assist you.",
-        "booking": "To make a booking, simply select a car and click on the 'Book Now' button. You'll need to provide your rental dates and driver information.",
-        "price": "Our prices vary based on the car model, rental duration, and season. You can check out our 'Smart Pricing' page for detailed information.",
-        "payment": "We accept all major credit cards, PayPal, and Apple Pay. Payment is processed securely at the time of booking.",
-        "cancel": "Cancellations made 48 hours before the pickup time receive a full refund. Late cancellations may incur a fee.",
-        "insurance": "We offer various insurance packages starting from $15 per day. Full coverage is recommended for peace of mind.",
-        "requirements": "To rent a car, you need to be at least 21 years old, have a valid driver's license, and a credit card in your name."
-    }
-    
-    # Check for keyword matches
-    for keyword, response in responses.items():
-        if keyword in user_message:
-            return jsonify({"response": response})
+    user_message = request.json.get('message', '')
     
-    # Default response
-    return jsonify({
-        "response": "I'm not sure I understand your question. Would you like to know about our cars, pricing, or booking process?"
-    })
+    # Shared chatbot; each request gets its own conversation context
+    response = services.chatbot.process_message(user_message, context=services.chatbot.new_context())
+    return jsonify({"response": response})
 
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
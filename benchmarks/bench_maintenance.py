@@ -0,0 +1,71 @@
+"""
+Benchmark for fleet-wide predictive maintenance scoring.
+
+Scores a synthetic 20k-vehicle fleet and predicts its wear-based issues
+with the per-car scalar methods and with the columnar batch APIs,
+checks that both give the same results with the random noise disabled,
+and estimates the fleet maintenance cost with its confidence interval.
+
+Run from the repository root:
+    python -m benchmarks.bench_maintenance
+"""
+
+from ai_modules.maintenance import PredictiveMaintenance
+from benchmarks.common import best_time, make_fleet_columns
+
+FLEET_SIZE = 20000
+NUMBER = 3
+
+
+def scalar_reliability(maintenance, fleet):
+    scores = [maintenance.calculate_reliability_score({"category": category, "mileage": int(mileage),
+                                                       "age_years": int(age)})
+              for category, mileage, age in zip(fleet["categories"], fleet["mileage"], fleet["age_years"])]
+    return scores, [maintenance.get_health_status(score) for score in scores]
+
+
+def batch_reliability(maintenance, fleet):
+    codes = maintenance.encode_categories(fleet["categories"])
+    return maintenance.calculate_reliability_scores(codes, fleet["mileage"], fleet["age_years"])
+
+
+def scalar_issues(maintenance, fleet):
+    return [maintenance.predict_maintenance_issues({"mileage": int(mileage), "last_service_miles": int(last)})
+            for mileage, last in zip(fleet["mileage"], fleet["last_service_miles"])]
+
+
+def batch_issues(maintenance, fleet):
+    return maintenance.predict_maintenance_issues_batch(fleet["mileage"], fleet["last_service_miles"])
+
+
+if __name__ == "__main__":
+    maintenance = PredictiveMaintenance(reliability_noise=0, random_issue_rate=0)
+    fleet = make_fleet_columns(FLEET_SIZE)
+
+    scalar_scores, scalar_labels = scalar_reliability(maintenance, fleet)
+    batch_scores, batch_labels = batch_reliability(maintenance, fleet)
+    assert list(batch_scores) == scalar_scores and list(batch_labels) == scalar_labels
+
+    scalar_ms = best_time(scalar_reliability, maintenance, fleet, number=NUMBER)
+    batch_ms = best_time(batch_reliability, maintenance, fleet, number=NUMBER)
+    print(f"Reliability scores for {FLEET_SIZE} vehicles:")
+    print(f"  scalar loop: {scalar_ms:8.2f} ms")
+    print(f"  batch:       {batch_ms:8.2f} ms  ({scalar_ms / batch_ms:.0f}x)")
+
+    assert scalar_issues(maintenance, fleet) == batch_issues(maintenance, fleet)
+    scalar_ms = best_time(scalar_issues, maintenance, fleet, number=NUMBER)
+    batch_ms = best_time(batch_issues, maintenance, fleet, number=NUMBER)
+    print(f"Maintenance issues for {FLEET_SIZE} vehicles:")
+    print(f"  scalar loop: {scalar_ms:8.2f} ms")
+    print(f"  batch:       {batch_ms:8.2f} ms  ({scalar_ms / batch_ms:.0f}x)")
+
+    issue_counts = maintenance.wear_issue_counts(fleet["mileage"], fleet["last_service_miles"])
+    costs = maintenance.estimate_maintenance_costs(issue_counts)
+    assert list(costs["expected"]) == [maintenance.estimate_maintenance_cost(issues)
+                                       for issues in batch_issues(maintenance, fleet)]
+    batch_ms = best_time(lambda: maintenance.estimate_maintenance_costs(
+        maintenance.wear_issue_counts(fleet["mileage"], fleet["last_service_miles"])), number=NUMBER)
+    print(f"Maintenance cost estimate for {FLEET_SIZE} vehicles:")
+    print(f"  batch:       {batch_ms:8.2f} ms")
+    print(f"  fleet:       {costs['fleet_expected']:,.2f} "
+          f"(95% CI {costs['fleet_lower']:,.2f} - {costs['fleet_upper']:,.2f})")
@@ -0,0 +1,50 @@
+"""
+Benchmark for recommendation ranking.
+
+Compares the previous sort-then-slice ranking against the bounded top-k
+selection used by CarRecommendationEngine.get_recommendations.
+
+Run from the repository root:
+    python -m benchmarks.bench_recommendation
+"""
+
+import numpy as np
+
+from ai_modules.recommendation import CarRecommendationEngine, top_k_indices
+from benchmarks.common import best_time, make_fleet
+
+FLEET_SIZES = [1000, 10000, 50000]
+LIMIT = 3
+
+
+def sort_then_slice(cars, match_scores, limit):
+    """Previous ranking: one dict per car, full sort, then slice."""
+    scored_cars = [{"car": car, "match_score": float(score)}
+                   for car, score in zip(cars, match_scores)]
+    scored_cars.sort(key=lambda x: x['match_score'], reverse=True)
+    return scored_cars[:limit]
+
+
+def top_k(cars, match_scores, limit):
+    """Current ranking: argpartition top-k, dicts only for the winners."""
+    return [{"car": cars[i], "match_score": float(match_scores[i])}
+            for i in top_k_indices(match_scores, limit)]
+
+
+if __name__ == "__main__":
+    preferences = {"category": "SUV", "max_price": "150", "seats": "5"}
+    
+    print(f"{'fleet':>8} {'sort+slice (ms)':>16} {'top-k (ms)':>12} {'speedup':>8}")
+    for size in FLEET_SIZES:
+        cars = make_fleet(size)
+        engine = CarRecommendationEngine(cars)
+        match_scores = np.minimum(engine._score_fleet(preferences) * 100, 100)
+        
+        # Both paths must agree, including tie order
+        expected = [r['car']['id'] for r in sort_then_slice(cars, match_scores, LIMIT)]
+        actual = [r['car']['id'] for r in top_k(cars, match_scores, LIMIT)]
+        assert expected == actual, (expected, actual)
+        
+        baseline = best_time(sort_then_slice, cars, match_scores, LIMIT)
+        optimized = best_time(top_k, cars, match_scores, LIMIT)
+        print(f"{size:>8} {baseline:>16.3f} {optimized:>12.3f} {baseline / optimized:>7.1f}x")
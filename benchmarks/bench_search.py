@@ -0,0 +1,50 @@
+"""
+Benchmark for fleet search at large fleet sizes.
+
+Builds a FleetSearchIndex over a synthetic 100k-vehicle fleet and measures
+query latency for exact, prefix, multi-term and misspelled (fuzzy) queries,
+compared with the previous per-request substring scan.
+
+Run from the repository root:
+    python -m benchmarks.bench_search
+"""
+
+import time
+
+from ai_modules.search import FleetSearchIndex
+from benchmarks.common import best_time, make_fleet
+
+FLEET_SIZE = 100000
+
+QUERIES = {
+    "exact": "wrangler",
+    "prefix": "merc",
+    "multi-term": "toyota suv",
+    "fuzzy": "mercedez",
+    "fuzzy multi-term": "wrangeler 4x4",
+}
+
+
+def substring_scan(cars, query):
+    """Previous /search behaviour: lowercase and substring-check every car."""
+    query = query.lower()
+    return [car for car in cars
+            if (query in car['name'].lower() or
+                query in car['category'].lower() or
+                any(query in feature.lower() for feature in car['features']))]
+
+
+if __name__ == "__main__":
+    cars = make_fleet(FLEET_SIZE)
+
+    start = time.perf_counter()
+    index = FleetSearchIndex(cars)
+    print(f"Indexed {FLEET_SIZE} vehicles in {time.perf_counter() - start:.2f}s "
+          f"({len(index._vocabulary)} terms, {len(index._trigrams)} trigrams)")
+
+    print(f"{'query':>18} {'matches':>8} {'index (ms)':>11} {'scan (ms)':>10}")
+    for label, query in QUERIES.items():
+        total = index.search(query)['total']
+        indexed = best_time(index.search, query)
+        scan = best_time(substring_scan, cars, query)
+        print(f"{label:>18} {total:>8} {indexed:>11.3f} {scan:>10.3f}")
@@ -0,0 +1,58 @@
+"""
+Helpers shared by the benchmarks: timing and synthetic fleets.
+"""
+
+import random
+import timeit
+
+import numpy as np
+
+CATEGORIES = ["Electric", "Sedan", "SUV", "Compact", "Luxury"]
+MODELS = [
+    ("Tesla Model 3", "Electric"), ("Tesla Model Y", "Electric"), ("Nissan Leaf", "Electric"),
+    ("Toyota Camry", "Sedan"), ("Honda Accord", "Sedan"), ("Hyundai Sonata", "Sedan"),
+    ("BMW X5", "SUV"), ("Jeep Wrangler", "SUV"), ("Toyota RAV4", "SUV"), ("Honda CR-V", "SUV"),
+    ("Honda Civic", "Compact"), ("Volkswagen Golf", "Compact"), ("Mazda 3", "Compact"),
+    ("Mercedes-Benz S-Class", "Luxury"), ("BMW 7 Series", "Luxury"), ("Audi A8", "Luxury"),
+]
+FEATURES = [
+    "Autopilot", "360° Camera", "Wireless Charging", "Bluetooth", "Backup Camera", "Cruise Control",
+    "Leather Seats", "Panoramic Roof", "Navigation System", "Premium Sound", "Apple CarPlay",
+    "Android Auto", "Lane Assist", "4x4", "Removable Top", "Heated Seats", "Massage Seats",
+]
+
+
+def best_time(func, *args, repeat=5, number=20):
+    """Best per-call time in milliseconds over `repeat` runs of `number` calls."""
+    timer = timeit.Timer(lambda: func(*args))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1000
+
+
+def make_fleet(size, seed=42):
+    """Generate a synthetic fleet of car dictionaries with varied names, trims and features."""
+    rng = random.Random(seed)
+    fleet = []
+    for i in range(size):
+        name, category = rng.choice(MODELS)
+        fleet.append({
+            "id": i + 1,
+            "name": f"{name} {rng.randint(2015, 2025)} Trim{rng.randint(1, 500)}",
+            "category": category,
+            "price_per_day": rng.randint(40, 350),
+            "seats": rng.choice([2, 4, 5, 7]),
+            "transmission": rng.choice(["Automatic", "Manual"]),
+            "features": rng.sample(FEATURES, 4),
+            "rating": round(rng.uniform(3.5, 5.0), 1),
+        })
+    return fleet
+
+
+def make_fleet_columns(size, seed=42):
+    """Generate columnar fleet data: categories, mileage, age and last service mileage."""
+    rng = np.random.default_rng(seed)
+    return {
+        "categories": list(rng.choice(CATEGORIES, size)),
+        "mileage": rng.integers(0, 200000, size),
+        "age_years": rng.integers(0, 12, size),
+        "last_service_miles": rng.integers(0, 5000, size),
+    }
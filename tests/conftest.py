@@ -0,0 +1,16 @@
+import pytest
+
+
+@pytest.fixture
+def cars():
+    """A small fleet in the car dictionary format used by the engines."""
+    return [
+        {"id": 1, "name": "Tesla Model 3", "category": "Electric", "price_per_day": 120, "seats": 5,
+         "transmission": "Automatic", "features": ["Autopilot"], "rating": 4.8},
+        {"id": 2, "name": "Toyota Camry", "category": "Sedan", "price_per_day": 80, "seats": 5,
+         "transmission": "Automatic", "features": ["Bluetooth"], "rating": 4.5},
+        {"id": 3, "name": "BMW X5", "category": "SUV", "price_per_day": 200, "seats": 7,
+         "transmission": "Automatic", "features": ["Leather Seats"], "rating": 4.7},
+        {"id": 4, "name": "Jeep Wrangler", "category": "SUV", "price_per_day": 150, "seats": 5,
+         "transmission": "Manual", "features": ["4x4"], "rating": 4.6},
+    ]
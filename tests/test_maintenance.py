@@ -0,0 +1,27 @@
+from ai_modules.maintenance import IssueType, MaintenanceIssue, PredictiveMaintenance, issue_type_of
+
+
+def test_issue_type_of_accepts_records_codes_and_texts():
+    assert issue_type_of(MaintenanceIssue(IssueType.CHECK, "Brakes")) is IssueType.CHECK
+    assert issue_type_of(2) is IssueType.REPLACEMENT_SOON
+    assert issue_type_of("Timing Belt replacement needed") is IssueType.REPLACEMENT
+    assert issue_type_of("Windshield chipped") is IssueType.OTHER
+    assert issue_type_of(99) is IssueType.OTHER
+
+
+def test_cost_estimate_of_free_form_issues_uses_the_default_range():
+    maintenance = PredictiveMaintenance()
+
+    assert maintenance.estimate_maintenance_cost(["Windshield chipped"]) == 100
+    assert maintenance.estimate_maintenance_cost(["Oil replacement needed", "Mystery noise"]) == 600
+
+
+def test_predicted_issue_texts_cost_the_same_as_the_records():
+    maintenance = PredictiveMaintenance(reliability_noise=0, random_issue_rate=0)
+    issues = maintenance.predict_maintenance_issues({"mileage": 95000, "last_service_miles": 0})
+
+    assert issues
+    assert (maintenance.estimate_maintenance_cost([issue.describe() for issue in issues])
+            == maintenance.estimate_maintenance_cost(issues))
+    counts = maintenance.issue_count_matrix([["Windshield chipped", IssueType.CHECK]])
+    assert counts[0, IssueType.OTHER] == 1 and counts[0, IssueType.CHECK] == 1
@@ -0,0 +1,71 @@
+import datetime
+
+from ai_modules.fleet import FleetRepository
+from ai_modules.pricing import SmartPricing
+from ai_modules.services import ServiceRegistry
+
+DAY = datetime.date(2026, 3, 2)
+
+
+def cached_car_ids(pricing):
+    return {key[0] for key in pricing.quote_cache._entries}
+
+
+def warm_quotes(registry):
+    for car in registry.fleet.as_dicts():
+        registry.pricing.get_car_price(car, DAY)
+
+
+def test_rating_change_keeps_quotes(cars):
+    registry = ServiceRegistry(FleetRepository(cars))
+    warm_quotes(registry)
+
+    registry.fleet.update(2, rating=3.9)
+
+    assert cached_car_ids(registry.pricing) == {1, 2, 3, 4}
+
+
+def test_price_change_drops_only_that_cars_quotes(cars):
+    registry = ServiceRegistry(FleetRepository(cars))
+    warm_quotes(registry)
+
+    registry.fleet.update(2, price_per_day=95)
+
+    assert cached_car_ids(registry.pricing) == {1, 3, 4}
+
+
+def test_changed_car_dict_is_not_served_a_stale_price(cars):
+    pricing = SmartPricing()
+    car = dict(cars[0])
+    old_price = pricing.get_car_price(car, DAY)
+
+    car['price_per_day'] *= 2
+
+    assert pricing.get_car_price(car, DAY) == pricing.get_dynamic_price(car['price_per_day'], DAY, car['category'])
+    assert pricing.get_car_price(car, DAY) != old_price
+
+
+def test_quote_table_is_keyed_on_fleet_contents(cars):
+    pricing = SmartPricing()
+    fleet = [dict(car) for car in cars]
+    table = pricing.rental_quote_table(fleet, start_date=DAY)
+    assert pricing.rental_quote_table([dict(car) for car in cars], start_date=DAY) is table
+
+    fleet[1]['price_per_day'] = 95
+
+    rebuilt = pricing.rental_quote_table(fleet, start_date=DAY)
+    assert rebuilt is not table
+    assert rebuilt.price_inputs[2] == (95, 'Sedan')
+
+
+def test_quote_rental_ignores_a_table_built_from_old_prices(cars):
+    pricing = SmartPricing()
+    fleet = [dict(car) for car in cars]
+    pricing.rental_quote_table(fleet, start_date=datetime.date.today())
+    car = dict(fleet[1], price_per_day=95)
+
+    quote = pricing.quote_rental(car, datetime.date.today(), 3, cars=fleet, fleet_version="stale")
+
+    expected = round(sum(pricing.get_dynamic_price(95, datetime.date.today() + datetime.timedelta(days=i), 'Sedan')
+                         for i in range(3)), 2)
+    assert quote['subtotal'] == expected
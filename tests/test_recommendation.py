@@ -0,0 +1,27 @@
+from ai_modules.recommendation import CarRecommendationEngine
+
+
+def test_bad_max_price_is_ignored_not_an_error(cars):
+    engine = CarRecommendationEngine(cars)
+    result = engine.get_recommendations({"category": "SUV", "max_price": "abc"})
+
+    assert [r["car"]["id"] for r in result["recommendations"]][:2] == [3, 4]
+    assert "category (SUV)" in result["explanation"]
+    assert "budget" not in result["explanation"]
+
+
+def test_bad_values_in_batch_profiles_are_ignored(cars):
+    engine = CarRecommendationEngine(cars)
+    results = engine.get_recommendations_batch([{"category": "SUV", "max_price": "abc"},
+                                                {"seats": "many"},
+                                                {"max_price": "100"}])
+
+    assert all(result["recommendations"] for result in results)
+    assert "budget (under $100/day)" in results[2]["explanation"]
+
+
+def test_batch_matches_single_requests(cars):
+    engine = CarRecommendationEngine(cars, cache_size=0)
+    profiles = [{"category": "SUV", "max_price": "180"}, {"seats": "7"}, {"transmission": "Manual"}]
+
+    assert engine.get_recommendations_batch(profiles) == [engine.get_recommendations(p) for p in profiles]
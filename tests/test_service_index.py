@@ -0,0 +1,78 @@
+from ai_modules.fleet import FleetRepository
+from ai_modules.service_index import ServicePriorityIndex
+from ai_modules.services import ServiceRegistry
+
+
+def prediction(next_service, reliability_score=90):
+    return {"next_service": next_service, "reliability_score": reliability_score, "predicted_issues": []}
+
+
+def ranked(index):
+    return [car_id for car_id, _ in index.top()]
+
+
+def test_index_orders_by_due_date_then_reliability():
+    index = ServicePriorityIndex({1: prediction("2026-05-01", 90), 2: prediction("2026-04-01", 95),
+                                  3: prediction("2026-05-01", 70)})
+
+    assert ranked(index) == [2, 3, 1]
+
+    index.update(1, prediction("2026-03-01"))
+    index.remove(2)
+
+    assert ranked(index) == [1, 3]
+
+
+def test_invalid_next_service_is_not_indexed():
+    index = ServicePriorityIndex({1: prediction("2026-05-01"), 2: prediction("2026-04-01")})
+
+    assert index.update(3, prediction(None)) is False
+    assert index.update(2, prediction("soon")) is False
+    assert ranked(index) == [1]
+
+
+def test_fleet_maintenance_updates_reorder_the_registry_index(cars):
+    fleet = FleetRepository(cars)
+    for car in cars:
+        fleet.set_maintenance(car['id'], prediction(f"2026-06-0{car['id']}"))
+    registry = ServiceRegistry(fleet)
+    assert ranked(registry.maintenance_index) == [1, 2, 3, 4]
+
+    fleet.set_maintenance(3, prediction("2026-01-01"))
+    fleet.remove(1)
+
+    assert ranked(registry.maintenance_index) == [3, 2, 4]
+
+
+def test_telematics_updates_reach_the_index_through_the_fleet(cars):
+    fleet = FleetRepository(cars)
+    registry = ServiceRegistry(fleet)
+
+    registry.telematics.ingest([{"car_id": 2, "timestamp": "2026-03-01T00:00:00Z", "odometer": 40000}])
+
+    assert registry.maintenance_index.get(2) is fleet.get_maintenance(2)
+
+
+READINGS = [{"car_id": car_id, "timestamp": f"2026-03-0{day}T08:00:00Z", "odometer": 20000 + car_id * 7000 + day * 40}
+            for day in (1, 3) for car_id in (1, 2, 3, 4)]
+
+
+def test_reingesting_the_same_readings_keeps_the_order(cars):
+    registry = ServiceRegistry(FleetRepository(cars))
+    registry.telematics.ingest(READINGS)
+    order = ranked(registry.maintenance_index)
+
+    registry.telematics.ingest(READINGS[-4:])
+
+    assert ranked(registry.maintenance_index) == order
+
+
+def test_registry_predictions_are_reproducible(cars):
+    first, second = ServiceRegistry(FleetRepository(cars)), ServiceRegistry(FleetRepository(cars))
+    first.telematics.ingest(READINGS)
+    second.telematics.ingest(READINGS)
+
+    assert first.maintenance_index.top() == second.maintenance_index.top()
+    car_data = first.telematics.vehicles[3].car_data()
+    assert (first.maintenance.generate_maintenance_prediction(cars[2], car_data=car_data)
+            == first.maintenance_index.get(3))
@@ -0,0 +1,69 @@
+import sqlite3
+import threading
+
+import pytest
+
+from ai_modules.fleet import FleetRepository
+from ai_modules.storage import SQLiteFleetStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteFleetStore(str(tmp_path / "fleet.db"), pool_size=2)
+    yield store
+    store.close()
+
+
+def test_pool_is_shared_by_worker_threads_and_closes_from_main(store, cars):
+    store.import_cars(cars)
+    counts, errors = [], []
+
+    def worker():
+        try:
+            for _ in range(10):
+                counts.append(store.count_cars())
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert counts == [len(cars)] * 200
+    assert store._idle.qsize() <= 2
+    store.close()
+    assert store._idle.qsize() == 0
+
+
+def test_pool_stays_bounded(store):
+    with store.connection() as first, store.connection() as second:
+        assert first is not second
+        assert not store._slots.acquire(blocking=False)
+    with store.connection() as again:
+        assert again in (first, second)
+
+
+def test_persist_changes_writes_cars_and_maintenance(store, cars):
+    fleet = FleetRepository(cars)
+    store.import_cars(cars)
+    store.persist_changes(fleet)
+
+    fleet.update(2, price_per_day=95)
+    fleet.remove(4)
+    fleet.set_maintenance(1, {"next_service": "2026-01-15", "reliability_score": 88,
+                              "predicted_issues": ["Tire rotation needed"]})
+
+    loaded = {car['id']: car for car in store.load_cars()}
+    assert loaded[2]['price_per_day'] == 95
+    assert 4 not in loaded
+    assert store.load_maintenance()[1] == {"next_service": "2026-01-15", "reliability_score": 88,
+                                           "predicted_issues": ["Tire rotation needed"]}
+
+
+def test_operations_after_close_raise(store):
+    store.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.count_cars()
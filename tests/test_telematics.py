@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from ai_modules.maintenance import PredictiveMaintenance
+from ai_modules.telematics import TelematicsIngestor, parse_timestamp
+
+
+@pytest.fixture
+def ingestor():
+    return TelematicsIngestor(PredictiveMaintenance(reliability_noise=0, random_issue_rate=0))
+
+
+def test_parse_timestamp_accepts_z_suffix_and_offsets():
+    assert parse_timestamp("2026-03-01T12:00:00Z") == parse_timestamp("2026-03-01T12:00:00")
+    assert parse_timestamp("2026-03-01T14:00:00+02:00") == parse_timestamp("2026-03-01T12:00:00+00:00")
+    assert parse_timestamp(1772366400) == 1772366400.0
+
+
+def test_z_suffixed_event_is_applied(ingestor):
+    refreshed = ingestor.ingest([{"car_id": 1, "timestamp": "2026-03-01T12:00:00Z", "odometer": 12000}])
+
+    assert refreshed == {1}
+    assert ingestor.rejected == 0
+    assert ingestor.vehicles[1].odometer == 12000
+
+
+def test_malformed_lines_are_skipped_and_counted(ingestor, tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text("\n".join([
+        json.dumps({"car_id": 1, "timestamp": "2026-03-01T00:00:00Z", "odometer": 1000}),
+        '{"car_id": 1, "timestamp": ',
+        "",
+        json.dumps({"car_id": 1, "timestamp": "2026-03-03T00:00:00Z", "odometer": 1100}),
+    ]), encoding="utf-8")
+
+    assert ingestor.ingest_file(str(path)) == {1}
+    assert ingestor.rejected == 1
+    assert ingestor.vehicles[1].odometer == 1100
+    assert ingestor.vehicles[1].daily_miles == pytest.approx(50)
+
+
+def test_invalid_event_leaves_state_unchanged(ingestor):
+    ingestor.ingest([{"car_id": 1, "timestamp": "2026-03-01T00:00:00Z", "odometer": 1000, "model_year": 2020}])
+
+    ingestor.ingest([{"car_id": 1, "timestamp": "2026-03-02T00:00:00Z", "model_year": 2022, "odometer": "far"}])
+
+    state = ingestor.vehicles[1]
+    assert (state.model_year, state.odometer, state.events) == (2020, 1000, 1)
+    assert ingestor.rejected == 1
+
+
+def test_part_service_only_resets_that_part(ingestor):
+    part = next(iter(ingestor.maintenance.parts_lifespan))
+    ingestor.ingest([{"car_id": 1, "timestamp": "2026-03-01T00:00:00Z", "odometer": 30000},
+                     {"car_id": 1, "timestamp": "2026-03-02T00:00:00Z", "odometer": 30050, "service": part}])
+
+    car_data = ingestor.vehicles[1].car_data()
+    assert car_data["last_service_miles"] == 0
+    assert car_data["part_service_miles"] == {part: 30050}